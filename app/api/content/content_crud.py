@@ -1,29 +1,78 @@
 """
 콘텐츠 생성 및 조회 관련 함수 모듈.
 
-이 모듈은 데이터베이스에서 콘텐츠를 생성하거나 특정 사용자와 관련된 콘텐츠를 조회하는 기능을 제공합니다.
+이 모듈은 데이터베이스에서 콘텐츠를 생성하거나 특정 사용자와 관련된 콘텐츠 및 전체 피드를 조회하거나 검색어/위치로 검색하고,
+콘텐츠를 삭제 표시하거나 좋아요를 기록하는 기능을 제공합니다.
 
 작성자:
     kimdonghyeok
 """
 
+import os
 
 import pendulum
+from dotenv import load_dotenv
 from fastapi import HTTPException
+from sqlalchemy import REAL, and_, cast, delete, func, insert, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from api.content.content_schema import ContentCreate
-from models import Content
+from api.content.geo import (
+    GEO_BACKEND,
+    geo_index,
+    location_geometry,
+    make_envelope,
+    make_point,
+)
+from api.content.like_counter import like_buffer
+from api.content.search import (
+    SEARCH_MAX_CANDIDATES,
+    build_search_query,
+    build_search_vector,
+    make_snippet,
+)
+from api.image.image_crud import (
+    MAX_CONTENT_IDS,
+    get_content_images,
+    get_user_images,
+    retain_images,
+)
+from api.user.user_schema import Principal
+from config.cache import TTLCache
+from config.pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor
+from models import (
+    Content,
+    ContentImage,
+    ContentLike,
+    Image,
+    ImageVariant,
+    User,
+    UserImage,
+)
 
+load_dotenv()
 
-def create_content(current_user: dict, db: Session, content_create: ContentCreate):
+FEED_CACHE_PAGES = int(os.environ.get("FEED_CACHE_PAGES", "3"))
+FEED_CACHE_TTL_SECONDS = float(os.environ.get("FEED_CACHE_TTL_SECONDS", "5"))
+
+# (cursor, limit, size, format) -> (피드 항목 목록, 다음 커서)
+# ("depth", cursor) -> 해당 커서가 가리키는 페이지의 깊이 (첫 페이지 0)
+feed_cache = TTLCache(maxsize=1024, ttl=FEED_CACHE_TTL_SECONDS)
+
+
+def create_content(current_user: Principal, db: Session, content_create: ContentCreate):
 
     """
-    새로운 콘텐츠를 데이터베이스에 생성합니다.
+    새로운 콘텐츠를 데이터베이스에 생성하고 첨부 이미지를 같은 트랜잭션에서 연결합니다.
+
+    첨부 이미지 ID는 한 번의 쿼리로 존재 여부를 확인하고, 콘텐츠-이미지 관계는 한 번의 일괄
+    INSERT 로 추가하므로 이미지 수와 관계없이 왕복 횟수가 일정합니다.
 
     Args:
-        current_user (dict): 현재 로그인된 사용자 정보.
+        current_user (Principal): 현재 로그인된 사용자 정보.
         db (Session): SQLAlchemy 데이터베이스 세션.
         content_create (ContentCreate): 생성할 콘텐츠의 데이터.
 
@@ -31,23 +80,61 @@ def create_content(current_user: dict, db: Session, content_create: ContentCreat
         int: 생성된 콘텐츠의 고유 ID.
 
     Raises:
-        HTTPException: 데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
+        HTTPException: 존재하지 않는 이미지 ID가 포함된 경우 400,
+            데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
     """
 
+    image_ids = list(dict.fromkeys(content_create.image_id))  # 순서를 유지한 중복 제거
     try:
+        if image_ids:
+            found_ids = {
+                row.image_id
+                for row in db.query(Image.image_id).filter(Image.image_id.in_(image_ids))
+            }
+            missing_ids = [image_id for image_id in image_ids if image_id not in found_ids]
+            if missing_ids:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"존재하지 않는 이미지입니다: {missing_ids}",
+                )
 
         db_content = Content(
             content=content_create.content,
             created_at=pendulum.now("Asia/Seoul"),
             title=content_create.title,
-            writer_name=current_user["username"],
+            writer_name=current_user.username,
             like_cnt=0,
             is_deleted=False,
+            search_vector=build_search_vector(
+                content_create.title, content_create.content
+            ),
         )
+        if content_create.latitude is not None:
+            db_content.latitude = content_create.latitude
+            db_content.longitude = content_create.longitude
+            if GEO_BACKEND == "postgis":
+                db_content.location = make_point(
+                    content_create.latitude, content_create.longitude
+                )
         db.add(db_content)
         db.flush()
 
+        if image_ids:
+            db.execute(
+                insert(ContentImage),
+                [
+                    {"content_id": db_content.contents_id, "image_id": image_id}
+                    for image_id in image_ids
+                ],
+            )
+            retain_images(db, image_ids)
+
         db.commit()
+        feed_cache.clear()  # 새 글이 피드 첫 페이지에 바로 보이도록 합니다.
+        if GEO_BACKEND == "grid" and content_create.latitude is not None:
+            geo_index.add(
+                db_content.contents_id, content_create.latitude, content_create.longitude
+            )
 
         return db_content.contents_id
 
@@ -57,33 +144,979 @@ def create_content(current_user: dict, db: Session, content_create: ContentCreat
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
-def get_user_content(db: Session, username: str):
+def get_user_content(
+    db: Session, username: str, cursor: str = None, limit: int = DEFAULT_PAGE_SIZE
+):
 
     """
-    특정 사용자가 작성한 콘텐츠 ID 목록을 조회합니다.
+    특정 사용자가 작성한 콘텐츠 ID 목록을 최신순으로 한 페이지씩 조회합니다.
+
+    (created_at, contents_id) 기준 keyset 페이지네이션을 사용하며, 삭제된 콘텐츠는 제외하고
+    필요한 컬럼만 조회합니다.
 
     Args:
         db (Session): SQLAlchemy 데이터베이스 세션.
         username (str): 조회할 사용자의 이름.
+        cursor (str, optional): 이전 페이지 응답의 `next_cursor`. 생략하면 첫 페이지를 조회합니다.
+        limit (int): 페이지 크기.
 
     Returns:
-        list: 사용자가 작성한 콘텐츠 ID의 목록.
+        tuple: (콘텐츠 ID 목록, 다음 페이지 커서 또는 마지막 페이지인 경우 None).
 
     Raises:
-        HTTPException: 데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
+        HTTPException: 커서가 잘못된 경우 400, 데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+
+    try:
+        query = db.query(Content.contents_id, Content.created_at).filter(
+            Content.writer_name == username, Content.is_deleted.is_(False)
+        )
+        if cursor:
+            created_at, contents_id = decode_cursor(cursor, 2)
+            query = query.filter(
+                tuple_(Content.created_at, Content.contents_id)
+                < tuple_(created_at, contents_id)
+            )
+        rows = (
+            query.order_by(Content.created_at.desc(), Content.contents_id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor([rows[-1].created_at, rows[-1].contents_id])
+        return [row.contents_id for row in rows], next_cursor
+    except SQLAlchemyError as e:
+        db.rollback()  # 데이터베이스 롤백
+        print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+
+def get_cached_feed(
+    cursor: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    size: str = None,
+    image_format: str = "webp",
+):
+    """
+    캐시된 피드 페이지를 조회합니다.
+
+    첫 페이지부터 `FEED_CACHE_PAGES` 개의 페이지만 캐시하며, 캐시에 없으면 None 을 반환합니다.
+    데이터베이스에 접근하지 않으므로 이벤트 루프에서 바로 호출할 수 있습니다.
+
+    Args:
+        cursor (str, optional): 이전 페이지 응답의 `next_cursor`.
+        limit (int): 페이지 크기.
+        size (str, optional): 이미지 파생본 이름.
+        image_format (str): 이미지 파생본 포맷.
+
+    Returns:
+        tuple or None: (피드 항목 목록, 다음 페이지 커서) 또는 None.
+    """
+    depth = 0 if cursor is None else feed_cache.get(("depth", cursor))
+    if depth is None or depth >= FEED_CACHE_PAGES:
+        return None
+    return feed_cache.get((cursor, limit, size, image_format))
+
+
+def _load_feed_page(db: Session, cursor, limit, size, image_format):
+    query = db.query(
+        Content.contents_id,
+        Content.title,
+        Content.content,
+        Content.writer_name,
+        Content.created_at,
+        Content.like_cnt,
+    ).filter(Content.is_deleted.is_(False))
+    if cursor:
+        created_at, contents_id = decode_cursor(cursor, 2)
+        query = query.filter(
+            tuple_(Content.created_at, Content.contents_id)
+            < tuple_(created_at, contents_id)
+        )
+    rows = (
+        query.order_by(Content.created_at.desc(), Content.contents_id.desc())
+        .limit(limit + 1)
+        .all()
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1].created_at, rows[-1].contents_id])
+
+    content_ids = [row.contents_id for row in rows]
+    writers = list({row.writer_name for row in rows if row.writer_name})
+    images = get_content_images(db, content_ids, size, image_format)
+    avatars = get_user_images(db, writers, size, image_format)
+    pending = like_buffer.pending(content_ids)
+    items = [
+        {
+            "contents_id": row.contents_id,
+            "title": row.title,
+            "content": row.content,
+            "writer_name": row.writer_name,
+            "writer_image": avatars.get(row.writer_name),
+            "created_at": row.created_at,
+            "like_cnt": max(row.like_cnt + pending[row.contents_id], 0),
+            "images": images.get(row.contents_id, []),
+        }
+        for row in rows
+    ]
+    return items, next_cursor
+
+
+def get_feed(
+    db: Session,
+    cursor: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    size: str = None,
+    image_format: str = "webp",
+):
+    """
+    삭제되지 않은 전체 콘텐츠를 최신순으로 한 페이지씩 조회합니다.
+
+    각 항목에는 첨부 이미지 주소와 작성자 이미지 주소가 포함되며, 페이지당 쿼리 수는 항목 수와
+    관계없이 일정합니다. 앞쪽 `FEED_CACHE_PAGES` 개의 페이지는 `FEED_CACHE_TTL_SECONDS` 동안
+    캐시되고, 이 워커에서 콘텐츠가 생성되면 즉시 무효화됩니다. 다른 워커의 캐시는 TTL 이 지나면
+    갱신되며, 캐시된 페이지의 좋아요 수도 그 사이에는 갱신되지 않습니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        cursor (str, optional): 이전 페이지 응답의 `next_cursor`. 생략하면 첫 페이지를 조회합니다.
+        limit (int): 페이지 크기.
+        size (str, optional): 이미지 파생본 이름. 생략하면 원본을 반환합니다.
+        image_format (str): 이미지 파생본 포맷 (webp 또는 jpeg).
+
+    Returns:
+        tuple: (피드 항목 목록, 다음 페이지 커서 또는 마지막 페이지인 경우 None).
+
+    Raises:
+        HTTPException: 커서가 잘못된 경우 400, 데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    cached = get_cached_feed(cursor, limit, size, image_format)
+    if cached is not None:
+        return cached
+
+    try:
+        page = _load_feed_page(db, cursor, limit, size, image_format)
+    except SQLAlchemyError as e:
+        db.rollback()  # 데이터베이스 롤백
+        print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+    depth = 0 if cursor is None else feed_cache.get(("depth", cursor))
+    if depth is not None and depth < FEED_CACHE_PAGES:
+        feed_cache.set((cursor, limit, size, image_format), page)
+        if page[1] is not None:
+            feed_cache.set(("depth", page[1]), depth + 1)
+    return page
+
+
+def search_contents(
+    db: Session, query: str, cursor: str = None, limit: int = DEFAULT_PAGE_SIZE
+):
+    """
+    제목과 본문에서 검색어를 포함하는 콘텐츠를 관련도순으로 한 페이지씩 조회합니다.
+
+    `search_vector` 의 GIN 인덱스로 후보를 찾고 `ts_rank_cd` 로 정렬합니다. 흔한 검색어가 많은 행과
+    일치해도 비용이 커지지 않도록, 일치하는 콘텐츠 중 최신 `SEARCH_MAX_CANDIDATES` 개만 후보로 잘라낸 뒤
+    관련도를 계산합니다. (관련도, contents_id) 기준 keyset 페이지네이션을 사용하며, 하이라이트된 본문
+    조각은 현재 페이지의 항목에 대해서만 만듭니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        query (str): 검색어.
+        cursor (str, optional): 이전 페이지 응답의 `next_cursor`. 생략하면 첫 페이지를 조회합니다.
+        limit (int): 페이지 크기.
+
+    Returns:
+        tuple: (검색 결과 목록, 다음 페이지 커서 또는 마지막 페이지인 경우 None).
+
+    Raises:
+        HTTPException: 검색어나 커서가 잘못된 경우 400, 데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    ts_query = build_search_query(query)
+    if ts_query is None:
+        raise HTTPException(status_code=400, detail="검색할 단어가 없습니다.")
+
+    try:
+        # 후보 순서가 요청마다 같아야 페이지 사이에 항목이 바뀌지 않으므로 contents_id 순으로 자릅니다.
+        candidates = (
+            db.query(Content.contents_id)
+            .filter(
+                Content.search_vector.op("@@")(ts_query), Content.is_deleted.is_(False)
+            )
+            .order_by(Content.contents_id.desc())
+            .limit(SEARCH_MAX_CANDIDATES)
+            .subquery()
+        )
+        rank = func.ts_rank_cd(Content.search_vector, ts_query)
+        search = db.query(
+            Content.contents_id,
+            Content.title,
+            Content.content,
+            Content.writer_name,
+            Content.created_at,
+            rank.label("rank"),
+        ).join(candidates, candidates.c.contents_id == Content.contents_id)
+        if cursor:
+            last_rank, last_id = decode_cursor(cursor, 2)
+            # ts_rank_cd 는 real 을 반환하므로 커서 값도 real 로 비교해야 동점 행을 건너뛰지 않습니다.
+            search = search.filter(
+                tuple_(rank, Content.contents_id)
+                < tuple_(cast(last_rank, REAL), last_id)
+            )
+        rows = (
+            search.order_by(rank.desc(), Content.contents_id.desc())
+            .limit(limit + 1)
+            .all()
+        )
+    except SQLAlchemyError as e:
+        db.rollback()  # 데이터베이스 롤백
+        print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1].rank, rows[-1].contents_id])
+    results = [
+        {
+            "contents_id": row.contents_id,
+            "title": row.title,
+            "writer_name": row.writer_name,
+            "created_at": row.created_at,
+            "rank": row.rank,
+            "snippet": make_snippet(row.content, query),
+        }
+        for row in rows
+    ]
+    return results, next_cursor
+
+
+_GEO_COLUMNS = (
+    Content.contents_id,
+    Content.title,
+    Content.writer_name,
+    Content.created_at,
+    Content.latitude,
+    Content.longitude,
+)
+
+
+def _query_postgis_page(db: Session, distance, condition, after, limit):
+    query = db.query(*_GEO_COLUMNS, distance.label("distance")).filter(
+        condition, Content.is_deleted.is_(False)
+    )
+    if after:
+        query = query.filter(tuple_(distance, Content.contents_id) > tuple_(*after))
+    return query.order_by(distance, Content.contents_id).limit(limit + 1).all()
+
+
+def _query_grid_page(db: Session, ranked, after, limit):
+    if after:
+        after = tuple(after)
+        ranked = [item for item in ranked if item > after]
+    page = []
+    start = 0
+    # 인덱스에 남아 있지만 다른 워커에서 삭제된 콘텐츠는 건너뛰고 limit + 1 개를 채웁니다.
+    while len(page) <= limit and start < len(ranked):
+        chunk = ranked[start:start + limit + 1]
+        start += len(chunk)
+        rows = {
+            row.contents_id: row
+            for row in db.query(*_GEO_COLUMNS).filter(
+                Content.contents_id.in_([content_id for _, content_id in chunk]),
+                Content.is_deleted.is_(False),
+            )
+        }
+        for distance, content_id in chunk:
+            if content_id in rows:
+                page.append((rows[content_id], distance))
+    return page[:limit + 1]
+
+
+def _geo_results(page, limit):
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        last_row, last_distance = page[-1]
+        next_cursor = encode_cursor([last_distance, last_row.contents_id])
+    results = [
+        {
+            "contents_id": row.contents_id,
+            "title": row.title,
+            "writer_name": row.writer_name,
+            "created_at": row.created_at,
+            "latitude": row.latitude,
+            "longitude": row.longitude,
+            "distance_m": round(distance, 1),
+        }
+        for row, distance in page
+    ]
+    return results, next_cursor
+
+
+def get_nearby_contents(
+    db: Session,
+    latitude: float,
+    longitude: float,
+    radius_m: float,
+    cursor: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+):
     """
+    지점에서 반경 안에 있는 콘텐츠를 가까운 순으로 한 페이지씩 조회합니다.
 
+    PostGIS 백엔드는 `ST_DWithin` 으로 GiST 인덱스를 사용하므로 전체 콘텐츠 수와 관계없이 반경 안의
+    콘텐츠만 확인합니다. (거리, contents_id) 기준 keyset 페이지네이션을 사용합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        latitude (float): 중심 위도.
+        longitude (float): 중심 경도.
+        radius_m (float): 반경(미터).
+        cursor (str, optional): 이전 페이지 응답의 `next_cursor`. 생략하면 첫 페이지를 조회합니다.
+        limit (int): 페이지 크기.
+
+    Returns:
+        tuple: (콘텐츠 목록(거리 포함), 다음 페이지 커서 또는 마지막 페이지인 경우 None).
+
+    Raises:
+        HTTPException: 커서가 잘못된 경우 400, 데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    after = decode_cursor(cursor, 2) if cursor else None
+    try:
+        if GEO_BACKEND == "grid":
+            ranked = geo_index.within_radius(latitude, longitude, radius_m)
+            page = _query_grid_page(db, ranked, after, limit)
+        else:
+            point = make_point(latitude, longitude)
+            distance = func.ST_Distance(Content.location, point, False)
+            rows = _query_postgis_page(
+                db,
+                distance,
+                func.ST_DWithin(Content.location, point, radius_m, False),
+                after,
+                limit,
+            )
+            page = [(row, row.distance) for row in rows]
+    except SQLAlchemyError as e:
+        db.rollback()  # 데이터베이스 롤백
+        print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+    return _geo_results(page, limit)
+
+
+def get_contents_in_bbox(
+    db: Session,
+    min_lat: float,
+    min_lon: float,
+    max_lat: float,
+    max_lon: float,
+    cursor: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+):
+    """
+    위도/경도 범위(지도 화면) 안의 콘텐츠를 범위 중심에서 가까운 순으로 한 페이지씩 조회합니다.
+
+    PostGIS 백엔드는 geometry 로 변환한 위치와 경도/위도 사각형을 `&&` 연산자로 비교해 GiST 식 인덱스로
+    후보를 찾은 뒤 위도/경도 범위로 거릅니다. 평면 사각형이므로 후보는 위도/경도 조건을 만족하는 행을 모두
+    포함합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        min_lat (float): 최소 위도.
+        min_lon (float): 최소 경도.
+        max_lat (float): 최대 위도.
+        max_lon (float): 최대 경도.
+        cursor (str, optional): 이전 페이지 응답의 `next_cursor`. 생략하면 첫 페이지를 조회합니다.
+        limit (int): 페이지 크기.
+
+    Returns:
+        tuple: (콘텐츠 목록(중심까지 거리 포함), 다음 페이지 커서 또는 마지막 페이지인 경우 None).
+
+    Raises:
+        HTTPException: 커서가 잘못된 경우 400, 데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    after = decode_cursor(cursor, 2) if cursor else None
     try:
+        if GEO_BACKEND == "grid":
+            ranked = geo_index.within_bbox(min_lat, min_lon, max_lat, max_lon)
+            page = _query_grid_page(db, ranked, after, limit)
+        else:
+            center = make_point((min_lat + max_lat) / 2, (min_lon + max_lon) / 2)
+            distance = func.ST_Distance(Content.location, center, False)
+            condition = and_(
+                location_geometry().op("&&")(
+                    make_envelope(min_lat, min_lon, max_lat, max_lon)
+                ),
+                Content.latitude.between(min_lat, max_lat),
+                Content.longitude.between(min_lon, max_lon),
+            )
+            rows = _query_postgis_page(db, distance, condition, after, limit)
+            page = [(row, row.distance) for row in rows]
+    except SQLAlchemyError as e:
+        db.rollback()  # 데이터베이스 롤백
+        print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+    return _geo_results(page, limit)
+
+
+def get_content_details(
+    db: Session, content_ids: list, size: str = None, image_format: str = "webp"
+):
+    """
+    여러 콘텐츠를 첨부 이미지, 작성자 이미지와 함께 조회합니다.
 
-        contents_list = [
-            content.contents_id
-            for content in db.query(Content)
-            .filter(Content.writer_name == username)
+    콘텐츠와 작성자/작성자 이미지는 조인으로, 첨부 이미지는 `selectinload` 로 불러오므로 콘텐츠 수와
+    관계없이 SQL 두 번으로 끝납니다. `size` 를 지정하면 파생본 주소를 한 번 더 조회합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        content_ids (list): 조회할 콘텐츠 ID 목록 (최대 `MAX_CONTENT_IDS` 개).
+        size (str, optional): 이미지 파생본 이름. 생략하면 원본을 반환합니다.
+        image_format (str): 이미지 파생본 포맷 (webp 또는 jpeg).
+
+    Returns:
+        dict: 콘텐츠 ID -> 콘텐츠 상세 정보. 없거나 삭제된 콘텐츠는 포함되지 않습니다.
+
+    Raises:
+        HTTPException: ID 개수가 제한을 넘으면 400, 데이터베이스 작업 중 오류가 발생하면 500 상태 코드 반환.
+    """
+    if len(content_ids) > MAX_CONTENT_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"content_ids는 최대 {MAX_CONTENT_IDS}개까지 조회할 수 있습니다.",
+        )
+    if not content_ids:
+        return {}
+    try:
+        contents = (
+            db.query(Content)
+            .options(
+                joinedload(Content.writer)
+                .joinedload(User.user_image)
+                .joinedload(UserImage.image),
+                selectinload(Content.images),
+            )
+            .filter(
+                Content.contents_id.in_(set(content_ids)),
+                Content.is_deleted.is_(False),
+            )
             .all()
-        ]
+        )
+
+        variants = {}
+        if size is not None and contents:
+            image_ids = {image.image_id for content in contents for image in content.images}
+            image_ids.update(
+                content.writer.user_image.image_id
+                for content in contents
+                if content.writer is not None and content.writer.user_image is not None
+            )
+            if image_ids:
+                variants = dict(
+                    db.query(ImageVariant.image_id, ImageVariant.image_address).filter(
+                        ImageVariant.image_id.in_(image_ids),
+                        ImageVariant.variant == size,
+                        ImageVariant.format == image_format,
+                    )
+                )
+    except SQLAlchemyError as e:
+        db.rollback()  # 데이터베이스 롤백
+        print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+    def address(image):
+        # 요청한 파생본이 없으면 원본 주소를 반환합니다.
+        return variants.get(image.image_id, image.image_address)
+
+    pending = like_buffer.pending([content.contents_id for content in contents])
+    details = {}
+    for content in contents:
+        user_image = content.writer.user_image if content.writer is not None else None
+        details[content.contents_id] = {
+            "contents_id": content.contents_id,
+            "title": content.title,
+            "content": content.content,
+            "writer_name": content.writer_name,
+            "writer_image": address(user_image.image) if user_image is not None else None,
+            "created_at": content.created_at,
+            "like_cnt": max(content.like_cnt + pending[content.contents_id], 0),
+            "latitude": content.latitude,
+            "longitude": content.longitude,
+            "images": [address(image) for image in content.images],
+        }
+    return details
+
+
+def get_content_detail(
+    db: Session, content_id: int, size: str = None, image_format: str = "webp"
+):
+    """
+    콘텐츠 하나를 첨부 이미지, 작성자 이미지와 함께 조회합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        content_id (int): 조회할 콘텐츠 ID.
+        size (str, optional): 이미지 파생본 이름. 생략하면 원본을 반환합니다.
+        image_format (str): 이미지 파생본 포맷 (webp 또는 jpeg).
+
+    Returns:
+        dict: 콘텐츠 상세 정보.
+
+    Raises:
+        HTTPException: 콘텐츠가 없거나 삭제된 경우 404, 데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    details = get_content_details(db, [content_id], size, image_format)
+    if content_id not in details:
+        raise HTTPException(status_code=404, detail="존재하지 않는 콘텐츠입니다.")
+    return details[content_id]
+
+
+def delete_content(db: Session, content_id: int, username: str):
+    """
+    콘텐츠를 삭제 표시합니다.
+
+    행은 `is_deleted` 와 `deleted_at` 만 갱신되어 조회용 부분 인덱스에서 빠지고, 첨부 이미지 관계와
+    파일은 보관 기간이 지난 뒤 `purge_deleted_contents` 가 일괄로 정리합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        content_id (int): 삭제할 콘텐츠 ID.
+        username (str): 요청한 사용자 이름. 작성자만 삭제할 수 있습니다.
+
+    Raises:
+        HTTPException: 콘텐츠가 없거나 이미 삭제된 경우 404, 작성자가 아닌 경우 403,
+            데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    try:
+        writer_name = (
+            db.query(Content.writer_name)
+            .filter(Content.contents_id == content_id, Content.is_deleted.is_(False))
+            .scalar()
+        )
+        if writer_name is None:
+            raise HTTPException(status_code=404, detail="존재하지 않는 콘텐츠입니다.")
+        if writer_name != username:
+            raise HTTPException(status_code=403, detail="콘텐츠를 삭제할 권한이 없습니다.")
+
+        result = db.execute(
+            update(Content)
+            .where(Content.contents_id == content_id, Content.is_deleted.is_(False))
+            .values(is_deleted=True, deleted_at=pendulum.now("Asia/Seoul"))
+        )
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()  # 데이터베이스 롤백
+        print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+    if result.rowcount == 0:
+        # 동시에 들어온 다른 삭제 요청이 먼저 반영되었습니다.
+        raise HTTPException(status_code=404, detail="존재하지 않는 콘텐츠입니다.")
+    feed_cache.clear()  # 삭제된 글이 캐시된 피드에 남지 않도록 합니다.
+    if GEO_BACKEND == "grid":
+        geo_index.remove(content_id)
+
+
+def _ensure_content_exists(db: Session, content_id: int):
+    exists = (
+        db.query(Content.contents_id)
+        .filter(Content.contents_id == content_id, Content.is_deleted.is_(False))
+        .first()
+    )
+    if exists is None:
+        raise HTTPException(status_code=404, detail="존재하지 않는 콘텐츠입니다.")
+
 
-        return contents_list
+def like_content(db: Session, content_id: int, user_id: int):
+    """
+    콘텐츠에 좋아요를 기록합니다.
+
+    `INSERT ... ON CONFLICT DO NOTHING` 으로 같은 사용자의 중복 요청은 무시하며, 새로 기록된 경우에만
+    좋아요 수 증감량 버퍼에 +1 을 더합니다. `Contents.like_cnt` 는 요청 중에 갱신하지 않습니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        content_id (int): 콘텐츠 ID.
+        user_id (int): 사용자 ID.
+
+    Returns:
+        bool: 새로 좋아요가 기록되었는지 여부.
+
+    Raises:
+        HTTPException: 콘텐츠가 없거나 삭제된 경우 404, 데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    try:
+        _ensure_content_exists(db, content_id)
+        result = db.execute(
+            pg_insert(ContentLike)
+            .values(
+                content_id=content_id,
+                user_id=user_id,
+                created_at=pendulum.now("Asia/Seoul"),
+            )
+            .on_conflict_do_nothing(constraint="uq_contents_likes_content_user")
+        )
+        db.commit()
+        created = result.rowcount == 1
+        if created:
+            like_buffer.add(content_id, 1)
+        return created
+    except SQLAlchemyError as e:
+        db.rollback()  # 데이터베이스 롤백
+        print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+
+def unlike_content(db: Session, content_id: int, user_id: int):
+    """
+    콘텐츠의 좋아요를 취소합니다.
+
+    실제로 삭제된 경우에만 좋아요 수 증감량 버퍼에 -1 을 더하므로, 중복 요청은 무시됩니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        content_id (int): 콘텐츠 ID.
+        user_id (int): 사용자 ID.
+
+    Returns:
+        bool: 좋아요가 취소되었는지 여부.
+
+    Raises:
+        HTTPException: 콘텐츠가 없거나 삭제된 경우 404, 데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    try:
+        _ensure_content_exists(db, content_id)
+        result = db.execute(
+            delete(ContentLike).where(
+                ContentLike.content_id == content_id, ContentLike.user_id == user_id
+            )
+        )
+        db.commit()
+        removed = result.rowcount == 1
+        if removed:
+            like_buffer.add(content_id, -1)
+        return removed
+    except SQLAlchemyError as e:
+        db.rollback()  # 데이터베이스 롤백
+        print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+
+def get_like_counts(db: Session, content_ids):
+    """
+    콘텐츠들의 좋아요 수를 조회합니다.
+
+    저장된 `like_cnt` 에 아직 반영되지 않은 이 워커의 증감량을 더해 반환합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        content_ids (List[int]): 콘텐츠 ID 목록.
+
+    Returns:
+        dict: 콘텐츠 ID -> 좋아요 수. 없거나 삭제된 콘텐츠는 포함되지 않습니다.
+
+    Raises:
+        HTTPException: 데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    if not content_ids:
+        return {}
+    try:
+        rows = db.query(Content.contents_id, Content.like_cnt).filter(
+            Content.contents_id.in_(content_ids), Content.is_deleted.is_(False)
+        )
+        persisted = {row.contents_id: row.like_cnt for row in rows}
+        pending = like_buffer.pending(persisted)
+        return {
+            content_id: max(like_cnt + pending[content_id], 0)
+            for content_id, like_cnt in persisted.items()
+        }
+    except SQLAlchemyError as e:
+        db.rollback()  # 데이터베이스 롤백
+        print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+
+def get_like_status(db: Session, content_id: int, user_id: int):
+    """
+    콘텐츠의 좋아요 수와 사용자의 좋아요 여부를 조회합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        content_id (int): 콘텐츠 ID.
+        user_id (int): 사용자 ID.
+
+    Returns:
+        dict: `like_cnt` (좋아요 수)와 `liked` (사용자의 좋아요 여부).
+
+    Raises:
+        HTTPException: 콘텐츠가 없거나 삭제된 경우 404, 데이터베이스 작업 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    like_counts = get_like_counts(db, [content_id])
+    if content_id not in like_counts:
+        raise HTTPException(status_code=404, detail="존재하지 않는 콘텐츠입니다.")
+    try:
+        liked = (
+            db.query(ContentLike.id)
+            .filter(ContentLike.content_id == content_id, ContentLike.user_id == user_id)
+            .first()
+            is not None
+        )
     except SQLAlchemyError as e:
         db.rollback()  # 데이터베이스 롤백
         print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
         raise HTTPException(status_code=500, detail="Internal Server Error")
+    return {"like_cnt": like_counts[content_id], "liked": liked}
+
+
+async def create_content_async(
+    current_user: Principal, db: AsyncSession, content_create: ContentCreate
+):
+    """
+    `create_content` 의 AsyncSession 버전입니다.
+
+    동기 구현을 `AsyncSession.run_sync` 로 실행하므로 DB I/O 동안 이벤트 루프를 막지 않습니다.
+
+    Args:
+        current_user (Principal): 현재 로그인된 사용자 정보.
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        content_create (ContentCreate): 생성할 콘텐츠의 데이터.
+
+    Returns:
+        int: 생성된 콘텐츠의 고유 ID.
+    """
+    return await db.run_sync(
+        lambda session: create_content(current_user, session, content_create)
+    )
+
+
+async def get_user_content_async(
+    db: AsyncSession, username: str, cursor: str = None, limit: int = DEFAULT_PAGE_SIZE
+):
+    """
+    `get_user_content` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        username (str): 조회할 사용자의 이름.
+        cursor (str, optional): 이전 페이지 응답의 `next_cursor`.
+        limit (int): 페이지 크기.
+
+    Returns:
+        tuple: (콘텐츠 ID 목록, 다음 페이지 커서).
+    """
+    return await db.run_sync(
+        lambda session: get_user_content(session, username, cursor, limit)
+    )
+
+
+async def delete_content_async(db: AsyncSession, content_id: int, username: str):
+    """
+    `delete_content` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        content_id (int): 삭제할 콘텐츠 ID.
+        username (str): 요청한 사용자 이름.
+    """
+    await db.run_sync(lambda session: delete_content(session, content_id, username))
+
+
+async def like_content_async(db: AsyncSession, content_id: int, user_id: int):
+    """
+    `like_content` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        content_id (int): 콘텐츠 ID.
+        user_id (int): 사용자 ID.
+
+    Returns:
+        bool: 새로 좋아요가 기록되었는지 여부.
+    """
+    return await db.run_sync(lambda session: like_content(session, content_id, user_id))
+
+
+async def unlike_content_async(db: AsyncSession, content_id: int, user_id: int):
+    """
+    `unlike_content` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        content_id (int): 콘텐츠 ID.
+        user_id (int): 사용자 ID.
+
+    Returns:
+        bool: 좋아요가 취소되었는지 여부.
+    """
+    return await db.run_sync(
+        lambda session: unlike_content(session, content_id, user_id)
+    )
+
+
+async def get_like_status_async(db: AsyncSession, content_id: int, user_id: int):
+    """
+    `get_like_status` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        content_id (int): 콘텐츠 ID.
+        user_id (int): 사용자 ID.
+
+    Returns:
+        dict: `like_cnt` 와 `liked`.
+    """
+    return await db.run_sync(
+        lambda session: get_like_status(session, content_id, user_id)
+    )
+
+
+async def get_feed_async(
+    db: AsyncSession,
+    cursor: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    size: str = None,
+    image_format: str = "webp",
+):
+    """
+    `get_feed` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        cursor (str, optional): 이전 페이지 응답의 `next_cursor`.
+        limit (int): 페이지 크기.
+        size (str, optional): 이미지 파생본 이름.
+        image_format (str): 이미지 파생본 포맷.
+
+    Returns:
+        tuple: (피드 항목 목록, 다음 페이지 커서).
+    """
+    return await db.run_sync(
+        lambda session: get_feed(session, cursor, limit, size, image_format)
+    )
+
+
+async def search_contents_async(
+    db: AsyncSession, query: str, cursor: str = None, limit: int = DEFAULT_PAGE_SIZE
+):
+    """
+    `search_contents` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        query (str): 검색어.
+        cursor (str, optional): 이전 페이지 응답의 `next_cursor`.
+        limit (int): 페이지 크기.
+
+    Returns:
+        tuple: (검색 결과 목록, 다음 페이지 커서).
+    """
+    return await db.run_sync(
+        lambda session: search_contents(session, query, cursor, limit)
+    )
+
+
+async def get_nearby_contents_async(
+    db: AsyncSession,
+    latitude: float,
+    longitude: float,
+    radius_m: float,
+    cursor: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+):
+    """
+    `get_nearby_contents` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        latitude (float): 중심 위도.
+        longitude (float): 중심 경도.
+        radius_m (float): 반경(미터).
+        cursor (str, optional): 이전 페이지 응답의 `next_cursor`.
+        limit (int): 페이지 크기.
+
+    Returns:
+        tuple: (콘텐츠 목록, 다음 페이지 커서).
+    """
+    return await db.run_sync(
+        lambda session: get_nearby_contents(
+            session, latitude, longitude, radius_m, cursor, limit
+        )
+    )
+
+
+async def get_contents_in_bbox_async(
+    db: AsyncSession,
+    min_lat: float,
+    min_lon: float,
+    max_lat: float,
+    max_lon: float,
+    cursor: str = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+):
+    """
+    `get_contents_in_bbox` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        min_lat (float): 최소 위도.
+        min_lon (float): 최소 경도.
+        max_lat (float): 최대 위도.
+        max_lon (float): 최대 경도.
+        cursor (str, optional): 이전 페이지 응답의 `next_cursor`.
+        limit (int): 페이지 크기.
+
+    Returns:
+        tuple: (콘텐츠 목록, 다음 페이지 커서).
+    """
+    return await db.run_sync(
+        lambda session: get_contents_in_bbox(
+            session, min_lat, min_lon, max_lat, max_lon, cursor, limit
+        )
+    )
+
+
+async def get_content_details_async(
+    db: AsyncSession, content_ids: list, size: str = None, image_format: str = "webp"
+):
+    """
+    `get_content_details` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        content_ids (list): 조회할 콘텐츠 ID 목록.
+        size (str, optional): 이미지 파생본 이름.
+        image_format (str): 이미지 파생본 포맷.
+
+    Returns:
+        dict: 콘텐츠 ID -> 콘텐츠 상세 정보.
+    """
+    return await db.run_sync(
+        lambda session: get_content_details(session, content_ids, size, image_format)
+    )
+
+
+async def get_content_detail_async(
+    db: AsyncSession, content_id: int, size: str = None, image_format: str = "webp"
+):
+    """
+    `get_content_detail` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        content_id (int): 조회할 콘텐츠 ID.
+        size (str, optional): 이미지 파생본 이름.
+        image_format (str): 이미지 파생본 포맷.
+
+    Returns:
+        dict: 콘텐츠 상세 정보.
+    """
+    return await db.run_sync(
+        lambda session: get_content_detail(session, content_id, size, image_format)
+    )
@@ -1,24 +1,33 @@
 """
 콘텐츠 API 라우터 모듈.
 
-이 모듈은 콘텐츠 생성 및 조회와 관련된 엔드포인트를 제공합니다.
+이 모듈은 콘텐츠 생성, 조회(상세 포함), 삭제, 피드, 검색, 위치 검색 및 좋아요와 관련된 엔드포인트를 제공합니다.
 
 작성자:
     kimdonghyeok
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from starlette import status
 
 from api.content import content_crud
 from api.content.content_schema import ContentCreate
+from api.content.geo import GEO_MAX_BBOX_SPAN_DEGREES, GEO_MAX_RADIUS_M
+from api.image.image_router import VARIANT_FORMAT_PATTERN, VARIANT_SIZE_PATTERN
 from api.user.user_router import get_current_user
-from config.database_init import get_db
+from api.user.user_schema import Principal
+from config.database_init import DB_ASYNC, get_db, get_route_db
+from config.fast_json import ROUTE_CLASS
+from config.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
 
 router = APIRouter(
     prefix="/api/content",
+    route_class=ROUTE_CLASS,
 )
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/user/token")
 
@@ -26,16 +35,16 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/user/token")
 @router.post("/create")
 async def content_create(
     content_create: ContentCreate,
-    db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_route_db),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     새로운 콘텐츠를 생성합니다.
 
     Args:
         content_create (ContentCreate): 생성할 콘텐츠의 데이터.
-        db (Session): SQLAlchemy 데이터베이스 세션.
-        current_user (dict): 현재 로그인된 사용자 정보.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
+        current_user (Principal): 현재 로그인된 사용자 정보.
 
     Returns:
         dict: 생성된 콘텐츠 ID와 상태 정보를 포함하는 응답.
@@ -44,9 +53,17 @@ async def content_create(
         HTTPException: 콘텐츠 생성 중 오류가 발생한 경우.
     """
     try:
-        contents_id = content_crud.create_content(
-            current_user, db=db, content_create=content_create
-        )
+        if DB_ASYNC:
+            contents_id = await content_crud.create_content_async(
+                current_user, db=db, content_create=content_create
+            )
+        else:
+            contents_id = await run_in_threadpool(
+                content_crud.create_content,
+                current_user,
+                db=db,
+                content_create=content_create,
+            )
 
         return {
             "status_code": status.HTTP_200_OK,
@@ -59,28 +76,465 @@ async def content_create(
 
 @router.get("/mycontent")
 def content_refresh(
-    current_user: dict = Depends(get_current_user), db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
     """
-    현재 사용자가 생성한 콘텐츠 ID 목록을 조회합니다.
+    현재 사용자가 생성한 콘텐츠 ID 목록을 최신순으로 한 페이지씩 조회합니다.
 
     Args:
-        current_user (dict): 현재 로그인된 사용자 정보.
+        cursor (str, optional): 이전 응답의 `next_cursor`. 생략하면 첫 페이지를 조회합니다.
+        limit (int): 페이지 크기 (최대 `MAX_PAGE_SIZE`).
+        current_user (Principal): 현재 로그인된 사용자 정보.
         db (Session): SQLAlchemy 데이터베이스 세션.
 
     Returns:
-        dict: 사용자가 생성한 콘텐츠 ID 목록과 상태 정보를 포함하는 응답.
+        dict: 콘텐츠 ID 목록, 다음 페이지 커서(마지막 페이지면 None)와 상태 정보를 포함하는 응답.
 
     Raises:
         HTTPException: 콘텐츠 조회 중 오류가 발생한 경우.
     """
     try:
-        content_list = content_crud.get_user_content(db, current_user["username"])
-        print(content_list)
+        content_list, next_cursor = content_crud.get_user_content(
+            db, current_user.username, cursor=cursor, limit=limit
+        )
         return {
             "status_code": status.HTTP_200_OK,
             "detail": "정상적으로 저장되었습니다.",
-            "data": {"content_ids": content_list},
+            "data": {"content_ids": content_list, "next_cursor": next_cursor},
         }
     except HTTPException as e:
         raise e
+
+
+@router.get("/feed")
+async def content_feed(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    size: Optional[str] = Query(None, regex=VARIANT_SIZE_PATTERN),
+    image_format: str = Query("webp", alias="format", regex=VARIANT_FORMAT_PATTERN),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_route_db),
+):
+    """
+    전체 사용자의 최신 콘텐츠를 첨부 이미지, 작성자 이미지와 함께 한 페이지씩 조회합니다.
+
+    앞쪽 페이지는 메모리 캐시에서 바로 응답하며, 캐시에 없을 때만 데이터베이스를 조회합니다.
+
+    Args:
+        cursor (str, optional): 이전 응답의 `next_cursor`. 생략하면 첫 페이지를 조회합니다.
+        limit (int): 페이지 크기 (최대 `MAX_PAGE_SIZE`).
+        size (str, optional): 이미지 파생본 이름 (avatar, thumb, medium). 생략하면 원본을 반환합니다.
+        image_format (str): 이미지 파생본 포맷 (webp, jpeg).
+        current_user (Principal): 현재 로그인된 사용자 정보.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
+
+    Returns:
+        dict: 피드 항목 목록, 다음 페이지 커서(마지막 페이지면 None)와 상태 정보를 포함하는 응답.
+
+    Raises:
+        HTTPException: 커서가 잘못된 경우 400, 조회 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    page = content_crud.get_cached_feed(cursor, limit, size, image_format)
+    if page is None:
+        if DB_ASYNC:
+            page = await content_crud.get_feed_async(
+                db, cursor, limit, size, image_format
+            )
+        else:
+            page = await run_in_threadpool(
+                content_crud.get_feed, db, cursor, limit, size, image_format
+            )
+    items, next_cursor = page
+    return {
+        "status_code": status.HTTP_200_OK,
+        "detail": "정상적으로 조회되었습니다.",
+        "data": {"contents": items, "next_cursor": next_cursor},
+    }
+
+
+@router.get("/search")
+async def content_search(
+    q: str = Query(..., min_length=1, max_length=200),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_route_db),
+):
+    """
+    제목과 본문에서 검색어를 포함하는 콘텐츠를 관련도순으로 한 페이지씩 검색합니다.
+
+    Args:
+        q (str): 검색어 (최대 200자).
+        cursor (str, optional): 이전 응답의 `next_cursor`. 생략하면 첫 페이지를 조회합니다.
+        limit (int): 페이지 크기 (최대 `MAX_PAGE_SIZE`).
+        current_user (Principal): 현재 로그인된 사용자 정보.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
+
+    Returns:
+        dict: 검색 결과(하이라이트된 본문 조각 포함), 다음 페이지 커서와 상태 정보를 포함하는 응답.
+
+    Raises:
+        HTTPException: 검색어나 커서가 잘못된 경우 400, 조회 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    if DB_ASYNC:
+        results, next_cursor = await content_crud.search_contents_async(
+            db, q, cursor=cursor, limit=limit
+        )
+    else:
+        results, next_cursor = await run_in_threadpool(
+            content_crud.search_contents, db, q, cursor=cursor, limit=limit
+        )
+    return {
+        "status_code": status.HTTP_200_OK,
+        "detail": "정상적으로 조회되었습니다.",
+        "data": {"contents": results, "next_cursor": next_cursor},
+    }
+
+
+@router.get("/nearby")
+async def content_nearby(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius: float = Query(1000, gt=0, le=GEO_MAX_RADIUS_M),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_route_db),
+):
+    """
+    지점에서 반경 안에 있는 콘텐츠를 가까운 순으로 한 페이지씩 조회합니다.
+
+    Args:
+        lat (float): 중심 위도.
+        lon (float): 중심 경도.
+        radius (float): 반경(미터, 최대 `GEO_MAX_RADIUS_M`).
+        cursor (str, optional): 이전 응답의 `next_cursor`. 생략하면 첫 페이지를 조회합니다.
+        limit (int): 페이지 크기 (최대 `MAX_PAGE_SIZE`).
+        current_user (Principal): 현재 로그인된 사용자 정보.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
+
+    Returns:
+        dict: 콘텐츠 목록(거리 포함), 다음 페이지 커서와 상태 정보를 포함하는 응답.
+
+    Raises:
+        HTTPException: 커서가 잘못된 경우 400, 조회 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    if DB_ASYNC:
+        results, next_cursor = await content_crud.get_nearby_contents_async(
+            db, lat, lon, radius, cursor=cursor, limit=limit
+        )
+    else:
+        results, next_cursor = await run_in_threadpool(
+            content_crud.get_nearby_contents,
+            db,
+            lat,
+            lon,
+            radius,
+            cursor=cursor,
+            limit=limit,
+        )
+    return {
+        "status_code": status.HTTP_200_OK,
+        "detail": "정상적으로 조회되었습니다.",
+        "data": {"contents": results, "next_cursor": next_cursor},
+    }
+
+
+@router.get("/bbox")
+async def content_bbox(
+    min_lat: float = Query(..., ge=-90, le=90),
+    min_lon: float = Query(..., ge=-180, le=180),
+    max_lat: float = Query(..., ge=-90, le=90),
+    max_lon: float = Query(..., ge=-180, le=180),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_route_db),
+):
+    """
+    위도/경도 범위(지도 화면) 안의 콘텐츠를 범위 중심에서 가까운 순으로 한 페이지씩 조회합니다.
+
+    Args:
+        min_lat (float): 최소 위도.
+        min_lon (float): 최소 경도.
+        max_lat (float): 최대 위도.
+        max_lon (float): 최대 경도.
+        cursor (str, optional): 이전 응답의 `next_cursor`. 생략하면 첫 페이지를 조회합니다.
+        limit (int): 페이지 크기 (최대 `MAX_PAGE_SIZE`).
+        current_user (Principal): 현재 로그인된 사용자 정보.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
+
+    Returns:
+        dict: 콘텐츠 목록(중심까지 거리 포함), 다음 페이지 커서와 상태 정보를 포함하는 응답.
+
+    Raises:
+        HTTPException: 범위나 커서가 잘못된 경우 400, 범위의 폭이 `GEO_MAX_BBOX_SPAN_DEGREES` 를 넘으면
+            422, 조회 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    if min_lat > max_lat or min_lon > max_lon:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="최솟값이 최댓값보다 클 수 없습니다.",
+        )
+    if (
+        max_lat - min_lat > GEO_MAX_BBOX_SPAN_DEGREES
+        or max_lon - min_lon > GEO_MAX_BBOX_SPAN_DEGREES
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"위도/경도 범위의 폭은 {GEO_MAX_BBOX_SPAN_DEGREES}도를 넘을 수 없습니다.",
+        )
+    if DB_ASYNC:
+        results, next_cursor = await content_crud.get_contents_in_bbox_async(
+            db, min_lat, min_lon, max_lat, max_lon, cursor=cursor, limit=limit
+        )
+    else:
+        results, next_cursor = await run_in_threadpool(
+            content_crud.get_contents_in_bbox,
+            db,
+            min_lat,
+            min_lon,
+            max_lat,
+            max_lon,
+            cursor=cursor,
+            limit=limit,
+        )
+    return {
+        "status_code": status.HTTP_200_OK,
+        "detail": "정상적으로 조회되었습니다.",
+        "data": {"contents": results, "next_cursor": next_cursor},
+    }
+
+
+@router.get("/detail")
+async def content_details(
+    ids: List[int] = Query(...),
+    size: Optional[str] = Query(None, regex=VARIANT_SIZE_PATTERN),
+    image_format: str = Query("webp", alias="format", regex=VARIANT_FORMAT_PATTERN),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_route_db),
+):
+    """
+    여러 콘텐츠를 첨부 이미지, 작성자 이미지와 함께 조회합니다.
+
+    Args:
+        ids (List[int]): 조회할 콘텐츠 ID 목록 (`?ids=1&ids=2`, 최대 `MAX_CONTENT_IDS` 개).
+        size (str, optional): 이미지 파생본 이름 (avatar, thumb, medium). 생략하면 원본을 반환합니다.
+        image_format (str): 이미지 파생본 포맷 (webp, jpeg).
+        current_user (Principal): 현재 로그인된 사용자 정보.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
+
+    Returns:
+        dict: 콘텐츠 ID -> 콘텐츠 상세 정보와 상태 정보를 포함하는 응답. 없거나 삭제된 콘텐츠는 제외됩니다.
+
+    Raises:
+        HTTPException: ID 개수가 제한을 넘으면 400, 조회 중 오류가 발생한 경우 500 상태 코드 반환.
+    """
+    if DB_ASYNC:
+        details = await content_crud.get_content_details_async(
+            db, ids, size, image_format
+        )
+    else:
+        details = await run_in_threadpool(
+            content_crud.get_content_details, db, ids, size, image_format
+        )
+    return {
+        "status_code": status.HTTP_200_OK,
+        "detail": "정상적으로 조회되었습니다.",
+        "data": details,
+    }
+
+
+@router.post("/{content_id}/like")
+async def content_like(
+    content_id: int,
+    db: Session = Depends(get_route_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """
+    콘텐츠에 좋아요를 누릅니다. 이미 누른 경우에도 성공으로 응답합니다.
+
+    좋아요 수는 요청 중에 갱신하지 않고 주기적으로 일괄 반영되며, 조회 시 반영 전 증감량이 더해집니다.
+
+    Args:
+        content_id (int): 콘텐츠 ID.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
+        current_user (Principal): 현재 로그인된 사용자 정보.
+
+    Returns:
+        dict: 새로 기록되었는지 여부(`created`)와 상태 정보를 포함하는 응답.
+
+    Raises:
+        HTTPException: 콘텐츠가 없거나 삭제된 경우 404 상태 코드 반환.
+    """
+    if DB_ASYNC:
+        created = await content_crud.like_content_async(
+            db, content_id=content_id, user_id=current_user.uid
+        )
+    else:
+        created = await run_in_threadpool(
+            content_crud.like_content,
+            db,
+            content_id=content_id,
+            user_id=current_user.uid,
+        )
+    return {
+        "status_code": status.HTTP_200_OK,
+        "detail": "좋아요를 눌렀습니다.",
+        "data": {"content_id": content_id, "created": created},
+    }
+
+
+@router.delete("/{content_id}/like")
+async def content_unlike(
+    content_id: int,
+    db: Session = Depends(get_route_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """
+    콘텐츠의 좋아요를 취소합니다. 누르지 않은 경우에도 성공으로 응답합니다.
+
+    Args:
+        content_id (int): 콘텐츠 ID.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
+        current_user (Principal): 현재 로그인된 사용자 정보.
+
+    Returns:
+        dict: 실제로 취소되었는지 여부(`removed`)와 상태 정보를 포함하는 응답.
+
+    Raises:
+        HTTPException: 콘텐츠가 없거나 삭제된 경우 404 상태 코드 반환.
+    """
+    if DB_ASYNC:
+        removed = await content_crud.unlike_content_async(
+            db, content_id=content_id, user_id=current_user.uid
+        )
+    else:
+        removed = await run_in_threadpool(
+            content_crud.unlike_content,
+            db,
+            content_id=content_id,
+            user_id=current_user.uid,
+        )
+    return {
+        "status_code": status.HTTP_200_OK,
+        "detail": "좋아요를 취소했습니다.",
+        "data": {"content_id": content_id, "removed": removed},
+    }
+
+
+@router.get("/{content_id}/likes")
+async def content_likes(
+    content_id: int,
+    db: Session = Depends(get_route_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """
+    콘텐츠의 좋아요 수와 현재 사용자의 좋아요 여부를 조회합니다.
+
+    Args:
+        content_id (int): 콘텐츠 ID.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
+        current_user (Principal): 현재 로그인된 사용자 정보.
+
+    Returns:
+        dict: 좋아요 수(`like_cnt`)와 좋아요 여부(`liked`)를 포함하는 응답.
+
+    Raises:
+        HTTPException: 콘텐츠가 없거나 삭제된 경우 404 상태 코드 반환.
+    """
+    if DB_ASYNC:
+        like_status = await content_crud.get_like_status_async(
+            db, content_id=content_id, user_id=current_user.uid
+        )
+    else:
+        like_status = await run_in_threadpool(
+            content_crud.get_like_status,
+            db,
+            content_id=content_id,
+            user_id=current_user.uid,
+        )
+    return {
+        "status_code": status.HTTP_200_OK,
+        "detail": "정상적으로 조회되었습니다.",
+        "data": {"content_id": content_id, **like_status},
+    }
+
+
+@router.delete("/{content_id}")
+async def content_delete(
+    content_id: int,
+    db: Session = Depends(get_route_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """
+    콘텐츠를 삭제합니다. 작성자만 삭제할 수 있습니다.
+
+    콘텐츠는 삭제 표시만 되어 즉시 조회에서 제외되며, 보관 기간이 지나면 백그라운드 작업이 좋아요,
+    첨부 이미지 관계와 함께 영구 삭제합니다.
+
+    Args:
+        content_id (int): 콘텐츠 ID.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
+        current_user (Principal): 현재 로그인된 사용자 정보.
+
+    Returns:
+        dict: 삭제 결과와 상태 정보를 포함하는 응답.
+
+    Raises:
+        HTTPException: 콘텐츠가 없거나 이미 삭제된 경우 404, 작성자가 아닌 경우 403 상태 코드 반환.
+    """
+    if DB_ASYNC:
+        await content_crud.delete_content_async(db, content_id, current_user.username)
+    else:
+        await run_in_threadpool(
+            content_crud.delete_content, db, content_id, current_user.username
+        )
+    return {
+        "status_code": status.HTTP_200_OK,
+        "detail": "콘텐츠가 삭제되었습니다.",
+        "data": {"content_id": content_id},
+    }
+
+
+# 경로 파라미터 하나로 끝나는 라우트는 /feed, /search 등 고정 경로를 가로채지 않도록 마지막에 선언합니다.
+@router.get("/{content_id}")
+async def content_detail(
+    content_id: int,
+    size: Optional[str] = Query(None, regex=VARIANT_SIZE_PATTERN),
+    image_format: str = Query("webp", alias="format", regex=VARIANT_FORMAT_PATTERN),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_route_db),
+):
+    """
+    콘텐츠 하나를 첨부 이미지, 작성자 이미지와 함께 조회합니다.
+
+    Args:
+        content_id (int): 콘텐츠 ID.
+        size (str, optional): 이미지 파생본 이름 (avatar, thumb, medium). 생략하면 원본을 반환합니다.
+        image_format (str): 이미지 파생본 포맷 (webp, jpeg).
+        current_user (Principal): 현재 로그인된 사용자 정보.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
+
+    Returns:
+        dict: 콘텐츠 상세 정보와 상태 정보를 포함하는 응답.
+
+    Raises:
+        HTTPException: 콘텐츠가 없거나 삭제된 경우 404 상태 코드 반환.
+    """
+    if DB_ASYNC:
+        detail = await content_crud.get_content_detail_async(
+            db, content_id, size, image_format
+        )
+    else:
+        detail = await run_in_threadpool(
+            content_crud.get_content_detail, db, content_id, size, image_format
+        )
+    return {
+        "status_code": status.HTTP_200_OK,
+        "detail": "정상적으로 조회되었습니다.",
+        "data": detail,
+    }
@@ -7,7 +7,7 @@ Pydantic 스키마 정의 모듈.
     kimdonghyeok
 """
 
-from typing import List
+from typing import List, Optional
 
 from fastapi import HTTPException
 from pydantic import BaseModel, validator
@@ -21,12 +21,16 @@ class ContentCreate(BaseModel):
     Attributes:
         title (str): 콘텐츠 제목.
         content (str): 콘텐츠 내용.
-        image_id (List): 첨부된 이미지 ID 목록.
+        image_id (List[int]): 첨부된 이미지 ID 목록.
+        latitude (float, optional): 위도 (-90 ~ 90). `longitude` 와 함께 지정합니다.
+        longitude (float, optional): 경도 (-180 ~ 180). `latitude` 와 함께 지정합니다.
     """
 
     title: str
     content: str
-    image_id: List
+    image_id: List[int]
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
     @validator("content", "title", pre=True, always=True)
     def not_empty(cls, v, field):
@@ -50,6 +54,34 @@ class ContentCreate(BaseModel):
             )
         return v
 
+    @validator("longitude", always=True)
+    def coordinates_valid(cls, v, values):
+        """
+        위도와 경도가 함께 지정되었고 범위 안에 있는지 확인하는 유효성 검사기.
+
+        Args:
+            v (float): 검증할 값 (`longitude`).
+            values (dict): 모델의 다른 필드 값.
+
+        Returns:
+            float: 유효한 값.
+
+        Raises:
+            HTTPException: 한쪽만 지정되었거나 범위를 벗어난 경우 400 상태 코드 반환.
+        """
+        latitude = values.get("latitude")
+        if (latitude is None) != (v is None):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="위도와 경도는 함께 지정해야 합니다.",
+            )
+        if v is not None and not (-90 <= latitude <= 90 and -180 <= v <= 180):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="위도 또는 경도가 범위를 벗어났습니다.",
+            )
+        return v
+
 
 class Token(BaseModel):
     """
@@ -0,0 +1,337 @@
+"""
+콘텐츠 위치 검색 모듈.
+
+`GEO_BACKEND=postgis`(기본값)이면 `Contents.location` (PostGIS geography)의 GiST 인덱스로 반경/영역
+검색을 수행합니다. `GEO_BACKEND=grid` 이면 PostGIS 없이(테스트, SQLite 등) 프로세스 내 geohash 격자
+인덱스로 같은 결과를 계산합니다. 격자 인덱스는 워커마다 시작 시 데이터베이스에서 채워지고, 해당 워커에서
+생성/삭제된 콘텐츠는 즉시, 다른 워커의 변경은 `GEO_GRID_RELOAD_INTERVAL_SECONDS` 마다 다시 읽어 반영됩니다.
+
+반경 검색의 범위는 PostGIS 와 같도록 날짜 변경선(경도 ±180)을 넘으면 두 범위로 나누고, 극점을 포함하면
+모든 경도를 확인합니다.
+
+두 백엔드 모두 거리는 구면(PostGIS 는 `use_spheroid=false`, 격자는 haversine) 기준 미터 단위이며,
+(거리, contents_id) 순으로 정렬합니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import asyncio
+import math
+import os
+import threading
+
+from dotenv import load_dotenv
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import cast, func
+from sqlalchemy.orm import Session
+
+from config.database_init import SessionLocal
+from models import Content, Geography, Geometry
+
+load_dotenv()
+
+GEO_BACKEND = os.environ.get("GEO_BACKEND", "postgis")
+GEO_MAX_RADIUS_M = float(os.environ.get("GEO_MAX_RADIUS_M", "50000"))
+# 영역 검색에서 허용하는 최대 위도/경도 폭(도). 격자 백엔드는 폭에 비례해 많은 칸을 확인합니다.
+GEO_MAX_BBOX_SPAN_DEGREES = float(os.environ.get("GEO_MAX_BBOX_SPAN_DEGREES", "5"))
+GEO_GRID_PRECISION = int(os.environ.get("GEO_GRID_PRECISION", "5"))
+# 격자 인덱스를 데이터베이스에서 다시 읽는 주기. 0 이면 시작 시에만 읽습니다.
+GEO_GRID_RELOAD_INTERVAL_SECONDS = float(
+    os.environ.get("GEO_GRID_RELOAD_INTERVAL_SECONDS", "300")
+)
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_M / 180
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def make_point(latitude: float, longitude: float):
+    """
+    위도/경도로 `Contents.location` 에 저장할 geography SQL 식을 만듭니다.
+
+    Args:
+        latitude (float): 위도.
+        longitude (float): 경도.
+
+    Returns:
+        ColumnElement: geography 지점 SQL 식.
+    """
+    return cast(func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326), Geography)
+
+
+def make_envelope(min_lat: float, min_lon: float, max_lat: float, max_lon: float):
+    """
+    위도/경도 범위로 geometry 사각형 SQL 식을 만듭니다.
+
+    geography 사각형의 변은 대원(great circle) 호라서 넓은 범위에서는 위도선 근처의 지점이 빠지므로,
+    경도/위도 평면의 geometry 사각형과 `location_geometry()` 를 비교합니다.
+
+    Returns:
+        ColumnElement: geometry 사각형 SQL 식.
+    """
+    return func.ST_MakeEnvelope(min_lon, min_lat, max_lon, max_lat, 4326)
+
+
+def location_geometry():
+    """
+    `Contents.location` 을 geometry 로 변환한 SQL 식을 만듭니다. `ix_contents_live_location_geometry`
+    식 인덱스와 같은 식입니다.
+
+    Returns:
+        ColumnElement: geometry 지점 SQL 식.
+    """
+    return cast(Content.location, Geometry)
+
+
+def haversine(lat1: float, lon1: float, lat2: float, lon2: float):
+    """
+    두 지점 사이의 구면 거리(미터)를 계산합니다.
+
+    Returns:
+        float: 거리(미터).
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+def radius_bboxes(latitude: float, longitude: float, radius_m: float):
+    """
+    지점을 중심으로 반경을 포함하는 위도/경도 범위를 계산합니다.
+
+    반경이 극점을 포함하면 모든 경도를 포함하고, 날짜 변경선을 넘으면 경도 범위를 -180/180 에서 나눈
+    두 범위를 반환합니다.
+
+    Returns:
+        list: (min_lat, min_lon, max_lat, max_lon) 목록.
+    """
+    d_lat = radius_m / METERS_PER_DEGREE
+    min_lat = latitude - d_lat
+    max_lat = latitude + d_lat
+    if min_lat <= -90.0 or max_lat >= 90.0:
+        return [(max(min_lat, -90.0), -180.0, min(max_lat, 90.0), 180.0)]
+
+    d_lon = radius_m / (METERS_PER_DEGREE * math.cos(math.radians(latitude)))
+    if d_lon >= 180.0:
+        return [(min_lat, -180.0, max_lat, 180.0)]
+    min_lon = longitude - d_lon
+    max_lon = longitude + d_lon
+    if min_lon < -180.0:
+        return [(min_lat, -180.0, max_lat, max_lon), (min_lat, min_lon + 360.0, max_lat, 180.0)]
+    if max_lon > 180.0:
+        return [(min_lat, min_lon, max_lat, 180.0), (min_lat, -180.0, max_lat, max_lon - 360.0)]
+    return [(min_lat, min_lon, max_lat, max_lon)]
+
+
+def geohash(latitude: float, longitude: float, precision: int = GEO_GRID_PRECISION):
+    """
+    위도/경도의 geohash 를 계산합니다.
+
+    Args:
+        latitude (float): 위도.
+        longitude (float): 경도.
+        precision (int): geohash 길이.
+
+    Returns:
+        str: geohash 문자열.
+    """
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        value, value_range = (longitude, lon_range) if even else (latitude, lat_range)
+        mid = (value_range[0] + value_range[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            value_range[0] = mid
+        else:
+            value_range[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+class GeohashGridIndex:
+    """
+    geohash 격자 기반 프로세스 내 위치 인덱스.
+
+    각 콘텐츠를 `precision` 길이의 geohash 칸에 넣고, 검색 시 범위를 덮는 칸만 확인합니다.
+    스레드 풀의 동기 라우트에서도 사용되므로 잠금으로 보호됩니다.
+
+    Attributes:
+        precision (int): 격자 칸의 geohash 길이 (5 이면 약 4.9km x 4.9km).
+    """
+
+    def __init__(self, precision: int = GEO_GRID_PRECISION):
+        self.precision = precision
+        lon_bits = math.ceil(5 * precision / 2)
+        lat_bits = 5 * precision - lon_bits
+        self._cell_height = 180.0 / (1 << lat_bits)
+        self._cell_width = 360.0 / (1 << lon_bits)
+        self._cells = {}
+        self._points = {}
+        self._lock = threading.Lock()
+
+    def add(self, content_id: int, latitude: float, longitude: float):
+        """콘텐츠 위치를 추가하거나 갱신합니다."""
+        cell = geohash(latitude, longitude, self.precision)
+        with self._lock:
+            self._remove(content_id)
+            self._cells.setdefault(cell, {})[content_id] = (latitude, longitude)
+            self._points[content_id] = cell
+
+    def remove(self, content_id: int):
+        """콘텐츠 위치를 제거합니다."""
+        with self._lock:
+            self._remove(content_id)
+
+    def _remove(self, content_id: int):
+        cell = self._points.pop(content_id, None)
+        if cell is not None:
+            members = self._cells[cell]
+            members.pop(content_id, None)
+            if not members:
+                del self._cells[cell]
+
+    def clear(self):
+        """모든 위치를 제거합니다."""
+        with self._lock:
+            self._cells.clear()
+            self._points.clear()
+
+    def _covering_cells(self, min_lat, min_lon, max_lat, max_lon):
+        lats = _steps(min_lat, max_lat, self._cell_height)
+        lons = _steps(min_lon, max_lon, self._cell_width)
+        return {geohash(lat, lon, self.precision) for lat in lats for lon in lons}
+
+    def _candidates(self, *bboxes):
+        cells = set()
+        for bbox in bboxes:
+            cells |= self._covering_cells(*bbox)
+        with self._lock:
+            return [
+                item for cell in cells for item in self._cells.get(cell, {}).items()
+            ]
+
+    def within_radius(self, latitude: float, longitude: float, radius_m: float):
+        """
+        반경 안의 콘텐츠를 거리순으로 반환합니다.
+
+        Returns:
+            list: (거리(미터), contents_id) 목록.
+        """
+        results = []
+        for content_id, (lat, lon) in self._candidates(
+            *radius_bboxes(latitude, longitude, radius_m)
+        ):
+            distance = haversine(latitude, longitude, lat, lon)
+            if distance <= radius_m:
+                results.append((distance, content_id))
+        results.sort()
+        return results
+
+    def within_bbox(self, min_lat, min_lon, max_lat, max_lon):
+        """
+        위도/경도 범위 안의 콘텐츠를 범위 중심에서 가까운 순으로 반환합니다.
+
+        Returns:
+            list: (중심까지 거리(미터), contents_id) 목록.
+        """
+        center_lat = (min_lat + max_lat) / 2
+        center_lon = (min_lon + max_lon) / 2
+        results = []
+        for content_id, (lat, lon) in self._candidates((min_lat, min_lon, max_lat, max_lon)):
+            if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon:
+                results.append((haversine(center_lat, center_lon, lat, lon), content_id))
+        results.sort()
+        return results
+
+    def load(self, db: Session, batch_size: int = 10000):
+        """
+        삭제되지 않고 위치가 있는 콘텐츠로 인덱스를 다시 채웁니다.
+
+        새 격자를 따로 만든 뒤 한 번에 교체하므로, 다시 읽는 동안에도 검색은 이전 격자로 계속 처리됩니다.
+
+        Args:
+            db (Session): SQLAlchemy 데이터베이스 세션.
+            batch_size (int): 한 번에 읽을 행 수.
+
+        Returns:
+            int: 인덱스에 넣은 콘텐츠 수.
+        """
+        cells = {}
+        points = {}
+        last_id = 0
+        while True:
+            rows = (
+                db.query(Content.contents_id, Content.latitude, Content.longitude)
+                .filter(
+                    Content.contents_id > last_id,
+                    Content.latitude.isnot(None),
+                    Content.is_deleted.is_(False),
+                )
+                .order_by(Content.contents_id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            for row in rows:
+                cell = geohash(row.latitude, row.longitude, self.precision)
+                cells.setdefault(cell, {})[row.contents_id] = (row.latitude, row.longitude)
+                points[row.contents_id] = cell
+            last_id = rows[-1].contents_id
+        with self._lock:
+            self._cells = cells
+            self._points = points
+        return len(points)
+
+
+def _steps(start: float, stop: float, step: float):
+    values = []
+    value = start
+    while value < stop:
+        values.append(value)
+        value += step
+    values.append(stop)
+    return values
+
+
+geo_index = GeohashGridIndex()
+
+
+def load_geo_index_now():
+    """새 세션으로 `geo_index` 를 데이터베이스에서 다시 채웁니다."""
+    db = SessionLocal(info={"route": "geo index load"})
+    try:
+        return geo_index.load(db)
+    finally:
+        db.close()
+
+
+async def reload_geo_index_periodically(
+    interval: float = GEO_GRID_RELOAD_INTERVAL_SECONDS,
+):
+    """
+    주기적으로 `geo_index` 를 다시 읽어 다른 워커에서 생성/삭제된 콘텐츠를 반영합니다.
+    `GEO_BACKEND=grid` 이고 `GEO_GRID_RELOAD_INTERVAL_SECONDS` 가 0 보다 크면 애플리케이션 시작 시
+    백그라운드 작업으로 실행됩니다.
+
+    Args:
+        interval (float): 실행 간격(초).
+    """
+    while True:
+        await asyncio.sleep(interval)
+        await run_in_threadpool(load_geo_index_now)
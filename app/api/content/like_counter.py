@@ -0,0 +1,165 @@
+"""
+좋아요 수 지연 기록(write-behind) 모듈.
+
+좋아요/취소 요청마다 `Contents.like_cnt` 를 갱신하면 인기 콘텐츠의 한 행에 잠금이 몰립니다.
+이 모듈은 워커 프로세스마다 콘텐츠별 증감량을 메모리에 모아 두었다가, 주기적으로 콘텐츠 ID 순서로
+정렬한 일괄 UPDATE 한 번으로 반영합니다. 각 워커의 버퍼가 카운터의 샤드 역할을 하므로, 한 콘텐츠 행은
+플러시 주기당 워커 수만큼만 갱신됩니다.
+
+좋아요 관계(`Contents_Likes`)는 요청 시점에 바로 기록되므로, 플러시 전에 프로세스가 종료되어도
+관계 수로 `like_cnt` 를 다시 계산할 수 있습니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import asyncio
+import os
+import threading
+
+from dotenv import load_dotenv
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import bindparam, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from config.database_init import SessionLocal
+from models import Content
+
+load_dotenv()
+
+LIKE_FLUSH_INTERVAL_SECONDS = float(os.environ.get("LIKE_FLUSH_INTERVAL_SECONDS", "1"))
+
+_contents = Content.__table__
+
+_increment_like_cnt = (
+    update(_contents)
+    .where(_contents.c.contents_id == bindparam("b_contents_id"))
+    .values(like_cnt=_contents.c.like_cnt + bindparam("b_delta"))
+)
+
+
+class LikeCounterBuffer:
+    """
+    콘텐츠별 좋아요 증감량 버퍼.
+
+    스레드 풀의 동기 라우트와 이벤트 루프에서 함께 사용되므로 잠금으로 보호됩니다.
+    """
+
+    def __init__(self):
+        self._deltas = {}
+        self._lock = threading.Lock()
+
+    def add(self, content_id: int, delta: int):
+        """
+        콘텐츠의 증감량을 더합니다.
+
+        Args:
+            content_id (int): 콘텐츠 ID.
+            delta (int): 증감량 (좋아요 +1, 취소 -1).
+        """
+        with self._lock:
+            total = self._deltas.get(content_id, 0) + delta
+            if total:
+                self._deltas[content_id] = total
+            else:
+                self._deltas.pop(content_id, None)
+
+    def pending(self, content_ids):
+        """
+        아직 반영되지 않은 증감량을 조회합니다.
+
+        Args:
+            content_ids (Iterable[int]): 콘텐츠 ID 목록.
+
+        Returns:
+            dict: 콘텐츠 ID -> 증감량 (증감량이 없는 ID 는 0).
+        """
+        with self._lock:
+            return {content_id: self._deltas.get(content_id, 0) for content_id in content_ids}
+
+    def drain(self):
+        """
+        모아 둔 증감량을 꺼내고 버퍼를 비웁니다.
+
+        Returns:
+            dict: 콘텐츠 ID -> 증감량.
+        """
+        with self._lock:
+            deltas, self._deltas = self._deltas, {}
+        return deltas
+
+    def restore(self, deltas: dict):
+        """
+        반영에 실패한 증감량을 버퍼에 되돌립니다.
+
+        Args:
+            deltas (dict): `drain` 이 반환한 증감량.
+        """
+        for content_id, delta in deltas.items():
+            self.add(content_id, delta)
+
+
+like_buffer = LikeCounterBuffer()
+
+
+def flush_like_counts(db: Session):
+    """
+    버퍼의 증감량을 `Contents.like_cnt` 에 한 번의 일괄 UPDATE 로 반영합니다.
+
+    여러 워커가 동시에 플러시해도 교착 상태가 생기지 않도록 콘텐츠 ID 순서로 갱신합니다.
+    실패하면 증감량을 버퍼에 되돌려 다음 플러시에서 다시 시도합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+
+    Returns:
+        int: 갱신한 콘텐츠 수.
+    """
+    deltas = like_buffer.drain()
+    if not deltas:
+        return 0
+    try:
+        db.execute(
+            _increment_like_cnt,
+            [
+                {"b_contents_id": content_id, "b_delta": deltas[content_id]}
+                for content_id in sorted(deltas)
+            ],
+        )
+        db.commit()
+        return len(deltas)
+    except SQLAlchemyError as e:
+        db.rollback()
+        like_buffer.restore(deltas)
+        print(f"An error occurred: {e}")
+        return 0
+
+
+def flush_like_counts_now():
+    """새 세션으로 `flush_like_counts` 를 실행합니다."""
+    db = SessionLocal(info={"route": "like-counter flush"})
+    try:
+        return flush_like_counts(db)
+    finally:
+        db.close()
+
+
+async def flush_like_counts_periodically(interval: float = LIKE_FLUSH_INTERVAL_SECONDS):
+    """
+    주기적으로 좋아요 증감량을 반영합니다. 애플리케이션 시작 시 백그라운드 작업으로 실행됩니다.
+
+    작업이 취소되면 진행 중인 플러시가 끝난 뒤에 종료하므로, 종료 훅의 마지막 플러시와 겹치지 않습니다.
+
+    Args:
+        interval (float): 플러시 간격(초).
+    """
+    while True:
+        await asyncio.sleep(interval)
+        flush = asyncio.ensure_future(run_in_threadpool(flush_like_counts_now))
+        try:
+            await asyncio.shield(flush)
+        except asyncio.CancelledError:
+            # 취소되어도 스레드 풀의 플러시는 계속 실행되므로, 끝날 때까지 기다린 뒤 종료합니다.
+            await flush
+            raise
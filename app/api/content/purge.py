@@ -0,0 +1,134 @@
+"""
+삭제된 콘텐츠 영구 삭제 모듈.
+
+삭제 API 는 `Contents.is_deleted` 와 `deleted_at` 만 갱신합니다. 이 모듈은 삭제 후 보관 기간
+(`CONTENT_PURGE_AFTER_DAYS`)이 지난 콘텐츠를 `CONTENT_PURGE_BATCH_SIZE` 개씩 골라 좋아요, 콘텐츠-이미지
+관계와 함께 실제로 삭제하고 첨부 이미지의 참조 수를 감소시킵니다. 더 이상 참조되지 않는 이미지의 행과
+파일은 이미지 GC(`api.image.image_gc`)가 유예 기간 뒤에 삭제합니다.
+
+배치마다 짧은 트랜잭션 하나로 처리하고, 대상 행은 `FOR UPDATE SKIP LOCKED` 로 잠그므로 여러 워커가 동시에
+실행해도 서로 기다리지 않고 다른 배치를 가져갑니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import asyncio
+import os
+
+import pendulum
+from dotenv import load_dotenv
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from api.image.image_crud import release_images
+from config.database_init import SessionLocal
+from models import Content, ContentImage, ContentLike
+
+load_dotenv()
+
+CONTENT_PURGE_AFTER_DAYS = float(os.environ.get("CONTENT_PURGE_AFTER_DAYS", "30"))
+CONTENT_PURGE_BATCH_SIZE = int(os.environ.get("CONTENT_PURGE_BATCH_SIZE", "200"))
+CONTENT_PURGE_INTERVAL_SECONDS = float(
+    os.environ.get("CONTENT_PURGE_INTERVAL_SECONDS", "3600")
+)
+
+
+def purge_batch(db: Session, cutoff, batch_size: int = CONTENT_PURGE_BATCH_SIZE):
+    """
+    `cutoff` 이전에 삭제된 콘텐츠를 최대 `batch_size` 개 영구 삭제하고 커밋합니다.
+
+    대상은 `ix_contents_deleted_at` 부분 인덱스 순서로 고르며, 다른 트랜잭션이 잠근 행은 건너뜁니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        cutoff (datetime): 이 시각 이전에 삭제된 콘텐츠만 삭제합니다.
+        batch_size (int): 한 번에 삭제할 최대 콘텐츠 수.
+
+    Returns:
+        int: 삭제한 콘텐츠 수.
+    """
+    content_ids = [
+        row.contents_id
+        for row in db.query(Content.contents_id)
+        .filter(Content.is_deleted.is_(True), Content.deleted_at < cutoff)
+        .order_by(Content.deleted_at, Content.contents_id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ]
+    if not content_ids:
+        db.rollback()
+        return 0
+
+    image_ids = [
+        row.image_id
+        for row in db.query(ContentImage.image_id).filter(
+            ContentImage.content_id.in_(content_ids)
+        )
+    ]
+    db.query(ContentImage).filter(ContentImage.content_id.in_(content_ids)).delete(
+        synchronize_session=False
+    )
+    release_images(db, image_ids)
+    db.query(ContentLike).filter(ContentLike.content_id.in_(content_ids)).delete(
+        synchronize_session=False
+    )
+    db.query(Content).filter(Content.contents_id.in_(content_ids)).delete(
+        synchronize_session=False
+    )
+    db.commit()
+    return len(content_ids)
+
+
+def purge_deleted_contents(
+    db: Session,
+    older_than_days: float = CONTENT_PURGE_AFTER_DAYS,
+    batch_size: int = CONTENT_PURGE_BATCH_SIZE,
+):
+    """
+    보관 기간이 지난 삭제된 콘텐츠를 배치 단위로 모두 영구 삭제합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        older_than_days (float): 삭제 후 보관 기간(일).
+        batch_size (int): 한 번에 삭제할 최대 콘텐츠 수.
+
+    Returns:
+        int: 삭제한 콘텐츠 수.
+    """
+    cutoff = pendulum.now("Asia/Seoul").subtract(seconds=older_than_days * 86400)
+    total = 0
+    while True:
+        try:
+            purged = purge_batch(db, cutoff, batch_size)
+        except SQLAlchemyError as e:
+            db.rollback()  # 데이터베이스 롤백
+            print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+            return total
+        total += purged
+        if purged < batch_size:
+            return total
+
+
+def purge_deleted_contents_now():
+    """새 세션으로 `purge_deleted_contents` 를 실행합니다."""
+    db = SessionLocal(info={"route": "content purge"})
+    try:
+        return purge_deleted_contents(db)
+    finally:
+        db.close()
+
+
+async def purge_deleted_contents_periodically(
+    interval: float = CONTENT_PURGE_INTERVAL_SECONDS,
+):
+    """
+    주기적으로 삭제된 콘텐츠를 영구 삭제합니다. 애플리케이션 시작 시 백그라운드 작업으로 실행됩니다.
+
+    Args:
+        interval (float): 실행 간격(초).
+    """
+    while True:
+        await asyncio.sleep(interval)
+        await run_in_threadpool(purge_deleted_contents_now)
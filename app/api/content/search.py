@@ -0,0 +1,233 @@
+"""
+콘텐츠 전문 검색 모듈.
+
+콘텐츠 제목/본문을 토크나이저로 나눈 뒤 Postgres `tsvector` 로 저장하고, 같은 토크나이저로 만든
+`tsquery` 로 검색합니다. 한국어는 Postgres 기본 설정으로 형태소 분석이 되지 않으므로, 기본 토크나이저는
+한글/한자/가나 구간을 2-gram 으로 나누고 그 외 단어는 소문자 단어 그대로 사용합니다. 한 글자 검색을 위해
+한글/한자/가나 글자는 1-gram 으로도 색인합니다.
+
+토크나이저는 `SEARCH_TOKENIZER`(bigram, whitespace), Postgres 텍스트 검색 설정은 `SEARCH_TS_CONFIG`
+로 선택합니다. 토크나이저나 설정을 바꾸면 `python manage.py search-reindex` 로 기존 콘텐츠를 다시
+색인해야 합니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import html
+import os
+import re
+
+from dotenv import load_dotenv
+from sqlalchemy import bindparam, func, update
+from sqlalchemy.orm import Session
+
+from models import Content
+
+load_dotenv()
+
+SEARCH_TOKENIZER = os.environ.get("SEARCH_TOKENIZER", "bigram")
+SEARCH_TS_CONFIG = os.environ.get("SEARCH_TS_CONFIG", "simple")
+SEARCH_SNIPPET_CHARS = int(os.environ.get("SEARCH_SNIPPET_CHARS", "120"))
+# 관련도를 계산할 최대 후보 수. 일치하는 콘텐츠가 더 많으면 최신 콘텐츠부터 이만큼만 순위를 매깁니다.
+SEARCH_MAX_CANDIDATES = int(os.environ.get("SEARCH_MAX_CANDIDATES", "1000"))
+
+# 가나, 한글 자모, 한자, 한글 음절
+_CJK = "\u3040-\u30ff\u3130-\u318f\u4e00-\u9fff\uac00-\ud7af"
+_CJK_RUN = re.compile(rf"[{_CJK}]+")
+_TOKEN = re.compile(rf"[{_CJK}]+|[^\W{_CJK}]+")
+
+
+def tokenize_whitespace(text: str):
+    """
+    단어 단위로 나눈 소문자 토큰 목록을 반환합니다.
+
+    Args:
+        text (str): 원문.
+
+    Returns:
+        list: 토큰 목록.
+    """
+    return [token.lower() for token in _TOKEN.findall(text or "")]
+
+
+def tokenize_bigram(text: str):
+    """
+    한글/한자/가나 구간은 2-gram, 그 외 단어는 소문자 단어로 나눈 토큰 목록을 반환합니다.
+
+    Args:
+        text (str): 원문.
+
+    Returns:
+        list: 토큰 목록.
+    """
+    tokens = []
+    for token in _TOKEN.findall(text or ""):
+        if _CJK_RUN.fullmatch(token) and len(token) > 1:
+            tokens.extend(token[i:i + 2] for i in range(len(token) - 1))
+        else:
+            tokens.append(token.lower())
+    return tokens
+
+
+TOKENIZERS = {
+    "bigram": tokenize_bigram,
+    "whitespace": tokenize_whitespace,
+}
+
+tokenize = TOKENIZERS[SEARCH_TOKENIZER]
+
+
+def index_text(text: str):
+    """
+    색인할 토큰을 공백으로 이어 붙인 문자열을 반환합니다.
+
+    bigram 토크나이저를 사용하면 한글/한자/가나 글자를 1-gram 으로도 색인하여, 한 글자 검색어가
+    단어 가운데 글자("한국" 의 "국")도 찾을 수 있게 합니다.
+
+    Args:
+        text (str): 원문.
+
+    Returns:
+        str: `to_tsvector` 에 전달할 문자열.
+    """
+    tokens = tokenize(text)
+    if tokenize is tokenize_bigram:
+        tokens.extend(dict.fromkeys("".join(_CJK_RUN.findall(text or ""))))
+    return " ".join(tokens)
+
+
+def _search_vector(title, content):
+    return func.setweight(func.to_tsvector(SEARCH_TS_CONFIG, title), "A").op("||")(
+        func.setweight(func.to_tsvector(SEARCH_TS_CONFIG, content), "B")
+    )
+
+
+def build_search_vector(title: str, content: str):
+    """
+    제목(가중치 A)과 본문(가중치 B)으로 `tsvector` SQL 식을 만듭니다.
+
+    Args:
+        title (str): 콘텐츠 제목.
+        content (str): 콘텐츠 본문.
+
+    Returns:
+        ColumnElement: `Contents.search_vector` 에 저장할 SQL 식.
+    """
+    return _search_vector(index_text(title), index_text(content))
+
+
+def build_search_query(query: str):
+    """
+    검색어로 `tsquery` SQL 식을 만듭니다. 모든 토큰을 포함하는 콘텐츠가 검색됩니다.
+
+    한 글자 한글 검색어는 접두어 검색(`:*`)으로 변환하여, 1-gram 으로 색인된 글자와 그 글자로 시작하는
+    단어를 함께 찾습니다.
+    토큰은 단어 문자로만 이루어져 있어 `tsquery` 연산자가 섞이지 않습니다.
+
+    Args:
+        query (str): 사용자 검색어.
+
+    Returns:
+        ColumnElement or None: `tsquery` SQL 식. 검색할 토큰이 없으면 None.
+    """
+    terms = []
+    for token in dict.fromkeys(tokenize(query)):
+        if len(token) == 1 and _CJK_RUN.fullmatch(token):
+            terms.append(f"{token}:*")
+        else:
+            terms.append(token)
+    if not terms:
+        return None
+    return func.to_tsquery(SEARCH_TS_CONFIG, " & ".join(terms))
+
+
+def make_snippet(text: str, query: str, width: int = SEARCH_SNIPPET_CHARS):
+    """
+    검색어가 처음 나오는 위치 주변의 본문을 잘라, 검색어를 `<mark>` 로 강조한 HTML 조각을 만듭니다.
+
+    본문은 HTML 이스케이프되므로 그대로 렌더링해도 안전합니다.
+
+    Args:
+        text (str): 콘텐츠 본문.
+        query (str): 사용자 검색어.
+        width (int): 조각의 최대 길이(문자).
+
+    Returns:
+        str: 강조된 HTML 조각.
+    """
+    text = text or ""
+    # 검색어 단어와 토큰을 긴 것부터 찾아, 단어 전체가 있으면 단어 단위로 강조합니다.
+    words = sorted(
+        {word for word in query.split() + tokenize(query) if word}, key=len, reverse=True
+    )
+    if not words:
+        return html.escape(text[:width])
+    pattern = re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE)
+
+    match = pattern.search(text)
+    start = 0 if match is None else max(match.start() - width // 3, 0)
+    end = min(start + width, len(text))
+    window = text[start:end]
+
+    parts = []
+    last = 0
+    for found in pattern.finditer(window):
+        parts.append(html.escape(window[last:found.start()]))
+        parts.append(f"<mark>{html.escape(found.group())}</mark>")
+        last = found.end()
+    parts.append(html.escape(window[last:]))
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(text) else ""
+    return prefix + "".join(parts) + suffix
+
+
+_contents = Content.__table__
+
+_reindex_search_vector = (
+    update(_contents)
+    .where(_contents.c.contents_id == bindparam("b_contents_id"))
+    .values(search_vector=_search_vector(bindparam("b_title"), bindparam("b_content")))
+)
+
+
+def reindex_search(db: Session, batch_size: int = 500):
+    """
+    모든 콘텐츠의 `search_vector` 를 현재 토크나이저로 다시 계산합니다.
+
+    콘텐츠 ID 순서로 `batch_size` 개씩 처리하며, 배치마다 일괄 UPDATE(executemany) 한 번과 커밋 한 번만
+    실행하므로 긴 트랜잭션을 만들지 않습니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        batch_size (int): 한 번에 처리할 콘텐츠 수.
+
+    Returns:
+        int: 다시 색인한 콘텐츠 수.
+    """
+    last_id = 0
+    total = 0
+    while True:
+        rows = (
+            db.query(Content.contents_id, Content.title, Content.content)
+            .filter(Content.contents_id > last_id)
+            .order_by(Content.contents_id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return total
+        db.execute(
+            _reindex_search_vector,
+            [
+                {
+                    "b_contents_id": row.contents_id,
+                    "b_title": index_text(row.title),
+                    "b_content": index_text(row.content),
+                }
+                for row in rows
+            ],
+        )
+        db.commit()
+        last_id = rows[-1].contents_id
+        total += len(rows)
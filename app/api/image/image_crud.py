@@ -7,38 +7,184 @@
     kimdonghyeok
 """
 
+import os
+from collections import defaultdict
+
 import pendulum
 from dotenv import load_dotenv
 from fastapi import HTTPException
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import and_, func
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from api.image.image_schema import ImageCreate
-from models import ContentImage, Image, User, UserImage
+from api.image.image_variants import variant_key
+from api.user.user_schema import Principal
+from config.cache import make_cache
+from models import ContentImage, Image, ImageVariant, User, UserImage
 
 load_dotenv()
 
+# username -> {"original": 원본 주소, "<variant>.<format>": 파생본 주소} 아바타 캐시
+# (create_userimage 에서 무효화)
+avatar_cache = make_cache(
+    "avatar",
+    maxsize=int(os.environ.get("AVATAR_CACHE_MAXSIZE", "10000")),
+    ttl=float(os.environ.get("AVATAR_CACHE_TTL_SECONDS", "300")),
+    shared=os.environ.get("AVATAR_CACHE_SHARED", "false").lower() == "true",
+)
+
+# 한 번의 요청으로 이미지를 조회할 수 있는 최대 콘텐츠 수
+MAX_CONTENT_IDS = 100
+# 한 번의 요청으로 아바타를 조회할 수 있는 최대 사용자 수
+MAX_USERNAMES = 500
+
+
+def get_image_by_hash(db: Session, content_hash: str, lock: bool = False):
+    """
+    내용 해시로 이미지를 조회합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        content_hash (str): 이미지 내용의 SHA-256 해시.
+        lock (bool): True 이면 트랜잭션이 끝날 때까지 행을 잠가 이미지 GC 가 삭제하지 못하게 합니다.
+
+    Returns:
+        Image or None: 이미지 객체 또는 존재하지 않을 경우 None.
+    """
+    query = db.query(Image).filter(Image.content_hash == content_hash)
+    if lock:
+        query = query.with_for_update()
+    return query.first()
+
+
+def get_existing_hashes(db: Session, content_hashes: list):
+    """
+    이미 저장된 이미지의 내용 해시를 조회합니다.
+
+    업로드 시 중복 제거로 재사용될 이미지는 파생본이 이미 있으므로 다시 생성하지 않기 위해 사용합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        content_hashes (list): 확인할 SHA-256 해시 목록.
+
+    Returns:
+        set: 이미 `Images` 행이 있는 해시 집합.
+
+    Raises:
+        HTTPException: 데이터베이스 작업 중 오류가 발생한 경우.
+    """
+    if not content_hashes:
+        return set()
+    try:
+        return {
+            row.content_hash
+            for row in db.query(Image.content_hash).filter(
+                Image.content_hash.in_(set(content_hashes))
+            )
+        }
+    except SQLAlchemyError as e:
+        db.rollback()  # 데이터베이스 롤백
+        print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+
+def _get_or_create_image(db: Session, image_create: ImageCreate):
+    # 같은 내용의 이미지가 이미 있으면 기존 행을 재사용합니다. 행을 잠가 두므로 이미지 GC 가 같은 행을
+    # 삭제하는 중이면 삭제가 끝난 뒤 다시 조회되어 새 행을 만듭니다. 재사용한 행은 `last_used_at` 을
+    # 갱신하여, 연결되기 전에 이미지 GC 의 유예 기간이 지나지 않게 합니다.
+    now = pendulum.now("Asia/Seoul")
+    if image_create.content_hash:
+        existing_image = get_image_by_hash(db, image_create.content_hash, lock=True)
+        if existing_image:
+            existing_image.last_used_at = now
+            return existing_image
+    db_image = Image(
+        created_at=now,
+        last_used_at=now,
+        image_address=image_create.image_address,
+        content_hash=image_create.content_hash,
+        size=image_create.size,
+        ref_count=0,
+    )
+    try:
+        with db.begin_nested():
+            db.add(db_image)
+            db.flush()
+            db.add_all(
+                ImageVariant(image_id=db_image.image_id, **variant.dict())
+                for variant in image_create.variants
+            )
+    except IntegrityError:
+        # 같은 내용이 동시에 업로드되어 다른 요청이 먼저 저장한 경우
+        existing_image = get_image_by_hash(db, image_create.content_hash, lock=True)
+        existing_image.last_used_at = now
+        return existing_image
+    return db_image
+
+
+def _adjust_ref_counts(db: Session, image_ids: list, sign: int):
+    # 같은 증감량을 갖는 이미지끼리 묶어 UPDATE 한 번으로 처리합니다.
+    counts = defaultdict(int)
+    for image_id in image_ids:
+        counts[image_id] += 1
+    groups = defaultdict(list)
+    for image_id, count in counts.items():
+        groups[count].append(image_id)
+    for count, ids in groups.items():
+        db.query(Image).filter(Image.image_id.in_(ids)).update(
+            {Image.ref_count: Image.ref_count + sign * count},
+            synchronize_session=False,
+        )
+    return counts
+
+
+def retain_images(db: Session, image_ids: list):
+    """
+    이미지의 참조 수를 증가시킵니다. 커밋은 호출자가 수행합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        image_ids (list): 새로 참조되는 이미지 ID 목록 (중복 허용).
+    """
+    _adjust_ref_counts(db, image_ids, 1)
+
+
+def release_images(db: Session, image_ids: list):
+    """
+    이미지의 참조 수를 감소시킵니다. 커밋은 호출자가 수행합니다.
+
+    참조 수가 0 이 되어도 행과 파일은 바로 삭제하지 않습니다. 같은 내용의 업로드가 중복 제거로 이 행을
+    막 돌려받았을 수 있으므로, 어디에서도 참조되지 않는 이미지는 유예 기간이 지난 뒤 이미지 GC
+    (`api.image.image_gc`)가 삭제합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        image_ids (list): 참조가 해제되는 이미지 ID 목록 (중복 허용).
+    """
+    if image_ids:
+        _adjust_ref_counts(db, image_ids, -1)
+
 
 def create_contentimage(db: Session, image_create: ImageCreate):
     """
     콘텐츠와 연결된 이미지를 생성합니다.
 
+    같은 내용(`content_hash`)의 이미지가 이미 있으면 새 행을 만들지 않고 기존 이미지를 반환합니다.
+
     Args:
         db (Session): SQLAlchemy 데이터베이스 세션.
         image_create (ImageCreate): 생성할 이미지의 데이터.
 
     Returns:
-        int: 생성된 이미지의 고유 ID.
+        int: 생성되거나 재사용된 이미지의 고유 ID.
 
     Raises:
         HTTPException: 데이터베이스 작업 중 오류가 발생한 경우.
     """
     try:
-        db_image = Image(
-            created_at=pendulum.now("Asia/Seoul"),
-            image_address=image_create.image_address,
-        )
-        db.add(db_image)
+        db_image = _get_or_create_image(db, image_create)
         db.commit()
         return db_image.image_id
     except SQLAlchemyError as e:
@@ -47,14 +193,85 @@ def create_contentimage(db: Session, image_create: ImageCreate):
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
-def create_userimage(db: Session, image_create: ImageCreate, username: str):
+def create_contentimages(db: Session, image_creates: list):
+    """
+    콘텐츠에 첨부할 여러 이미지를 한 번의 커밋으로 생성합니다.
+
+    이미 저장된 내용(`content_hash`)은 한 번의 조회로 찾아 재사용하고(`last_used_at` 갱신), 나머지는
+    한꺼번에 추가합니다.
+    같은 내용이 동시에 업로드되어 고유 제약에 걸리면 이미지별로 다시 처리합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        image_creates (list): 생성할 이미지 데이터(ImageCreate) 목록.
+
+    Returns:
+        list: 입력 순서대로의 이미지 고유 ID 목록.
+
+    Raises:
+        HTTPException: 데이터베이스 작업 중 오류가 발생한 경우.
+    """
+    try:
+        now = pendulum.now("Asia/Seoul")
+        hashes = {ic.content_hash for ic in image_creates if ic.content_hash}
+        by_hash = {}
+        if hashes:
+            by_hash = {
+                image.content_hash: image
+                for image in db.query(Image)
+                .filter(Image.content_hash.in_(hashes))
+                .with_for_update()
+            }
+            for image in by_hash.values():
+                image.last_used_at = now
+        db_images = []
+        new_images = []
+        for image_create in image_creates:
+            db_image = by_hash.get(image_create.content_hash)
+            if db_image is None:
+                db_image = Image(
+                    created_at=now,
+                    last_used_at=now,
+                    image_address=image_create.image_address,
+                    content_hash=image_create.content_hash,
+                    size=image_create.size,
+                    ref_count=0,
+                )
+                new_images.append((db_image, image_create))
+                if image_create.content_hash:
+                    by_hash[image_create.content_hash] = db_image
+            db_images.append(db_image)
+        try:
+            db.add_all(db_image for db_image, _ in new_images)
+            db.flush()
+            db.add_all(
+                ImageVariant(image_id=db_image.image_id, **variant.dict())
+                for db_image, image_create in new_images
+                for variant in image_create.variants
+            )
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            db_images = [_get_or_create_image(db, ic) for ic in image_creates]
+            db.commit()
+        return [db_image.image_id for db_image in db_images]
+    except SQLAlchemyError as e:
+        db.rollback()  # 데이터베이스 롤백
+        print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+
+
+def create_userimage(db: Session, image_create: ImageCreate, principal: Principal):
     """
     사용자의 이미지를 생성하거나 업데이트합니다.
 
+    같은 내용의 이미지가 이미 있으면 재사용하며, 교체된 이전 이미지는 참조 수만 감소시킵니다.
+    더 이상 참조되지 않는 이전 이미지의 행과 파일은 이미지 GC 가 유예 기간 뒤에 삭제합니다.
+
     Args:
         db (Session): SQLAlchemy 데이터베이스 세션.
         image_create (ImageCreate): 생성할 이미지의 데이터.
-        username (str): 이미지를 연결할 사용자 이름.
+        principal (Principal): 이미지를 연결할 사용자.
 
     Returns:
         int: 생성 또는 업데이트된 이미지의 고유 ID.
@@ -63,27 +280,35 @@ def create_userimage(db: Session, image_create: ImageCreate, username: str):
         HTTPException: 데이터베이스 작업 중 오류가 발생한 경우.
     """
     try:
-        user_id = db.query(User).filter(User.username == username).first().uid
-        # 사용자가 기존에 이미지를 가지고 있는지 확인
-        existing_user_image = (
-            db.query(UserImage).filter(UserImage.user_id == user_id).first()
-        )
-        # image db 에 이미지 저장 정보 저장
-        db_image = Image(
-            created_at=pendulum.now("Asia/Seoul"),
-            image_address=image_create.image_address,
+        user_id = principal.uid
+        user_image_query = (
+            db.query(UserImage).filter(UserImage.user_id == user_id).with_for_update()
         )
-        db.add(db_image)
-        db.flush()
-        if existing_user_image:
-            # 사용자가 기존 이미지를 가지고 있다면 해당 이미지 정보를 업데이트
-            existing_user_image.image_id = db_image.image_id
-            db.add(existing_user_image)
-        else:
+        # 사용자가 기존에 이미지를 가지고 있는지 확인
+        existing_user_image = user_image_query.first()
+        # image db 에 이미지 저장 정보 저장 (같은 내용이면 재사용)
+        db_image = _get_or_create_image(db, image_create)
+        if existing_user_image is None:
             # 사용자가 기존 이미지를 가지고 있지 않다면 새로운 UserImage 관계를 추가
-            user_image = UserImage(user_id=user_id, image_id=db_image.image_id)
-            db.add(user_image)
+            try:
+                with db.begin_nested():
+                    db.add(UserImage(user_id=user_id, image_id=db_image.image_id))
+                    db.flush()
+                retain_images(db, [db_image.image_id])
+            except IntegrityError:
+                # 같은 사용자의 첫 이미지가 동시에 업로드되어 다른 요청이 먼저 저장한 경우
+                existing_user_image = user_image_query.first()
+        if existing_user_image is not None:
+            # 사용자가 기존 이미지를 가지고 있다면 해당 이미지 정보를 업데이트
+            old_image_id = existing_user_image.image_id
+            if old_image_id != db_image.image_id:
+                existing_user_image.image_id = db_image.image_id
+                db.add(existing_user_image)
+                db.flush()
+                retain_images(db, [db_image.image_id])
+                release_images(db, [old_image_id])
         db.commit()
+        avatar_cache.delete(principal.username)
         return db_image.image_id
     except SQLAlchemyError as e:
         db.rollback() # 데이터베이스 롤백
@@ -91,45 +316,126 @@ def create_userimage(db: Session, image_create: ImageCreate, username: str):
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
-def get_user_image(db: Session, username: str):
+def _resolve_avatars(db: Session, usernames: list):
+    # username -> {"original": 원본 주소, "thumb.webp": 파생본 주소, ...}
+    # 이미지가 없는 사용자도 빈 dict 로 캐시하여 다시 조회하지 않습니다 (create_userimage 에서 무효화).
+    avatars = {}
+    misses = []
+    for username in set(usernames):
+        cached = avatar_cache.get(username)
+        if cached is None:
+            misses.append(username)
+        elif cached:
+            avatars[username] = cached
+    if not misses:
+        return avatars
+    try:
+        rows = (
+            db.query(
+                User.username,
+                Image.image_address,
+                ImageVariant.variant,
+                ImageVariant.format,
+                ImageVariant.image_address,
+            )
+            .join(UserImage, UserImage.user_id == User.uid)
+            .join(Image, Image.image_id == UserImage.image_id)
+            .outerjoin(ImageVariant, ImageVariant.image_id == Image.image_id)
+            .filter(User.username.in_(misses))
+            .all()
+        )
+    except SQLAlchemyError as e:
+        db.rollback()  # 데이터베이스 롤백
+        print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+        raise HTTPException(status_code=500, detail="Internal Server Error")
+    loaded = {}
+    for username, image_address, variant, image_format, variant_address in rows:
+        entry = loaded.setdefault(username, {"original": image_address})
+        if variant is not None:
+            entry[variant_key(variant, image_format)] = variant_address
+    for username in misses:
+        avatar_cache.set(username, loaded.get(username, {}))
+    avatars.update(loaded)
+    return avatars
+
+
+def _pick_address(entry: dict, size: str = None, image_format: str = "webp"):
+    # 요청한 파생본이 없으면 원본 주소를 반환합니다.
+    if size is None:
+        return entry["original"]
+    return entry.get(variant_key(size, image_format), entry["original"])
+
+
+def get_user_image(
+    db: Session, username: str, size: str = None, image_format: str = "webp"
+):
     """
     특정 사용자의 이미지 주소를 조회합니다.
 
+    캐시(`avatar_cache`)를 먼저 확인하고, 없으면 User/UserImage/Image/ImageVariant 를 한 번의
+    조인 쿼리로 조회한 뒤 원본과 파생본 주소를 함께 캐시에 저장합니다.
+
     Args:
         db (Session): SQLAlchemy 데이터베이스 세션.
         username (str): 조회할 사용자 이름.
+        size (str, optional): 파생본 이름 (예: avatar, thumb). 생략하면 원본을 반환합니다.
+        image_format (str): 파생본 포맷 (webp 또는 jpeg).
 
     Returns:
-        str: 사용자의 이미지 주소.
+        str or None: 사용자의 이미지 주소 또는 이미지가 없을 경우 None.
 
     Raises:
         HTTPException: 데이터베이스 작업 중 오류가 발생한 경우.
     """
-    try:
-        user_image_id = db.query(User).filter(User.username == username).first().uid
-        image_id = (
-            db.query(UserImage)
-            .filter(UserImage.user_id == user_image_id)
-            .first()
-            .image_id
-        )
-        image_address = (
-            db.query(Image).filter(Image.image_id == image_id).first().image_address
+    entry = _resolve_avatars(db, [username]).get(username)
+    if entry is None:
+        return None
+    return _pick_address(entry, size, image_format)
+
+
+def get_user_images(
+    db: Session, usernames: list, size: str = None, image_format: str = "webp"
+):
+    """
+    여러 사용자의 이미지 주소를 한 번에 조회합니다.
+
+    캐시에 있는 사용자는 캐시에서 가져오고, 나머지는 한 번의 조인 쿼리로 조회해 캐시에 저장합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        usernames (list): 조회할 사용자 이름 목록 (최대 `MAX_USERNAMES` 개).
+        size (str, optional): 파생본 이름. 생략하면 원본을 반환합니다.
+        image_format (str): 파생본 포맷 (webp 또는 jpeg).
+
+    Returns:
+        dict: 사용자 이름을 키로, 이미지 주소를 값으로 하는 딕셔너리.
+            이미지가 없는 사용자는 포함되지 않습니다.
+
+    Raises:
+        HTTPException: 사용자 수가 제한을 넘으면 400, 데이터베이스 작업 중 오류가 발생하면 500.
+    """
+    if len(usernames) > MAX_USERNAMES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"usernames는 최대 {MAX_USERNAMES}개까지 조회할 수 있습니다.",
         )
-        return image_address
-    except SQLAlchemyError as e:
-        db.rollback()  # 데이터베이스 롤백
-        print(f"An error occurred: {e}") # 오류 메시지 출력 또는 로깅
-        raise HTTPException(status_code=500, detail="Internal Server Error")
+    return {
+        username: _pick_address(entry, size, image_format)
+        for username, entry in _resolve_avatars(db, usernames).items()
+    }
 
 
-def get_content_image(db: Session, content_id: str):
+def get_content_image(
+    db: Session, content_id: int, size: str = None, image_format: str = "webp"
+):
     """
     특정 콘텐츠와 연결된 모든 이미지 주소를 조회합니다.
 
     Args:
         db (Session): SQLAlchemy 데이터베이스 세션.
-        content_id (str): 조회할 콘텐츠의 고유 ID.
+        content_id (int): 조회할 콘텐츠의 고유 ID.
+        size (str, optional): 파생본 이름. 생략하면 원본을 반환합니다.
+        image_format (str): 파생본 포맷 (webp 또는 jpeg).
 
     Returns:
         list: 콘텐츠와 연결된 이미지 주소 목록.
@@ -137,18 +443,177 @@ def get_content_image(db: Session, content_id: str):
     Raises:
         HTTPException: 데이터베이스 작업 중 오류가 발생한 경우.
     """
-    try:
-        image_address = []
-        results = (
-            db.query(ContentImage).filter(ContentImage.content_id == content_id).all()
+    return get_content_images(db, [content_id], size, image_format).get(content_id, [])
+
+
+def get_content_images(
+    db: Session, content_ids: list, size: str = None, image_format: str = "webp"
+):
+    """
+    여러 콘텐츠와 연결된 이미지 주소를 한 번의 조인 쿼리로 조회합니다.
+
+    `size` 를 지정하면 해당 파생본 주소를 반환하며, 파생본이 없는 이미지는 원본 주소를 반환합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        content_ids (list): 조회할 콘텐츠 ID 목록 (최대 `MAX_CONTENT_IDS` 개).
+        size (str, optional): 파생본 이름 (예: thumb, medium). 생략하면 원본을 반환합니다.
+        image_format (str): 파생본 포맷 (webp 또는 jpeg).
+
+    Returns:
+        dict: 콘텐츠 ID를 키로, 연결된 이미지 주소 목록을 값으로 하는 딕셔너리.
+            이미지가 없는 콘텐츠는 포함되지 않습니다.
+
+    Raises:
+        HTTPException: ID 개수가 제한을 넘으면 400, 데이터베이스 작업 중 오류가 발생하면 500.
+    """
+    if len(content_ids) > MAX_CONTENT_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"content_ids는 최대 {MAX_CONTENT_IDS}개까지 조회할 수 있습니다.",
         )
-        for result in results:
-            image_id = result.image_id
-            image_address.append(
-                db.query(Image).filter(Image.image_id == image_id).first().image_address
+    if not content_ids:
+        return {}
+    try:
+        if size is None:
+            query = db.query(ContentImage.content_id, Image.image_address).join(
+                Image, Image.image_id == ContentImage.image_id
             )
-        return image_address
+        else:
+            query = (
+                db.query(
+                    ContentImage.content_id,
+                    func.coalesce(ImageVariant.image_address, Image.image_address),
+                )
+                .join(Image, Image.image_id == ContentImage.image_id)
+                .outerjoin(
+                    ImageVariant,
+                    and_(
+                        ImageVariant.image_id == Image.image_id,
+                        ImageVariant.variant == size,
+                        ImageVariant.format == image_format,
+                    ),
+                )
+            )
+        rows = (
+            query.filter(ContentImage.content_id.in_(set(content_ids)))
+            .order_by(ContentImage.content_id, ContentImage.id)
+            .all()
+        )
+        content_images = {}
+        for content_id, image_address in rows:
+            content_images.setdefault(content_id, []).append(image_address)
+        return content_images
     except SQLAlchemyError as e:
         db.rollback()  # 데이터베이스 롤백
         print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
         raise HTTPException(status_code=500, detail="Internal Server Error")
+
+
+async def get_existing_hashes_async(db: AsyncSession, content_hashes: list):
+    """
+    `get_existing_hashes` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        content_hashes (list): 확인할 SHA-256 해시 목록.
+
+    Returns:
+        set: 이미 `Images` 행이 있는 해시 집합.
+    """
+    return await db.run_sync(lambda session: get_existing_hashes(session, content_hashes))
+
+
+async def create_contentimage_async(db: AsyncSession, image_create: ImageCreate):
+    """
+    `create_contentimage` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        image_create (ImageCreate): 생성할 이미지의 데이터.
+
+    Returns:
+        int: 생성된 이미지의 고유 ID.
+    """
+    return await db.run_sync(lambda session: create_contentimage(session, image_create))
+
+
+async def create_contentimages_async(db: AsyncSession, image_creates: list):
+    """
+    `create_contentimages` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        image_creates (list): 생성할 이미지 데이터(ImageCreate) 목록.
+
+    Returns:
+        list: 입력 순서대로의 이미지 고유 ID 목록.
+    """
+    return await db.run_sync(lambda session: create_contentimages(session, image_creates))
+
+
+async def create_userimage_async(
+    db: AsyncSession, image_create: ImageCreate, principal: Principal
+):
+    """
+    `create_userimage` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        image_create (ImageCreate): 생성할 이미지의 데이터.
+        principal (Principal): 이미지를 연결할 사용자.
+
+    Returns:
+        int: 생성 또는 업데이트된 이미지의 고유 ID.
+    """
+    return await db.run_sync(
+        lambda session: create_userimage(session, image_create, principal)
+    )
+
+
+async def get_user_image_async(
+    db: AsyncSession, username: str, size: str = None, image_format: str = "webp"
+):
+    """
+    `get_user_image` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        username (str): 조회할 사용자 이름.
+        size (str, optional): 파생본 이름.
+        image_format (str): 파생본 포맷.
+
+    Returns:
+        str: 사용자의 이미지 주소.
+    """
+    return await db.run_sync(
+        lambda session: get_user_image(session, username, size, image_format)
+    )
+
+
+async def get_content_image_async(db: AsyncSession, content_id: int):
+    """
+    `get_content_image` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        content_id (int): 조회할 콘텐츠의 고유 ID.
+
+    Returns:
+        list: 콘텐츠와 연결된 이미지 주소 목록.
+    """
+    return await db.run_sync(lambda session: get_content_image(session, content_id))
+
+
+async def get_content_images_async(db: AsyncSession, content_ids: list):
+    """
+    `get_content_images` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        content_ids (list): 조회할 콘텐츠 ID 목록.
+
+    Returns:
+        dict: 콘텐츠 ID별 이미지 주소 목록.
+    """
+    return await db.run_sync(lambda session: get_content_images(session, content_ids))
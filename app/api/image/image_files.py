@@ -0,0 +1,262 @@
+"""
+업로드된 이미지 파일 전송 모듈.
+
+이 모듈은 업로드 디렉토리의 이미지 파일을 조건부 요청(ETag/Last-Modified), Range 요청과 함께
+전송하는 응답을 제공합니다. 파일 전체를 메모리에 올리지 않으며, 서버가 ASGI zero-copy 확장을
+지원하면 sendfile 로, 그렇지 않으면 스레드 풀에서 고정 크기 청크로 읽어 전송합니다.
+`IMAGE_ACCEL_REDIRECT_PREFIX` 가 설정되면 전송을 nginx(X-Accel-Redirect)에 위임합니다.
+
+Content-Type 은 허용된 이미지 확장자(`IMAGE_MEDIA_TYPES`)에서만 정하고 그 외 파일은
+`application/octet-stream` 으로 보내며, 브라우저가 내용을 추측하지 않도록 모든 응답에
+`X-Content-Type-Options: nosniff` 를 붙입니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import os
+import re
+import stat
+from email.utils import formatdate, parsedate_to_datetime
+
+from dotenv import load_dotenv
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import Response
+
+load_dotenv()
+
+IMAGE_ACCEL_REDIRECT_PREFIX = os.environ.get("IMAGE_ACCEL_REDIRECT_PREFIX")
+CHUNK_SIZE = 64 * 1024
+
+# 내용 해시(SHA-256)로 이름 붙은 파일(원본과 파생본)은 내용이 바뀌지 않습니다.
+IMMUTABLE_NAME = re.compile(r"^[0-9a-f]{64}(_[a-z]+)?\.[a-z0-9]+$")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+MUTABLE_CACHE_CONTROL = "public, no-cache"
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+# 업로드와 파생본 생성이 만드는 확장자만 이미지로 전송합니다.
+IMAGE_MEDIA_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+}
+DEFAULT_MEDIA_TYPE = "application/octet-stream"
+
+
+class ImageFileResponse(Response):
+    """
+    파일의 전체 또는 일부 구간을 스트리밍하는 응답.
+
+    Attributes:
+        path (str): 전송할 파일 경로.
+        offset (int): 전송 시작 위치(바이트).
+        count (int): 전송할 바이트 수.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        offset: int,
+        count: int,
+        status_code: int,
+        headers: dict,
+        media_type: str,
+        send_body: bool = True,
+    ):
+        self.path = path
+        self.offset = offset
+        self.count = count
+        self.send_body = send_body
+        self.status_code = status_code
+        self.media_type = media_type
+        self.background = None
+        self.init_headers(headers)
+
+    async def __call__(self, scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        if not self.send_body or self.count == 0:
+            await send({"type": "http.response.body", "body": b""})
+            return
+        f = await run_in_threadpool(open, self.path, "rb")
+        try:
+            if "http.response.zerocopy" in scope.get("extensions", {}):
+                await send(
+                    {
+                        "type": "http.response.zerocopy",
+                        "file": f,
+                        "offset": self.offset,
+                        "count": self.count,
+                    }
+                )
+                return
+            await run_in_threadpool(f.seek, self.offset)
+            remaining = self.count
+            while remaining > 0:
+                chunk = await run_in_threadpool(f.read, min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": remaining > 0,
+                    }
+                )
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b""})
+        finally:
+            await run_in_threadpool(f.close)
+
+
+def resolve_upload_path(upload_dir: str, file_path: str):
+    """
+    요청 경로를 업로드 디렉토리 안의 실제 파일 경로로 변환합니다.
+
+    Args:
+        upload_dir (str): 업로드 루트 디렉토리.
+        file_path (str): 업로드 디렉토리 기준 상대 경로.
+
+    Returns:
+        str: 실제 파일 경로.
+
+    Raises:
+        HTTPException: 업로드 디렉토리 밖을 가리키거나 임시 파일인 경우 404 상태 코드 반환.
+    """
+    root = os.path.realpath(upload_dir)
+    full_path = os.path.realpath(os.path.join(root, file_path))
+    if not full_path.startswith(root + os.sep) or full_path.endswith(".part"):
+        raise HTTPException(status_code=404, detail="Image not found")
+    return full_path
+
+
+def _etag(name: str, st: os.stat_result):
+    if IMMUTABLE_NAME.match(name):
+        return f'"{os.path.splitext(name)[0]}"'
+    return f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def _not_modified(request: Request, etag: str, st: os.stat_result):
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return int(st.st_mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _parse_range(range_header: str, size: int):
+    """
+    단일 구간 Range 헤더를 해석합니다.
+
+    Args:
+        range_header (str): Range 헤더 값.
+        size (int): 파일 크기(바이트).
+
+    Returns:
+        tuple or None: (시작, 끝) 바이트 위치(끝 포함). 여러 구간이거나 형식이 다르면 None.
+
+    Raises:
+        ValueError: 만족할 수 없는 구간인 경우.
+    """
+    match = RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None
+    start, end = match.groups()
+    if start == "" and end == "":
+        return None
+    if start == "":
+        length = int(end)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        return max(size - length, 0), size - 1
+    start = int(start)
+    end = size - 1 if end == "" else min(int(end), size - 1)
+    if start >= size or start > end:
+        raise ValueError("unsatisfiable range")
+    return start, end
+
+
+async def serve_image(request: Request, upload_dir: str, file_path: str):
+    """
+    업로드된 이미지 파일을 전송하는 응답을 만듭니다.
+
+    Args:
+        request (Request): 요청 객체 (조건부/Range 헤더 확인용).
+        upload_dir (str): 업로드 루트 디렉토리.
+        file_path (str): 업로드 디렉토리 기준 상대 경로.
+
+    Returns:
+        Response: 200/206 파일 응답, 304 Not Modified 또는 416 Range Not Satisfiable 응답.
+
+    Raises:
+        HTTPException: 파일이 없으면 404 상태 코드 반환.
+    """
+    full_path = resolve_upload_path(upload_dir, file_path)
+    try:
+        st = await run_in_threadpool(os.stat, full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise HTTPException(status_code=404, detail="Image not found")
+    if not stat.S_ISREG(st.st_mode):
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    name = os.path.basename(full_path)
+    etag = _etag(name, st)
+    headers = {
+        "etag": etag,
+        "last-modified": formatdate(st.st_mtime, usegmt=True),
+        "cache-control": IMMUTABLE_CACHE_CONTROL
+        if IMMUTABLE_NAME.match(name)
+        else MUTABLE_CACHE_CONTROL,
+        "accept-ranges": "bytes",
+        "x-content-type-options": "nosniff",
+    }
+    if _not_modified(request, etag, st):
+        return Response(status_code=304, headers=headers)
+
+    if IMAGE_ACCEL_REDIRECT_PREFIX:
+        # nginx 가 sendfile 과 Range 처리를 담당합니다.
+        relative_path = os.path.relpath(full_path, os.path.realpath(upload_dir))
+        headers["x-accel-redirect"] = (
+            f"{IMAGE_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{relative_path}"
+        )
+        return Response(status_code=200, headers=headers)
+
+    media_type = IMAGE_MEDIA_TYPES.get(os.path.splitext(name)[1].lower(), DEFAULT_MEDIA_TYPE)
+    size = st.st_size
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range == etag):
+        try:
+            byte_range = _parse_range(range_header, size)
+        except ValueError:
+            headers["content-range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+
+    send_body = request.method != "HEAD"
+    if byte_range is None:
+        headers["content-length"] = str(size)
+        return ImageFileResponse(
+            full_path, 0, size, 200, headers, media_type, send_body=send_body
+        )
+    start, end = byte_range
+    headers["content-range"] = f"bytes {start}-{end}/{size}"
+    headers["content-length"] = str(end - start + 1)
+    return ImageFileResponse(
+        full_path, start, end - start + 1, 206, headers, media_type, send_body=send_body
+    )
@@ -0,0 +1,301 @@
+"""
+참조되지 않는 이미지 정리(GC) 모듈.
+
+콘텐츠 이미지는 업로드 시점에 `Images` 행과 파일이 만들어지고 글을 작성할 때 연결되므로, 업로드 후
+글을 작성하지 않으면 어디에서도 참조되지 않는 행과 파일이 남습니다. 아바타 교체나 콘텐츠 영구 삭제도
+참조 수만 감소시키므로(`release_images`), 참조되지 않는 이미지는 모두 이 모듈이 삭제합니다.
+이 모듈은 두 가지를 정리합니다.
+
+1. `Users_Images`/`Contents_Images` 어디에서도 참조되지 않고 마지막 사용(생성 또는 중복 제거로 재사용,
+   `last_used_at`) 후 유예 기간(`IMAGE_GC_GRACE_HOURS`)이 지난 `Images` 행과 파생본 행, 그리고 그 파일.
+2. 업로드 디렉토리(`UPLOAD_DIR`)에서 어떤 `Images`/`Images_Variants` 행도 가리키지 않고 유예 기간 동안
+   수정되지 않은 파일 (실패한 업로드의 임시 파일 포함).
+
+두 단계 모두 `IMAGE_GC_BATCH_SIZE` 개씩 짧은 트랜잭션으로 처리하고 배치 사이에
+`IMAGE_GC_BATCH_PAUSE_SECONDS` 만큼 쉬어 데이터베이스와 디스크 부하를 제한합니다. 행은
+`FOR UPDATE SKIP LOCKED` 로 잠그므로 같은 이미지를 연결하거나 중복 제거로 재사용하는 중인 요청과 겹치면
+해당 이미지는 건너뜁니다.
+
+업로드 중 같은 내용의 파일이 이미 있으면 파일의 수정 시각을 갱신하므로(`_commit_file`), 최근에 다시
+업로드된 파일은 행이 정리되더라도 지우지 않습니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import asyncio
+import os
+import time
+
+import pendulum
+from dotenv import load_dotenv
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import exists, func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from api.image.image_router import UPLOAD_DIR
+from api.image.image_schema import ImageGCReport
+from config.database_init import SessionLocal
+from models import ContentImage, Image, ImageVariant, UserImage
+
+load_dotenv()
+
+IMAGE_GC_GRACE_HOURS = float(os.environ.get("IMAGE_GC_GRACE_HOURS", "24"))
+IMAGE_GC_BATCH_SIZE = int(os.environ.get("IMAGE_GC_BATCH_SIZE", "200"))
+IMAGE_GC_BATCH_PAUSE_SECONDS = float(os.environ.get("IMAGE_GC_BATCH_PAUSE_SECONDS", "0.5"))
+# 이미지 행 정리 주기. 참조가 해제된 이미지는 이 작업으로만 삭제되므로 기본으로 켜져 있습니다.
+# 0 이면 주기 실행을 하지 않고 `python manage.py image-gc` 로만 실행합니다.
+IMAGE_GC_INTERVAL_SECONDS = float(os.environ.get("IMAGE_GC_INTERVAL_SECONDS", "3600"))
+
+
+def _referenced_addresses(db: Session, paths: list):
+    # 원본 또는 파생본 행이 가리키는 경로만 반환합니다.
+    if not paths:
+        return set()
+    referenced = {
+        row.image_address
+        for row in db.query(Image.image_address).filter(Image.image_address.in_(paths))
+    }
+    referenced.update(
+        row.image_address
+        for row in db.query(ImageVariant.image_address).filter(
+            ImageVariant.image_address.in_(paths)
+        )
+    )
+    return referenced
+
+
+def _remove_stale_files(paths, cutoff: float, dry_run: bool = False):
+    # 유예 기간 안에 수정된 파일은 남기고, 지운(또는 지울) 파일 수와 바이트 수를 반환합니다.
+    removed = 0
+    reclaimed = 0
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            if stat.st_mtime >= cutoff:
+                continue
+            if not dry_run:
+                os.unlink(path)
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            print(f"Failed to remove file {path}: {e}")
+            continue
+        removed += 1
+        reclaimed += stat.st_size
+    return removed, reclaimed
+
+
+def collect_orphan_images(
+    db: Session,
+    grace_hours: float = IMAGE_GC_GRACE_HOURS,
+    batch_size: int = IMAGE_GC_BATCH_SIZE,
+    pause_seconds: float = IMAGE_GC_BATCH_PAUSE_SECONDS,
+    dry_run: bool = False,
+):
+    """
+    어디에서도 참조되지 않고 유예 기간이 지난 이미지 행과 파생본 행, 파일을 삭제합니다.
+
+    참조 여부는 `ref_count` 가 아니라 관계 테이블의 `NOT EXISTS` 로 판단하므로, 참조 수가 맞지 않는
+    오래된 행도 정리됩니다. 유예 기간은 `last_used_at` (없으면 `created_at`) 기준이므로, 오래 전에 만들어진
+    행이라도 최근 업로드에서 재사용되었다면 남겨 둡니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        grace_hours (float): 마지막 사용 후 유예 기간(시간).
+        batch_size (int): 한 번에 처리할 이미지 수.
+        pause_seconds (float): 배치 사이 대기 시간(초).
+        dry_run (bool): True 이면 삭제하지 않고 대상만 집계합니다.
+
+    Returns:
+        ImageGCReport: 정리한 이미지 행 수, 파일 수, 회수한 바이트 수.
+    """
+    cutoff = time.time() - grace_hours * 3600
+    # `Images.last_used_at`/`created_at` 은 서울 시간 기준으로 저장됩니다.
+    used_before = pendulum.from_timestamp(cutoff, tz="Asia/Seoul")
+    report = ImageGCReport()
+    last_id = 0
+    while True:
+        query = (
+            db.query(Image.image_id, Image.image_address)
+            .filter(
+                Image.image_id > last_id,
+                func.coalesce(Image.last_used_at, Image.created_at) < used_before,
+                ~exists().where(UserImage.image_id == Image.image_id),
+                ~exists().where(ContentImage.image_id == Image.image_id),
+            )
+            .order_by(Image.image_id)
+            .limit(batch_size)
+        )
+        if not dry_run:
+            query = query.with_for_update(skip_locked=True)
+        try:
+            rows = query.all()
+            if not rows:
+                db.rollback()
+                return report
+            image_ids = [row.image_id for row in rows]
+            paths = [row.image_address for row in rows]
+            paths.extend(
+                row.image_address
+                for row in db.query(ImageVariant.image_address).filter(
+                    ImageVariant.image_id.in_(image_ids)
+                )
+            )
+            if dry_run:
+                db.rollback()
+            else:
+                db.query(ImageVariant).filter(ImageVariant.image_id.in_(image_ids)).delete(
+                    synchronize_session=False
+                )
+                db.query(Image).filter(Image.image_id.in_(image_ids)).delete(
+                    synchronize_session=False
+                )
+                # 같은 경로를 가리키는 다른 행이 남아 있으면 파일은 지우지 않습니다.
+                shared = _referenced_addresses(db, paths)
+                paths = [path for path in paths if path not in shared]
+                db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()  # 데이터베이스 롤백
+            print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+            return report
+
+        removed, reclaimed = _remove_stale_files(paths, cutoff, dry_run)
+        report.images += len(rows)
+        report.files += removed
+        report.bytes += reclaimed
+        last_id = rows[-1].image_id
+        if len(rows) < batch_size:
+            return report
+        time.sleep(pause_seconds)
+
+
+def _walk_files(root: str):
+    # 하위 디렉토리를 재귀적으로 순회하며 파일 경로를 하나씩 반환합니다.
+    try:
+        entries = os.scandir(root)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.path
+
+
+def collect_orphan_files(
+    db: Session,
+    upload_dir: str = UPLOAD_DIR,
+    grace_hours: float = IMAGE_GC_GRACE_HOURS,
+    batch_size: int = IMAGE_GC_BATCH_SIZE,
+    pause_seconds: float = IMAGE_GC_BATCH_PAUSE_SECONDS,
+    dry_run: bool = False,
+):
+    """
+    업로드 디렉토리에서 어떤 이미지 행도 가리키지 않는 파일을 삭제합니다.
+
+    디렉토리를 한 번 순회하면서 유예 기간 동안 수정되지 않은 파일만 `batch_size` 개씩 모아, 한 번의
+    조회로 행이 있는지 확인합니다. 업로드 중인 임시 파일과 행이 커밋되기 전의 새 파일은 유예 기간 안에
+    있으므로 지우지 않습니다. 경로는 업로드 시 저장한 `image_address` 문자열과 그대로 비교하므로
+    `upload_dir` 는 업로드에 사용한 `UPLOAD_DIR` 와 같아야 합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        upload_dir (str): 업로드 루트 디렉토리.
+        grace_hours (float): 마지막 수정 후 유예 기간(시간).
+        batch_size (int): 한 번에 확인할 파일 수.
+        pause_seconds (float): 배치 사이 대기 시간(초).
+        dry_run (bool): True 이면 삭제하지 않고 대상만 집계합니다.
+
+    Returns:
+        ImageGCReport: 정리한 파일 수와 회수한 바이트 수.
+    """
+    cutoff = time.time() - grace_hours * 3600
+    report = ImageGCReport()
+    batch = []
+
+    def flush():
+        try:
+            referenced = _referenced_addresses(db, batch)
+            db.rollback()  # 조회 트랜잭션을 배치마다 끝냅니다.
+        except SQLAlchemyError as e:
+            db.rollback()  # 데이터베이스 롤백
+            print(f"An error occurred: {e}")  # 오류 메시지 출력 또는 로깅
+            return False
+        removed, reclaimed = _remove_stale_files(
+            [path for path in batch if path not in referenced], cutoff, dry_run
+        )
+        report.files += removed
+        report.bytes += reclaimed
+        batch.clear()
+        return True
+
+    for path in _walk_files(upload_dir):
+        try:
+            if os.stat(path).st_mtime >= cutoff:
+                continue
+        except FileNotFoundError:
+            continue
+        batch.append(path)
+        if len(batch) >= batch_size:
+            if not flush():
+                return report
+            time.sleep(pause_seconds)
+    if batch:
+        flush()
+    return report
+
+
+def collect_garbage(db: Session, scan_files: bool = True, **options):
+    """
+    참조되지 않는 이미지 행을 정리한 뒤, 필요하면 업로드 디렉토리의 고아 파일도 정리합니다.
+
+    Args:
+        db (Session): SQLAlchemy 데이터베이스 세션.
+        scan_files (bool): 업로드 디렉토리를 순회해 행이 없는 파일도 정리할지 여부.
+        **options: `collect_orphan_images`/`collect_orphan_files` 에 전달할 인자
+            (`grace_hours`, `batch_size`, `pause_seconds`, `dry_run`).
+
+    Returns:
+        ImageGCReport: 합산한 정리 결과.
+    """
+    report = collect_orphan_images(db, **options)
+    if scan_files:
+        files_report = collect_orphan_files(db, **options)
+        report.files += files_report.files
+        report.bytes += files_report.bytes
+    return report
+
+
+def collect_garbage_now(scan_files: bool = False):
+    """
+    새 세션으로 `collect_garbage` 를 실행합니다.
+
+    Args:
+        scan_files (bool): 업로드 디렉토리 순회 여부. 주기 실행에서는 비용이 큰 순회를 생략하고
+            `python manage.py image-gc` 로 실행합니다.
+    """
+    db = SessionLocal(info={"route": "image gc"})
+    try:
+        report = collect_garbage(db, scan_files=scan_files)
+    finally:
+        db.close()
+    print(
+        f"Image GC: {report.images} rows, {report.files} files, {report.bytes} bytes reclaimed"
+    )
+    return report
+
+
+async def collect_garbage_periodically(interval: float = IMAGE_GC_INTERVAL_SECONDS):
+    """
+    주기적으로 참조되지 않는 이미지 행과 파일을 정리합니다. `IMAGE_GC_INTERVAL_SECONDS` 가 0 보다 크면
+    애플리케이션 시작 시 백그라운드 작업으로 실행됩니다.
+
+    Args:
+        interval (float): 실행 간격(초).
+    """
+    while True:
+        await asyncio.sleep(interval)
+        await run_in_threadpool(collect_garbage_now)
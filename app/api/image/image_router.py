@@ -7,69 +7,223 @@
     kimdonghyeok
 """
 
+import hashlib
 import os
-from datetime import datetime
-from typing import List
+import tempfile
+from typing import List, Optional
 
+from dotenv import load_dotenv
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from starlette import status
+from starlette.requests import Request
 
-from api.image import image_crud
-from api.image.image_schema import ImageCreate
+from api.image import image_crud, image_files, image_variants
+from api.image.image_schema import ImageCreate, SavedFile, UserImageBatch
 from api.user.user_router import get_current_user
-from config.database_init import get_db
+from api.user.user_schema import Principal
+from config import metrics
+from config.database_init import DB_ASYNC, get_db, get_route_db
+from config.fast_json import ROUTE_CLASS
 
-ALLOWED_EXTENSIONS = {"jpg", "jpeg", "png", "gif"}
+load_dotenv()
+
+# 업로드를 허용하는 확장자. 내용의 시그니처로 판별한 확장자만 허용합니다.
+ALLOWED_EXTENSIONS = {"jpg", "jpeg", "png", "gif", "webp"}
+UPLOAD_DIR = os.environ.get("UPLOAD_DIR", "/uploads/")
+UPLOAD_MAX_BYTES = int(os.environ.get("UPLOAD_MAX_BYTES", str(20 * 1024 * 1024)))
+UPLOAD_CHUNK_SIZE = int(os.environ.get("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+IMAGE_SIGNATURES = [
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+    (b"RIFF", ".webp"),
+]
+VARIANT_SIZE_PATTERN = f"^({'|'.join(image_variants.VARIANT_SIZES)})$"
+VARIANT_FORMAT_PATTERN = f"^({'|'.join(image_variants.VARIANT_FORMATS)})$"
 router = APIRouter(
     prefix="/api",
+    route_class=ROUTE_CLASS,
 )
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/user/token")
 
 
-async def save_file(file: UploadFile, upload_dir: str = "/uploads/"):
+def _write_chunk(f, digest, chunk: bytes):
+    # hashlib 과 파일 쓰기 모두 GIL 을 놓으므로 스레드 풀에서 함께 실행합니다.
+    digest.update(chunk)
+    f.write(chunk)
+
+
+def _discard(path: str):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _sniff_extension(head: bytes):
+    """
+    파일 앞부분의 시그니처로 확장자를 결정합니다.
+
+    같은 내용은 항상 같은 저장 경로를 갖도록, 업로드 파일명이 아니라 내용에서 판별한 확장자만 사용합니다.
+    파일명의 확장자를 믿으면 HTML/SVG 가 그대로 저장되고 같은 출처에서 전송될 수 있습니다.
+
+    Args:
+        head (bytes): 파일의 첫 청크.
+
+    Returns:
+        str or None: 점(.)을 포함한 소문자 확장자. 허용된 이미지 형식이 아니면 None.
     """
-    파일을 지정된 디렉토리에 저장합니다.
+    for signature, extension in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            if extension == ".webp" and head[8:12] != b"WEBP":
+                continue
+            if extension[1:] in ALLOWED_EXTENSIONS:
+                return extension
+    return None
+
+
+def content_path(content_hash: str, extension: str, upload_dir: str = UPLOAD_DIR):
+    """
+    내용 해시로 파일 저장 경로를 만듭니다.
+
+    디렉토리 하나에 파일이 몰리지 않도록 해시 앞 두 글자로 하위 디렉토리를 나눕니다.
+
+    Args:
+        content_hash (str): 파일 내용의 SHA-256 해시.
+        extension (str): 점(.)을 포함한 확장자.
+        upload_dir (str): 업로드 루트 디렉토리.
+
+    Returns:
+        str: 파일 저장 경로.
+    """
+    return os.path.join(upload_dir, content_hash[:2], f"{content_hash}{extension}")
+
+
+def _commit_file(temp_path: str, saved_file_path: str):
+    # 같은 내용의 파일이 이미 있으면 다시 쓰지 않고 임시 파일만 지웁니다.
+    # 수정 시각을 갱신해 이미지 GC 가 방금 다시 업로드된 파일을 지우지 않도록 합니다.
+    try:
+        os.utime(saved_file_path)
+    except FileNotFoundError:
+        pass
+    else:
+        _discard(temp_path)
+        return
+    os.makedirs(os.path.dirname(saved_file_path), exist_ok=True)
+    os.replace(temp_path, saved_file_path)
+
+
+async def save_file(file: UploadFile, upload_dir: str = UPLOAD_DIR):
+    """
+    업로드된 파일을 청크 단위로 스트리밍하여 내용 주소 기반 경로에 저장합니다.
+
+    파일은 `UPLOAD_CHUNK_SIZE` 단위로 임시 파일에 기록되며, 디스크 쓰기는 스레드 풀에서
+    실행되어 이벤트 루프를 막지 않습니다. 기록하는 동안 SHA-256 해시와 크기를 계산하고,
+    `UPLOAD_MAX_BYTES` 를 넘거나 첫 청크가 허용된 이미지 형식(`ALLOWED_EXTENSIONS`)이 아니면 즉시
+    중단합니다. 완료되면 해시로 정해진 경로로 원자적으로
+    이동하며, 같은 내용의 파일이 이미 있으면 기존 파일을 그대로 사용합니다.
 
     Args:
         file (UploadFile): 업로드된 파일 객체.
         upload_dir (str): 파일이 저장될 디렉토리 경로.
 
     Returns:
-        str: 저장된 파일의 경로.
+        SavedFile: 저장된 파일의 경로, 해시, 크기.
 
     Raises:
-        HTTPException: 파일 저장 중 오류가 발생한 경우.
+        HTTPException: 파일이 너무 크면 413, 이미지 형식이 아니면 415, 파일 저장 중 오류가 발생하면
+            500 상태 코드 반환.
     """
+    digest = hashlib.sha256()
+    size = 0
+    extension = None
+    temp_path = None
     try:
-        # upload_dir = os.getcwd()+upload_dir
-        file_contents = await file.read()
-        _, file_extension = os.path.splitext(file.filename)
-        file_name = f"{datetime.now().strftime('%Y%m%d%H%M%S%f')}{file_extension}"
-        saved_file_path = os.path.join(upload_dir, file_name)  # 이미지를 저장할 경로
-        with open(saved_file_path, "wb") as f:
-            f.write(file_contents)
-        return saved_file_path
+        fd, temp_path = tempfile.mkstemp(dir=upload_dir, suffix=".part")
+        with os.fdopen(fd, "wb") as f:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if extension is None:
+                    extension = _sniff_extension(chunk[:16])
+                    if extension is None:
+                        raise HTTPException(
+                            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                            detail="jpg, png, gif, webp 이미지만 업로드할 수 있습니다.",
+                        )
+                size += len(chunk)
+                if size > UPLOAD_MAX_BYTES:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"파일 크기는 {UPLOAD_MAX_BYTES} 바이트를 넘을 수 없습니다.",
+                    )
+                await run_in_threadpool(_write_chunk, f, digest, chunk)
+        if extension is None:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="빈 파일은 업로드할 수 없습니다.",
+            )
+        content_hash = digest.hexdigest()
+        saved_file_path = content_path(content_hash, extension, upload_dir)
+        await run_in_threadpool(_commit_file, temp_path, saved_file_path)
+        metrics.observe_upload(size)
+        return SavedFile(
+            image_address=saved_file_path, content_hash=content_hash, size=size
+        )
+    except HTTPException:
+        await run_in_threadpool(_discard, temp_path)
+        raise
     except Exception as e:
+        if temp_path:
+            await run_in_threadpool(_discard, temp_path)
         print(f"Error reading file {file.filename}: {e}")
         raise HTTPException(
             status_code=500, detail=f"Failed to save file {file.filename}"
         )
 
 
+async def _existing_hashes(db, content_hashes: list):
+    if DB_ASYNC:
+        return await image_crud.get_existing_hashes_async(db, content_hashes)
+    return await run_in_threadpool(image_crud.get_existing_hashes, db, content_hashes)
+
+
+async def _image_creates(db, saved_files: list):
+    # 중복 제거로 재사용될 이미지는 파생본이 이미 있으므로, 새로 저장되는 내용만 파생본을 생성합니다.
+    existing = await _existing_hashes(db, [saved.content_hash for saved in saved_files])
+    variants_by_hash = {}
+    image_creates = []
+    for saved_file in saved_files:
+        variants = []
+        if saved_file.content_hash not in existing:
+            variants = variants_by_hash.get(saved_file.content_hash)
+            if variants is None:
+                variants = await image_variants.generate_variants(saved_file.image_address)
+                variants_by_hash[saved_file.content_hash] = variants
+        image_creates.append(ImageCreate(**saved_file.dict(), variants=variants))
+    return image_creates
+
+
 @router.post("/userimage")
 async def upload_userimage(
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_route_db),
     file: UploadFile = File(...),
 ):
     """
     사용자 이미지를 업로드하고 데이터베이스에 저장합니다.
 
+    저장 후 프로세스 풀에서 파생본(avatar/thumb/medium, webp/jpeg)을 생성해 함께 기록합니다. 같은 내용의
+    이미지가 이미 있으면 기존 행과 파생본을 재사용하므로 파생본을 생성하지 않습니다.
+
     Args:
-        current_user (dict): 현재 로그인된 사용자 정보.
-        db (Session): SQLAlchemy 데이터베이스 세션.
+        current_user (Principal): 현재 로그인된 사용자 정보.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
         file (UploadFile): 업로드된 파일 객체.
 
     Returns:
@@ -77,11 +231,19 @@ async def upload_userimage(
     """
     image_ids = []
     try:
-        saved_file_path = await save_file(file)
-        _image_create = ImageCreate(image_address=saved_file_path)
-        image_id = image_crud.create_userimage(
-            db=db, image_create=_image_create, username=current_user.username
-        )
+        saved_file = await save_file(file)
+        (_image_create,) = await _image_creates(db, [saved_file])
+        if DB_ASYNC:
+            image_id = await image_crud.create_userimage_async(
+                db=db, image_create=_image_create, principal=current_user
+            )
+        else:
+            image_id = await run_in_threadpool(
+                image_crud.create_userimage,
+                db=db,
+                image_create=_image_create,
+                principal=current_user,
+            )
         image_ids.append(image_id)
     except HTTPException as e:
         raise e
@@ -95,30 +257,38 @@ async def upload_userimage(
 
 @router.post("/contentimage")
 async def upload_contentimage(
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_route_db),
     files: List[UploadFile] = File(...),
 ):
     """
     콘텐츠와 연결된 이미지를 업로드하고 데이터베이스에 저장합니다.
 
+    저장 후 프로세스 풀에서 파생본(avatar/thumb/medium, webp/jpeg)을 생성해 함께 기록합니다. 같은 내용의
+    이미지가 이미 있으면 기존 행과 파생본을 재사용하므로 파생본을 생성하지 않습니다.
+
     Args:
-        current_user (dict): 현재 로그인된 사용자 정보.
-        db (Session): SQLAlchemy 데이터베이스 세션.
+        current_user (Principal): 현재 로그인된 사용자 정보.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
         files (List[UploadFile]): 업로드된 파일 객체의 리스트.
 
     Returns:
         dict: 업로드 결과 및 저장된 이미지 ID 목록.
     """
-    image_ids = []
-    for file in files:
-        try:
-            saved_file_path = await save_file(file)
-            _image_create = ImageCreate(image_address=saved_file_path)
-            image_id = image_crud.create_contentimage(db=db, image_create=_image_create)
-            image_ids.append(image_id)
-        except HTTPException as e:
-            raise e
+    try:
+        saved_files = [await save_file(file) for file in files]
+        image_creates = await _image_creates(db, saved_files)
+        # 모든 파일을 저장한 뒤 이미지 행은 한 번의 커밋으로 생성합니다.
+        if DB_ASYNC:
+            image_ids = await image_crud.create_contentimages_async(
+                db=db, image_creates=image_creates
+            )
+        else:
+            image_ids = await run_in_threadpool(
+                image_crud.create_contentimages, db=db, image_creates=image_creates
+            )
+    except HTTPException as e:
+        raise e
 
     return {
         "status_code": status.HTTP_200_OK,
@@ -129,21 +299,26 @@ async def upload_contentimage(
 
 @router.get("/userimage")
 def get_userimages(
-    current_user: dict = Depends(get_current_user), db: Session = Depends(get_db)
+    size: Optional[str] = Query(None, regex=VARIANT_SIZE_PATTERN),
+    image_format: str = Query("webp", alias="format", regex=VARIANT_FORMAT_PATTERN),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
 ):
     """
     현재 사용자의 이미지를 조회합니다.
 
     Args:
-        current_user (dict): 현재 로그인된 사용자 정보.
+        size (str, optional): 파생본 이름 (avatar, thumb, medium). 생략하면 원본을 반환합니다.
+        image_format (str): 파생본 포맷 (webp, jpeg).
+        current_user (Principal): 현재 로그인된 사용자 정보.
         db (Session): SQLAlchemy 데이터베이스 세션.
 
     Returns:
         dict: 사용자의 이미지 데이터.
     """
-    _username = current_user["username"]
+    _username = current_user.username
 
-    user_images = image_crud.get_user_image(db, _username)
+    user_images = image_crud.get_user_image(db, _username, size, image_format)
     if not user_images:
         raise HTTPException(status_code=404, detail="User images not found")
     return {
@@ -153,29 +328,61 @@ def get_userimages(
     }
 
 
+@router.post("/userimage/batch")
+def get_userimages_batch(
+    user_image_batch: UserImageBatch,
+    size: Optional[str] = Query(None, regex=VARIANT_SIZE_PATTERN),
+    image_format: str = Query("webp", alias="format", regex=VARIANT_FORMAT_PATTERN),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    여러 사용자의 이미지를 한 번에 조회합니다.
+
+    Args:
+        user_image_batch (UserImageBatch): 조회할 사용자 이름 목록 (최대 `image_crud.MAX_USERNAMES` 개).
+        size (str, optional): 파생본 이름 (avatar, thumb, medium). 생략하면 원본을 반환합니다.
+        image_format (str): 파생본 포맷 (webp, jpeg).
+        current_user (Principal): 현재 로그인된 사용자 정보.
+        db (Session): SQLAlchemy 데이터베이스 세션.
+
+    Returns:
+        dict: 사용자 이름별 이미지 주소. 이미지가 없는 사용자는 포함되지 않습니다.
+    """
+    user_images = image_crud.get_user_images(
+        db, user_image_batch.usernames, size, image_format
+    )
+    return {
+        "status_code": status.HTTP_200_OK,
+        "detail": "이미지 정보가 조회되었습니다",
+        "data": {"user_images": user_images},
+    }
+
+
 @router.get("/contentimage")
 def get_contentimages(
     content_ids: List[int] = Query(...),
-    current_user: dict = Depends(get_current_user),
+    size: Optional[str] = Query(None, regex=VARIANT_SIZE_PATTERN),
+    image_format: str = Query("webp", alias="format", regex=VARIANT_FORMAT_PATTERN),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """
     콘텐츠와 연결된 이미지를 조회합니다.
 
     Args:
-        content_ids (List[int]): 조회할 콘텐츠 ID 목록.
-        current_user (dict): 현재 로그인된 사용자 정보.
+        content_ids (List[int]): 조회할 콘텐츠 ID 목록 (최대 `image_crud.MAX_CONTENT_IDS` 개).
+        size (str, optional): 파생본 이름 (avatar, thumb, medium). 생략하면 원본을 반환합니다.
+        image_format (str): 파생본 포맷 (webp, jpeg).
+        current_user (Principal): 현재 로그인된 사용자 정보.
         db (Session): SQLAlchemy 데이터베이스 세션.
 
     Returns:
         dict: 각 콘텐츠 ID에 연결된 이미지 데이터.
     """
-    content_images_idx = {}
-    for content_id in content_ids:
-        content_images = image_crud.get_content_image(db, content_id)
-        if not content_images:
-            continue
-        content_images_idx[content_id] = content_images
+    content_images_idx = image_crud.get_content_images(
+        db, content_ids, size, image_format
+    )
     if content_images_idx == {}:
         raise HTTPException(status_code=404, detail="Content images not found")
     return {
@@ -183,3 +390,25 @@ def get_contentimages(
         "detail": "이미지 정보가 업로드 되었습니다",
         "data": {"content_images ": content_images_idx},
     }
+
+
+@router.api_route("/images/{file_path:path}", methods=["GET", "HEAD"])
+async def get_image_file(file_path: str, request: Request):
+    """
+    업로드된 이미지 파일을 전송합니다.
+
+    `image_address` 에서 업로드 디렉토리(`UPLOAD_DIR`)를 뺀 상대 경로로 요청합니다.
+    ETag/Last-Modified 기반 304 응답과 단일 구간 Range 요청(206)을 지원하며, 내용 해시로
+    이름 붙은 파일은 변경되지 않으므로 1년간 캐시하도록 응답합니다.
+
+    Args:
+        file_path (str): 업로드 디렉토리 기준 파일 경로.
+        request (Request): 요청 객체.
+
+    Returns:
+        Response: 이미지 파일 응답.
+
+    Raises:
+        HTTPException: 파일이 없는 경우 404 상태 코드 반환.
+    """
+    return await image_files.serve_image(request, UPLOAD_DIR, file_path)
@@ -7,17 +7,81 @@
     kimdonghyeok
 """
 
+from typing import List, Optional
+
 from pydantic import BaseModel
 
 
+class ImageVariantCreate(BaseModel):
+    """
+    이미지 파생본 생성 데이터 모델.
+
+    Attributes:
+        variant (str): 파생본 이름 (예: avatar, thumb, medium).
+        format (str): 이미지 포맷 (예: webp, jpeg).
+        image_address (str): 파생본 파일 경로.
+        width (int): 파생본 너비(px).
+        height (int): 파생본 높이(px).
+    """
+    variant: str
+    format: str
+    image_address: str
+    width: int
+    height: int
+
+
 class ImageCreate(BaseModel):
     """
     이미지 생성 요청 데이터 모델.
 
     Attributes:
         image_address (str): 저장된 이미지의 주소.
+        content_hash (str, optional): 이미지 내용의 SHA-256 해시.
+        size (int, optional): 이미지 파일 크기(바이트).
+        variants (List[ImageVariantCreate]): 업로드 시 생성된 파생본 목록.
     """
     image_address: str
+    content_hash: Optional[str] = None
+    size: Optional[int] = None
+    variants: List[ImageVariantCreate] = []
+
+
+class SavedFile(BaseModel):
+    """
+    디스크에 저장된 업로드 파일 정보 모델.
+
+    Attributes:
+        image_address (str): 저장된 파일 경로.
+        content_hash (str): 파일 내용의 SHA-256 해시 (16진수).
+        size (int): 파일 크기(바이트).
+    """
+    image_address: str
+    content_hash: str
+    size: int
+
+
+class ImageGCReport(BaseModel):
+    """
+    이미지 GC 결과 모델.
+
+    Attributes:
+        images (int): 삭제한 이미지 행 수.
+        files (int): 삭제한 파일 수 (원본, 파생본, 행이 없는 파일).
+        bytes (int): 회수한 디스크 용량(바이트).
+    """
+    images: int = 0
+    files: int = 0
+    bytes: int = 0
+
+
+class UserImageBatch(BaseModel):
+    """
+    여러 사용자의 이미지 일괄 조회 요청 데이터 모델.
+
+    Attributes:
+        usernames (List[str]): 조회할 사용자 이름 목록.
+    """
+    usernames: List[str]
 
 
 class Token(BaseModel):
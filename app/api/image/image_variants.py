@@ -0,0 +1,164 @@
+"""
+이미지 파생본(썸네일) 생성 모듈.
+
+이 모듈은 업로드된 원본 이미지로부터 정해진 크기와 포맷의 파생본을 만들어 원본 옆에 저장합니다.
+이미지 변환은 CPU 작업이므로 `ProcessPoolExecutor` 에서 실행되어 이벤트 루프와 GIL 을 점유하지 않습니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import asyncio
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+IMAGE_VARIANT_WORKERS = int(os.environ.get("IMAGE_VARIANT_WORKERS", "2"))
+
+# 파생본 이름 -> 최대 변 길이(px). avatar 는 정사각형으로 잘라냅니다.
+VARIANT_SIZES = {"avatar": 128, "thumb": 320, "medium": 1080}
+# 포맷 이름 -> (Pillow 포맷, 확장자)
+VARIANT_FORMATS = {"webp": ("WEBP", ".webp"), "jpeg": ("JPEG", ".jpg")}
+VARIANT_QUALITY = 80
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=IMAGE_VARIANT_WORKERS)
+    return _executor
+
+
+def variant_key(variant: str, image_format: str):
+    """
+    파생본을 구분하는 키를 만듭니다.
+
+    Args:
+        variant (str): 파생본 이름 (`VARIANT_SIZES` 의 키).
+        image_format (str): 포맷 이름 (`VARIANT_FORMATS` 의 키).
+
+    Returns:
+        str: "thumb.webp" 형식의 키.
+    """
+    return f"{variant}.{image_format}"
+
+
+def variant_path(source_path: str, variant: str, image_format: str):
+    """
+    원본 경로로부터 파생본 파일 경로를 만듭니다.
+
+    Args:
+        source_path (str): 원본 이미지 경로.
+        variant (str): 파생본 이름.
+        image_format (str): 포맷 이름.
+
+    Returns:
+        str: 파생본 파일 경로.
+    """
+    stem, _ = os.path.splitext(source_path)
+    return f"{stem}_{variant}{VARIANT_FORMATS[image_format][1]}"
+
+
+def _describe(variant: str, image_format: str, path: str, width: int, height: int):
+    return {
+        "variant": variant,
+        "format": image_format,
+        "image_address": path,
+        "width": width,
+        "height": height,
+    }
+
+
+def render_variants(source_path: str):
+    """
+    원본 이미지의 모든 파생본을 생성합니다. 워커 프로세스에서 실행됩니다.
+
+    같은 내용의 이미지가 다시 업로드되어 파생본 파일이 모두 존재하면, 변환 없이 기존 파일의
+    크기만 읽어 반환합니다.
+
+    Args:
+        source_path (str): 원본 이미지 경로.
+
+    Returns:
+        list: 파생본 정보(variant, format, image_address, width, height) 딕셔너리 목록.
+    """
+    from PIL import Image as PILImage
+    from PIL import ImageOps
+
+    targets = [
+        (variant, image_format, variant_path(source_path, variant, image_format))
+        for variant in VARIANT_SIZES
+        for image_format in VARIANT_FORMATS
+    ]
+    if all(os.path.exists(path) for _, _, path in targets):
+        variants = []
+        for variant, image_format, path in targets:
+            with PILImage.open(path) as existing:
+                variants.append(_describe(variant, image_format, path, *existing.size))
+        return variants
+
+    variants = []
+    with PILImage.open(source_path) as original:
+        original = ImageOps.exif_transpose(original)
+        for variant, max_side in VARIANT_SIZES.items():
+            if variant == "avatar":
+                resized = ImageOps.fit(original, (max_side, max_side))
+            else:
+                resized = original.copy()
+                resized.thumbnail((max_side, max_side))
+            for image_format, (pil_format, _) in VARIANT_FORMATS.items():
+                path = variant_path(source_path, variant, image_format)
+                image = resized
+                if pil_format == "JPEG" and image.mode not in ("RGB", "L"):
+                    image = image.convert("RGB")
+                # 같은 내용이 동시에 업로드되어도 서로의 임시 파일을 덮어쓰지 않도록 고유한 이름을 씁니다.
+                fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        image.save(f, pil_format, quality=VARIANT_QUALITY)
+                    os.replace(temp_path, path)
+                except BaseException:
+                    try:
+                        os.unlink(temp_path)
+                    except FileNotFoundError:
+                        pass
+                    raise
+                variants.append(
+                    _describe(variant, image_format, path, resized.width, resized.height)
+                )
+    return variants
+
+
+async def generate_variants(source_path: str):
+    """
+    프로세스 풀에서 파생본을 생성합니다.
+
+    이미지로 읽을 수 없는 파일 등 변환에 실패하면 빈 목록을 반환하며, 업로드 자체는 실패시키지 않습니다.
+    이 경우 조회 API 는 원본 주소를 반환합니다.
+
+    Args:
+        source_path (str): 원본 이미지 경로.
+
+    Returns:
+        list: 생성된 파생본 정보 딕셔너리 목록.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_get_executor(), render_variants, source_path)
+    except Exception as e:
+        print(f"Failed to render variants for {source_path}: {e}")
+        return []
+
+
+def shutdown():
+    """파생본 생성 워커 프로세스를 종료합니다."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
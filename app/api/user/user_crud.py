@@ -9,23 +9,24 @@
 
 import pendulum
 from fastapi import HTTPException
-from passlib.context import CryptContext
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from api.user.user_schema import UserCreate
 from models import User
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-
-def create_user(db: Session, user_create: UserCreate):
+def create_user(db: Session, user_create: UserCreate, hashed_password: str):
     """
     새로운 사용자를 생성하고 데이터베이스에 저장합니다.
 
+    비밀번호 해시는 호출 측에서 `password_pool` 로 미리 계산해 전달합니다.
+
     Args:
         db (Session): SQLAlchemy 데이터베이스 세션.
         user_create (UserCreate): 생성할 사용자 데이터.
+        hashed_password (str): bcrypt 로 해시된 비밀번호.
 
     Returns:
         User: 생성된 사용자 객체.
@@ -36,7 +37,7 @@ def create_user(db: Session, user_create: UserCreate):
     try:
         db_user = User(
             username=user_create.username,
-            password=pwd_context.hash(user_create.password1),
+            password=hashed_password,
             created_at=pendulum.now("Asia/Seoul"),
         )
         db.add(db_user)
@@ -76,3 +77,50 @@ def get_user(db: Session, username: str):
         User or None: 사용자 객체 또는 존재하지 않을 경우 None.
     """
     return db.query(User).filter(User.username == username).first()
+
+
+async def create_user_async(
+    db: AsyncSession, user_create: UserCreate, hashed_password: str
+):
+    """
+    `create_user` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        user_create (UserCreate): 생성할 사용자 데이터.
+        hashed_password (str): bcrypt 로 해시된 비밀번호.
+
+    Returns:
+        User: 생성된 사용자 객체.
+    """
+    return await db.run_sync(
+        lambda session: create_user(session, user_create, hashed_password)
+    )
+
+
+async def get_existing_user_async(db: AsyncSession, user_create: UserCreate):
+    """
+    `get_existing_user` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        user_create (UserCreate): 조회할 사용자 데이터.
+
+    Returns:
+        User or None: 사용자 객체 또는 존재하지 않을 경우 None.
+    """
+    return await db.run_sync(lambda session: get_existing_user(session, user_create))
+
+
+async def get_user_async(db: AsyncSession, username: str):
+    """
+    `get_user` 의 AsyncSession 버전입니다.
+
+    Args:
+        db (AsyncSession): SQLAlchemy 비동기 데이터베이스 세션.
+        username (str): 조회할 사용자의 이름.
+
+    Returns:
+        User or None: 사용자 객체 또는 존재하지 않을 경우 None.
+    """
+    return await db.run_sync(lambda session: get_user(session, username))
@@ -8,50 +8,154 @@
 """
 
 import os
+import time
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 from starlette import status
 
 from api.user import user_crud, user_schema
-from api.user.user_crud import pwd_context
-from config.database_init import get_db
+from api.user.password_pool import PasswordPoolFull, password_pool
+from config.cache import TTLCache
+from config.database_init import DB_ASYNC, get_route_db
+from config.fast_json import ROUTE_CLASS
 
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24
 SECRET_KEY = os.environ.get("SECRET_KEY")
 ALGORITHM = "HS256"
+PRINCIPAL_CACHE_MAXSIZE = int(os.environ.get("PRINCIPAL_CACHE_MAXSIZE", "10000"))
+
+# 검증된 토큰 -> Principal. 항목은 토큰의 exp 시각에 만료됩니다.
+principal_cache = TTLCache(
+    maxsize=PRINCIPAL_CACHE_MAXSIZE, ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/user/token")
 
 router = APIRouter(
     prefix="/api/user",
+    route_class=ROUTE_CLASS,
 )
 
 
+async def _run_password_task(task):
+    """
+    비밀번호 풀 작업을 실행하고, 대기열이 가득 찬 경우 503 으로 즉시 거절합니다.
+
+    Args:
+        task (Awaitable): `password_pool.hash` 또는 `password_pool.verify` 코루틴.
+
+    Returns:
+        Any: 작업 결과.
+
+    Raises:
+        HTTPException: 대기열이 가득 찬 경우 503 상태 코드 반환.
+    """
+    try:
+        return await task
+    except PasswordPoolFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 잠시 후 다시 시도해 주세요.",
+            headers={"Retry-After": "1"},
+        )
+
+
+def _create_access_token(user):
+    """
+    사용자에게 액세스 토큰을 발급합니다.
+
+    토큰에는 사용자 이름(`sub`)과 함께 사용자 ID(`uid`)가 담겨, 인증된 요청에서 사용자 테이블을
+    다시 조회하지 않아도 됩니다.
+
+    Args:
+        user (User): 인증된 사용자 객체.
+
+    Returns:
+        str: 서명된 JWT 액세스 토큰.
+    """
+    data = {
+        "sub": user.username,
+        "uid": user.uid,
+        "exp": datetime.now() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+    }
+    return jwt.encode(data, SECRET_KEY, algorithm=ALGORITHM)
+
+
+async def _authenticate(db, form_data: OAuth2PasswordRequestForm):
+    """
+    사용자 이름과 비밀번호를 검증하고 사용자 객체를 반환합니다.
+
+    Args:
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
+        form_data (OAuth2PasswordRequestForm): 사용자 로그인 데이터 (username, password).
+
+    Returns:
+        User: 인증된 사용자 객체.
+
+    Raises:
+        HTTPException: 인증 실패 시 401, 비밀번호 풀이 가득 찬 경우 503 상태 코드 반환.
+    """
+    if DB_ASYNC:
+        user = await user_crud.get_user_async(db, form_data.username)
+    else:
+        user = await run_in_threadpool(user_crud.get_user, db, form_data.username)
+    if not user or not await _run_password_task(
+        password_pool.verify(form_data.password, user.password)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="아이디 혹은 패스워드가 일치하지 않습니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
 @router.post("/create", status_code=status.HTTP_200_OK)
-def user_create(_user_create: user_schema.UserCreate, db: Session = Depends(get_db)):
+async def user_create(
+    _user_create: user_schema.UserCreate, db: Session = Depends(get_route_db)
+):
     """
     새로운 사용자를 생성합니다.
 
     Args:
         _user_create (UserCreate): 생성할 사용자 데이터.
-        db (Session): SQLAlchemy 데이터베이스 세션.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
 
     Returns:
         dict: 생성 성공 메시지와 상태 코드.
 
     Raises:
-        HTTPException: 사용자가 이미 존재할 경우 409 상태 코드 반환.
+        HTTPException: 사용자가 이미 존재할 경우 409, 비밀번호 풀이 가득 찬 경우 503 상태 코드 반환.
     """
-    user = user_crud.get_existing_user(db, user_create=_user_create)
+    if DB_ASYNC:
+        user = await user_crud.get_existing_user_async(db, user_create=_user_create)
+    else:
+        user = await run_in_threadpool(
+            user_crud.get_existing_user, db, user_create=_user_create
+        )
     if user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail="이미 존재하는 사용자입니다."
         )
-    user_crud.create_user(db=db, user_create=_user_create)
+    hashed_password = await _run_password_task(
+        password_pool.hash(_user_create.password1)
+    )
+    if DB_ASYNC:
+        await user_crud.create_user_async(
+            db, user_create=_user_create, hashed_password=hashed_password
+        )
+    else:
+        await run_in_threadpool(
+            user_crud.create_user,
+            db=db,
+            user_create=_user_create,
+            hashed_password=hashed_password,
+        )
 
     return {
         "status_code": status.HTTP_200_OK,
@@ -60,36 +164,25 @@ def user_create(_user_create: user_schema.UserCreate, db: Session = Depends(get_
 
 
 @router.post("/login")
-def login_for_access_token(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+async def login_for_access_token(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: Session = Depends(get_route_db),
 ):
     """
     사용자 로그인 및 액세스 토큰 발급.
 
     Args:
         form_data (OAuth2PasswordRequestForm): 사용자 로그인 데이터 (username, password).
-        db (Session): SQLAlchemy 데이터베이스 세션.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
 
     Returns:
         dict: 액세스 토큰 및 사용자 정보.
 
     Raises:
-        HTTPException: 인증 실패 시 401 상태 코드 반환.
+        HTTPException: 인증 실패 시 401, 비밀번호 풀이 가득 찬 경우 503 상태 코드 반환.
     """
-    user = user_crud.get_user(db, form_data.username)
-    if not user or not pwd_context.verify(form_data.password, user.password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="아이디 혹은 패스워드가 일치하지 않습니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    data = {
-        "sub": user.username,
-        "exp": datetime.now() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
-    }
-
-    access_token = jwt.encode(data, SECRET_KEY, algorithm=ALGORITHM)
+    user = await _authenticate(db, form_data)
+    access_token = _create_access_token(user)
     return {
         "status_code": status.HTTP_200_OK,
         "detail": "정상적으로 로그인되었습니다.",
@@ -102,8 +195,9 @@ def login_for_access_token(
 
 
 @router.post("/token")
-def login_for_access_token_with_token(
-    form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
+async def login_for_access_token_with_token(
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: Session = Depends(get_route_db),
 ):
     # TODO: check the function name again. Seems duplicate with the above function.
     """
@@ -111,44 +205,39 @@ def login_for_access_token_with_token(
 
     Args:
         form_data (OAuth2PasswordRequestForm): 사용자 로그인 데이터 (username, password).
-        db (Session): SQLAlchemy 데이터베이스 세션.
+        db (Session | AsyncSession): SQLAlchemy 데이터베이스 세션 (DB_ASYNC 설정에 따라 결정).
 
     Returns:
         dict: 액세스 토큰 정보.
 
     Raises:
-        HTTPException: 인증 실패 시 401 상태 코드 반환.
+        HTTPException: 인증 실패 시 401, 비밀번호 풀이 가득 찬 경우 503 상태 코드 반환.
     """
-    user = user_crud.get_user(db, form_data.username)
-    if not user or not pwd_context.verify(form_data.password, user.password):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="아이디 혹은 패스워드가 일치하지 않습니다.",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
-    data = {
-        "sub": user.username,
-        "exp": datetime.now() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
-    }
-
-    access_token = jwt.encode(data, SECRET_KEY, algorithm=ALGORITHM)
+    user = await _authenticate(db, form_data)
+    access_token = _create_access_token(user)
     return {"access_token": access_token, "token_type": "bearer"}
 
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
+async def get_current_user(token: str = Depends(oauth2_scheme)):
     """
     현재 사용자의 정보를 토큰에서 추출합니다.
 
+    검증된 토큰은 만료 시각까지 `principal_cache` 에 보관되어, 같은 토큰의 다음 요청은 서명 검증을
+    다시 하지 않습니다. `uid` 클레임이 없는 이전 형식의 토큰은 거절되므로 다시 로그인해야 합니다.
+
     Args:
         token (str): Bearer 토큰.
 
     Returns:
-        dict: 현재 사용자의 정보 (username).
+        Principal: 현재 사용자의 정보 (uid, username).
 
     Raises:
         HTTPException: 토큰 검증 실패 시 401 상태 코드 반환.
     """
+    principal = principal_cache.get(token)
+    if principal is not None:
+        return principal
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -156,27 +245,31 @@ def get_current_user(token: str = Depends(oauth2_scheme)):
     )
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-
-        if username is None:
-            raise credentials_exception
-
-        token_data = {"username": username}
     except JWTError:
         raise credentials_exception
-    else:
-        return token_data
+
+    username = payload.get("sub")
+    uid = payload.get("uid")
+    exp = payload.get("exp")
+    if username is None or uid is None or exp is None:
+        raise credentials_exception
+
+    principal = user_schema.Principal(uid=uid, username=username)
+    ttl = exp - time.time()
+    if ttl > 0:
+        principal_cache.set(token, principal, ttl=ttl)
+    return principal
 
 
 @router.get("/me")
-def read_users_me(current_user: dict = Depends(get_current_user)):
+def read_users_me(current_user: user_schema.Principal = Depends(get_current_user)):
     """
     현재 로그인된 사용자의 정보를 반환합니다.
 
     Args:
-        current_user (dict): 현재 로그인된 사용자 정보.
+        current_user (Principal): 현재 로그인된 사용자 정보.
 
     Returns:
-        dict: 현재 사용자의 정보.
+        Principal: 현재 사용자의 정보.
     """
     return current_user
@@ -1,7 +1,7 @@
 """
 사용자 관련 스키마 정의 모듈.
 
-이 모듈은 사용자 생성 및 인증 토큰에 사용되는 Pydantic 모델을 정의합니다.
+이 모듈은 사용자 생성, 인증 토큰 및 인증된 사용자 정보에 사용되는 Pydantic 모델을 정의합니다.
 
 작성자:
     kimdonghyeok
@@ -87,3 +87,18 @@ class Token(BaseModel):
     access_token: str
     token_type: str
     username: str
+
+
+class Principal(BaseModel):
+    """
+    인증된 요청의 사용자 정보.
+
+    액세스 토큰의 클레임에서 만들어지며, 라우트는 사용자 테이블을 다시 조회하지 않고 이 값을 사용합니다.
+
+    Attributes:
+        uid (int): 사용자 고유 ID.
+        username (str): 사용자 이름.
+    """
+
+    uid: int
+    username: str
@@ -0,0 +1,178 @@
+"""
+캐시 모듈.
+
+이 모듈은 프로세스 내 TTL/LRU 캐시와, 여러 워커가 공유할 수 있는 Redis 기반 캐시를 제공합니다.
+두 캐시는 같은 인터페이스(`get`, `set`, `delete`, `clear`)와 적중/실패 카운터를 가집니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 설정되어 있으면 `make_cache` 가 Redis 캐시를 만들어 워커 간에 공유합니다.
+CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL")
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    프로세스 내 TTL/LRU 캐시.
+
+    항목은 만료 시간이 지나면 조회되지 않으며, 최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터
+    제거됩니다. 스레드 풀에서 실행되는 동기 라우트에서도 사용할 수 있도록 잠금으로 보호됩니다.
+
+    Attributes:
+        maxsize (int): 최대 항목 수.
+        ttl (float): 기본 만료 시간(초).
+        hits (int): 캐시 적중 횟수.
+        misses (int): 캐시 실패 횟수.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        키에 해당하는 값을 조회합니다.
+
+        Args:
+            key: 조회할 키.
+            default: 값이 없거나 만료된 경우 반환할 값.
+
+        Returns:
+            캐시된 값 또는 `default`.
+        """
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is not _MISSING:
+                value, expires_at = item
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value, ttl: float = None):
+        """
+        값을 저장합니다.
+
+        Args:
+            key: 저장할 키.
+            value: 저장할 값.
+            ttl (float): 이 항목의 만료 시간(초). 생략하면 기본값을 사용합니다.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        """
+        키에 해당하는 항목을 제거합니다.
+
+        Args:
+            key: 제거할 키.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            dict: 항목 수와 적중/실패 횟수.
+        """
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+class RedisCache:
+    """
+    Redis 기반 공유 캐시.
+
+    값은 JSON 으로 직렬화되며 키는 `namespace:` 접두사로 구분됩니다. 여러 uvicorn 워커가
+    같은 캐시를 바라보므로 한 워커의 무효화가 모든 워커에 반영됩니다.
+
+    Attributes:
+        namespace (str): 키 접두사.
+        ttl (float): 기본 만료 시간(초).
+        hits (int): 캐시 적중 횟수 (이 프로세스 기준).
+        misses (int): 캐시 실패 횟수 (이 프로세스 기준).
+    """
+
+    def __init__(self, url: str, namespace: str, ttl: float = 60):
+        import redis  # 공유 캐시를 사용할 때만 불러옵니다.
+
+        self._client = redis.Redis.from_url(url)
+        self.namespace = namespace
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, key):
+        return f"{self.namespace}:{key}"
+
+    def get(self, key, default=None):
+        raw = self._client.get(self._key(key))
+        if raw is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return json.loads(raw)
+
+    def set(self, key, value, ttl: float = None):
+        ttl = self.ttl if ttl is None else ttl
+        self._client.set(self._key(key), json.dumps(value), px=max(int(ttl * 1000), 1))
+
+    def delete(self, key):
+        self._client.delete(self._key(key))
+
+    def clear(self):
+        keys = list(self._client.scan_iter(f"{self.namespace}:*"))
+        if keys:
+            self._client.delete(*keys)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def make_cache(namespace: str, maxsize: int = 1024, ttl: float = 60, shared: bool = False):
+    """
+    캐시 인스턴스를 생성합니다.
+
+    Args:
+        namespace (str): 캐시 이름 (Redis 키 접두사로 사용).
+        maxsize (int): 프로세스 내 캐시의 최대 항목 수.
+        ttl (float): 기본 만료 시간(초).
+        shared (bool): True 이고 `CACHE_REDIS_URL` 이 설정되어 있으면 Redis 캐시를 사용합니다.
+
+    Returns:
+        TTLCache | RedisCache: 생성된 캐시.
+    """
+    if shared and CACHE_REDIS_URL:
+        return RedisCache(CACHE_REDIS_URL, namespace, ttl=ttl)
+    return TTLCache(maxsize=maxsize, ttl=ttl)
@@ -0,0 +1,92 @@
+"""
+JSON 응답 압축 미들웨어 모듈.
+
+클라이언트가 gzip 을 허용하고 응답이 `GZIP_MINIMUM_SIZE` 바이트 이상인 JSON 일 때만 gzip 으로
+압축하는 ASGI 미들웨어를 제공합니다. 이미 `Content-Encoding` 이 지정된 응답(캐시된 OpenAPI 압축본 등),
+JSON 이 아닌 응답(이미지 파일, Range 응답), 여러 조각으로 스트리밍되는 응답은 그대로 전달합니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import gzip
+import os
+
+from dotenv import load_dotenv
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+load_dotenv()
+
+GZIP_MINIMUM_SIZE = int(os.environ.get("GZIP_MINIMUM_SIZE", "1024"))
+GZIP_COMPRESS_LEVEL = int(os.environ.get("GZIP_COMPRESS_LEVEL", "6"))
+
+
+class GZipJSONMiddleware:
+    """
+    크기 기준을 넘는 JSON 응답만 gzip 으로 압축하는 ASGI 미들웨어.
+
+    Attributes:
+        minimum_size (int): 압축할 최소 본문 크기(바이트).
+        compresslevel (int): gzip 압축 수준 (1-9).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = GZIP_MINIMUM_SIZE,
+        compresslevel: int = GZIP_COMPRESS_LEVEL,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        if "gzip" not in accept_encoding.lower():
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message: Message):
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if "content-encoding" in headers or not content_type.startswith(
+                    "application/json"
+                ):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # 본문 크기를 확인할 때까지 시작 메시지를 보류합니다.
+                    start_message = message
+                return
+
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if start_message is None:
+                # 시작 메시지는 이미 전송되었습니다 (스트리밍 응답의 이후 조각).
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if not message.get("more_body", False) and len(body) >= self.minimum_size:
+                body = gzip.compress(body, compresslevel=self.compresslevel)
+                headers["content-encoding"] = "gzip"
+                headers["content-length"] = str(len(body))
+                message = {"type": "http.response.body", "body": body}
+            await send(start_message)
+            start_message = None
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -2,8 +2,13 @@ import os
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
+
+from config.db_pool import install_pool_listeners
+from config.metrics import instrument_engine
 
 load_dotenv()
 
@@ -11,20 +16,78 @@ DB_HOST = os.environ.get("DB_HOST")
 DB_NAME = os.environ.get("DB_NAME")
 DB_USERNAME = os.environ.get("DB_USERNAME")
 DB_PASSWORD = os.environ.get("DB_PASSWORD")
+# true 이면 async 라우트가 asyncpg 기반 AsyncSession 을 사용합니다.
+DB_ASYNC = os.environ.get("DB_ASYNC", "false").lower() == "true"
+
+# 커넥션 풀 설정
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.environ.get("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_STATEMENT_TIMEOUT_MS = int(os.environ.get("DB_STATEMENT_TIMEOUT_MS", "30000"))
+DB_LEAK_THRESHOLD_SECONDS = float(os.environ.get("DB_LEAK_THRESHOLD_SECONDS", "30"))
 
 SQLALCHEMY_DATABASE_URL = (
     f"postgresql://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}:5432/{DB_NAME}"
 )
+SQLALCHEMY_ASYNC_DATABASE_URL = (
+    f"postgresql+asyncpg://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}:5432/{DB_NAME}"
+)
+
+POOL_OPTIONS = {
+    "pool_size": DB_POOL_SIZE,
+    "max_overflow": DB_MAX_OVERFLOW,
+    "pool_timeout": DB_POOL_TIMEOUT,
+    "pool_recycle": DB_POOL_RECYCLE,
+    "pool_pre_ping": DB_POOL_PRE_PING,
+}
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    connect_args={"options": f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"},
+    **POOL_OPTIONS,
+)
+install_pool_listeners(engine)
+instrument_engine(engine, "sync", DB_POOL_SIZE + DB_MAX_OVERFLOW)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# asyncpg 는 async 모드에서만 필요하므로 엔진도 그때만 생성합니다.
+async_engine = None
+if DB_ASYNC:
+    async_engine = create_async_engine(
+        SQLALCHEMY_ASYNC_DATABASE_URL,
+        connect_args={
+            "server_settings": {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+        },
+        **POOL_OPTIONS,
+    )
+    install_pool_listeners(async_engine.sync_engine)
+    instrument_engine(async_engine.sync_engine, "async", DB_POOL_SIZE + DB_MAX_OVERFLOW)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
+def _route_of(request: Request):
+    return f"{request.method} {request.url.path}"
+
+
+def get_db(request: Request):
+    db = SessionLocal(info={"route": _route_of(request)})
     try:
         yield db
-    except Exception:
+    finally:
+        # 성공/실패와 관계없이 커넥션을 풀에 반환합니다.
         db.close()
+
+
+async def get_async_db(request: Request):
+    async with AsyncSessionLocal(info={"route": _route_of(request)}) as db:
+        yield db
+
+
+# async 라우트에서 사용할 세션 의존성 (Settings.DB_ASYNC 로 선택)
+get_route_db = get_async_db if DB_ASYNC else get_db
@@ -0,0 +1,125 @@
+"""
+데이터베이스 커넥션 풀 모니터링 모듈.
+
+이 모듈은 커넥션 풀의 체크아웃/체크인 이벤트를 추적하여 오래 반환되지 않는 커넥션(누수)을
+요청 경로와 함께 기록하고, 풀 사용 현황을 조회하는 기능을 제공합니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import asyncio
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+# id(connection_record) -> connection_record (현재 체크아웃된 커넥션)
+_checked_out = {}
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    connection_record.info["checked_out_at"] = time.monotonic()
+    connection_record.info["route"] = None
+    connection_record.info["leak_reported"] = False
+    _checked_out[id(connection_record)] = connection_record
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    _checked_out.pop(id(connection_record), None)
+
+
+def _on_session_begin(session, transaction, connection):
+    # Connection.info 는 풀의 connection_record.info 와 같은 딕셔너리입니다.
+    connection.info["route"] = session.info.get("route")
+
+
+def install_pool_listeners(engine: Engine):
+    """
+    엔진의 커넥션 풀에 누수 추적용 이벤트 리스너를 등록합니다.
+
+    Args:
+        engine (Engine): 리스너를 등록할 SQLAlchemy 엔진.
+    """
+    event.listen(engine, "checkout", _on_checkout)
+    event.listen(engine, "checkin", _on_checkin)
+
+
+event.listen(Session, "after_begin", _on_session_begin)
+
+
+def find_leaks(threshold: float):
+    """
+    임계 시간 이상 체크아웃된 채로 남아 있는 커넥션을 찾습니다.
+
+    Args:
+        threshold (float): 누수로 판단할 점유 시간(초).
+
+    Returns:
+        list: (점유 시간(초), 요청 경로) 튜플의 목록.
+    """
+    now = time.monotonic()
+    leaks = []
+    for record in list(_checked_out.values()):
+        checked_out_at = record.info.get("checked_out_at")
+        if checked_out_at is None:
+            continue
+        held = now - checked_out_at
+        if held >= threshold:
+            leaks.append((held, record.info.get("route")))
+    return leaks
+
+
+def report_leaks(threshold: float):
+    """
+    새로 발견된 누수 커넥션을 한 번씩 출력합니다.
+
+    Args:
+        threshold (float): 누수로 판단할 점유 시간(초).
+    """
+    now = time.monotonic()
+    for record in list(_checked_out.values()):
+        info = record.info
+        checked_out_at = info.get("checked_out_at")
+        if checked_out_at is None or info.get("leak_reported"):
+            continue
+        held = now - checked_out_at
+        if held >= threshold:
+            info["leak_reported"] = True
+            print(
+                f"Connection held for {held:.1f}s "
+                f"(threshold {threshold}s) by {info.get('route') or 'unknown route'}"
+            )
+
+
+async def monitor_leaks(threshold: float, interval: float = 5.0):
+    """
+    주기적으로 커넥션 누수를 검사하는 백그라운드 작업입니다.
+
+    Args:
+        threshold (float): 누수로 판단할 점유 시간(초).
+        interval (float): 검사 주기(초).
+    """
+    while True:
+        await asyncio.sleep(interval)
+        report_leaks(threshold)
+
+
+def pool_status(engine: Engine):
+    """
+    커넥션 풀의 사용 현황을 조회합니다.
+
+    Args:
+        engine (Engine): 조회할 SQLAlchemy 엔진.
+
+    Returns:
+        dict: 풀 크기, 체크아웃/유휴/오버플로 커넥션 수.
+    """
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
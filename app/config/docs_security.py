@@ -3,44 +3,57 @@ import os
 import secrets
 
 from dotenv import load_dotenv
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
+from starlette.datastructures import Headers
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 load_dotenv()
 
 secret_name = os.environ.get("SWAGGER_NAME")
 secret_password = os.environ.get("SWAGGER_PASSWORD")
 
-
-class ApidocBasicAuthMiddleware(BaseHTTPMiddleware):
-
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
-
-        if request.url.path in ["/docs", "/openapi.json", "/redoc"]:
-            auth_header = request.headers.get("Authorization")
-
-            if auth_header:
-                try:
-                    scheme, credentials = auth_header.split()
-                    if scheme.lower() == "basic":
-                        decoded = base64.b64decode(credentials).decode("ascii")
-                        username, password = decoded.split(":")
-                        correct_username = secrets.compare_digest(username, secret_name)
-                        correct_password = secrets.compare_digest(
-                            password, secret_password
-                        )
-
-                        if correct_username and correct_password:
-                            response = await call_next(request)
-
-                            return response
-                except Exception as e:
-                    print(f"Exception occurred: {e}")
-            response = Response(content="Unauthorized", status_code=401)
-            response.headers["WWW-Authenticate"] = "Basic"
-
-            return response
-        response = await call_next(request)
-
-        return response
+DOCS_PATHS = frozenset(["/docs", "/openapi.json", "/redoc"])
+# 커넥션 풀 상태와 누수 경로, 라우트별 트래픽 등 내부 정보를 노출하는 운영용 경로
+OPS_PATHS = frozenset(["/db/pool", "/cache/stats", "/metrics"])
+
+
+class ApidocBasicAuthMiddleware:
+    """
+    API 문서 경로와 운영용 경로에 Basic 인증을 적용하는 ASGI 미들웨어.
+
+    문서 경로가 아닌 요청은 요청/응답 본문을 감싸지 않고 그대로 다음 앱으로 전달합니다.
+    """
+
+    def __init__(self, app: ASGIApp, paths=DOCS_PATHS | OPS_PATHS):
+        self.app = app
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        if self._authorized(Headers(scope=scope).get("Authorization")):
+            await self.app(scope, receive, send)
+            return
+
+        response = Response(content="Unauthorized", status_code=401)
+        response.headers["WWW-Authenticate"] = "Basic"
+        await response(scope, receive, send)
+
+    @staticmethod
+    def _authorized(auth_header):
+        if not auth_header:
+            return False
+        try:
+            scheme, credentials = auth_header.split()
+            if scheme.lower() != "basic":
+                return False
+            decoded = base64.b64decode(credentials).decode("ascii")
+            username, password = decoded.split(":", 1)
+            correct_username = secrets.compare_digest(username, secret_name)
+            correct_password = secrets.compare_digest(password, secret_password)
+            return correct_username and correct_password
+        except Exception as e:
+            print(f"Exception occurred: {e}")
+            return False
@@ -0,0 +1,90 @@
+"""
+빠른 JSON 응답 모듈.
+
+`FAST_JSON` 설정이 켜져 있으면 라우터가 `FastJSONRoute` 를 사용해, 엔드포인트가 반환한 dict/list 를
+`jsonable_encoder` 를 거치지 않고 orjson 으로 바로 직렬화합니다. 꺼져 있으면 FastAPI 기본 동작과
+같습니다.
+
+`response_model` 이 지정된 라우트는 응답 검증이 필요하므로 기본 경로로 처리합니다. 또한 엔드포인트가
+주입받은 `Response` 에 설정한 헤더/쿠키는 반영되지 않으므로, 그런 라우트는 응답 객체를 직접 반환해야 합니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import asyncio
+import functools
+import os
+from decimal import Decimal
+
+import orjson
+from dotenv import load_dotenv
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+load_dotenv()
+
+FAST_JSON = os.environ.get("FAST_JSON", "false").lower() == "true"
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    if isinstance(obj, BaseModel):
+        return obj.dict()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    orjson 으로 직렬화하는 JSON 응답.
+
+    정수 키를 가진 dict(예: 콘텐츠 ID -> 이미지 주소 목록)와 pydantic 모델도 직렬화합니다.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+def _wrap_endpoint(endpoint, status_code: int):
+    def to_response(result):
+        if isinstance(result, (dict, list)):
+            return FastJSONResponse(content=result, status_code=status_code)
+        return result
+
+    if asyncio.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            return to_response(await endpoint(*args, **kwargs))
+
+    else:
+
+        @functools.wraps(endpoint)
+        def wrapper(*args, **kwargs):
+            return to_response(endpoint(*args, **kwargs))
+
+    return wrapper
+
+
+class FastJSONRoute(APIRoute):
+    """
+    dict/list 반환값을 `FastJSONResponse` 로 바로 감싸는 라우트.
+
+    FastAPI 는 엔드포인트가 `Response` 를 반환하면 인코딩 단계를 건너뛰므로, 엔드포인트를 감싸
+    반환값을 응답 객체로 바꿉니다. 의존성 주입은 원래 함수의 시그니처를 그대로 사용합니다.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        if kwargs.get("response_model") is None:
+            endpoint = _wrap_endpoint(endpoint, kwargs.get("status_code") or 200)
+        super().__init__(path, endpoint, **kwargs)
+
+
+ROUTE_CLASS = FastJSONRoute if FAST_JSON else APIRoute
+RESPONSE_CLASS = FastJSONResponse if FAST_JSON else JSONResponse
@@ -0,0 +1,326 @@
+"""
+Prometheus 지표 모듈.
+
+요청 수/지연 시간, 처리 중인 요청 수, 요청별 SQL 실행 횟수와 시간, 커넥션 풀 사용량, 업로드 크기,
+비밀번호 해시/검증 시간과 거절 수를 수집하고 `/metrics` 에서 Prometheus 텍스트 형식으로 내보냅니다.
+
+`PROMETHEUS_MULTIPROC_DIR` 가 지정되면 `prometheus_client` 의 멀티프로세스 모드로 동작하여, 여러
+uvicorn 워커의 값이 이 디렉토리의 파일로 모이고 어느 워커가 `/metrics` 에 응답해도 전체 합계를
+반환합니다. 디렉토리는 서버를 시작하기 전에 비워야 합니다. `python main.py` 와 `gunicorn.conf.py` 는
+자동으로 비우고, `uvicorn --workers` 로 직접 실행할 때는 먼저 `python manage.py metrics-reset` 을
+실행합니다. 종료한 워커의 livesum 게이지 값은 워커가 정상 종료할 때, gunicorn 의 `child_exit` 훅에서,
+그리고 새 워커가 시작할 때(`mark_dead_workers`) 제거됩니다.
+
+요청당 비용을 줄이기 위해 SQL 이벤트는 요청마다 하나씩 만드는 `RequestStats` 에 횟수와 시간만 더하고,
+요청이 끝날 때 라우트 라벨로 한 번에 반영합니다. 라벨을 붙인 하위 지표도 캐시해 재사용합니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import contextvars
+import os
+import re
+import time
+
+from dotenv import load_dotenv
+
+# 멀티프로세스 모드 여부는 prometheus_client 를 불러올 때 환경 변수로 결정되므로 먼저 읽습니다.
+load_dotenv()
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from starlette.types import ASGIApp, Message, Receive, Scope, Send  # noqa: E402
+
+PROMETHEUS_MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR") or None
+
+# 업로드 크기 버킷 (1KB ~ 20MB, UPLOAD_MAX_BYTES 기본값)
+UPLOAD_SIZE_BUCKETS = (
+    1024,
+    10 * 1024,
+    100 * 1024,
+    512 * 1024,
+    1024 ** 2,
+    2 * 1024 ** 2,
+    5 * 1024 ** 2,
+    10 * 1024 ** 2,
+    20 * 1024 ** 2,
+)
+# bcrypt 는 수십~수백 ms 가 걸리고 대기열이 차면 더 길어집니다.
+PASSWORD_BUCKETS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 5.0, 10.0)
+
+REQUESTS = Counter(
+    "http_requests_total", "처리한 HTTP 요청 수", ["method", "route", "status"]
+)
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간(초)", ["method", "route"]
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "처리 중인 HTTP 요청 수", multiprocess_mode="livesum"
+)
+DB_STATEMENTS = Counter("db_statements_total", "실행한 SQL 문 수", ["route"])
+DB_STATEMENT_SECONDS = Counter(
+    "db_statement_seconds_total", "SQL 문 실행에 걸린 시간(초)의 합", ["route"]
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "체크아웃된 커넥션 수",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CAPACITY = Gauge(
+    "db_pool_capacity",
+    "커넥션 풀의 최대 커넥션 수 (pool_size + max_overflow)",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+UPLOAD_BYTES = Counter("image_upload_bytes_total", "저장한 업로드 파일 크기(바이트)의 합")
+UPLOAD_SIZE = Histogram(
+    "image_upload_size_bytes", "업로드 파일 크기(바이트)", buckets=UPLOAD_SIZE_BUCKETS
+)
+PASSWORD_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "비밀번호 해시/검증 시간(초, 프로세스 풀 대기 포함)",
+    ["operation"],
+    buckets=PASSWORD_BUCKETS,
+)
+PASSWORD_REJECTED = Counter(
+    "password_pool_rejected_total",
+    "대기열이 가득 차 거절한 비밀번호 해시/검증 요청 수",
+    ["operation"],
+)
+
+# 요청 밖(백그라운드 작업, 관리 명령)에서 실행된 SQL 의 라우트 라벨
+BACKGROUND_ROUTE = "background"
+# 어떤 라우트에도 일치하지 않은 요청의 라우트 라벨
+UNMATCHED_ROUTE = "unmatched"
+# 이 외의 메서드는 라벨 수가 늘어나지 않도록 "other" 로 기록합니다.
+HTTP_METHODS = frozenset(["GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"])
+OTHER_METHOD = "other"
+
+# 워커별 livesum/liveall 게이지 파일 (gauge_livesum_<pid>.db)
+_LIVE_GAUGE_FILE = re.compile(r"gauge_live(?:sum|all)_(\d+)\.db$")
+
+
+class RequestStats:
+    """
+    요청 하나에서 실행된 SQL 문 수와 시간.
+
+    `run_in_threadpool` 은 컨텍스트를 복사하므로 스레드 풀에서 실행된 SQL 도 같은 객체에 더해집니다.
+    """
+
+    __slots__ = ("statements", "seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.seconds = 0.0
+
+
+_request_stats = contextvars.ContextVar("request_stats", default=None)
+
+# (method, route, status) -> 라벨을 붙인 하위 지표
+_request_children = {}
+_route_children = {}
+# endpoint -> 경로 템플릿
+_route_paths = {}
+
+
+def _children_for(method: str, route: str, status: int):
+    if method not in HTTP_METHODS:
+        method = OTHER_METHOD
+    key = (method, route, status)
+    children = _request_children.get(key)
+    if children is None:
+        children = (
+            REQUESTS.labels(method, route, str(status)),
+            REQUEST_DURATION.labels(method, route),
+        )
+        _request_children[key] = children
+    return children
+
+
+def _route_children_for(route: str):
+    children = _route_children.get(route)
+    if children is None:
+        children = (DB_STATEMENTS.labels(route), DB_STATEMENT_SECONDS.labels(route))
+        _route_children[route] = children
+    return children
+
+
+def _route_of(scope: Scope):
+    # 라벨 수가 늘어나지 않도록 실제 경로 대신 경로 템플릿(/api/content/{content_id})을 사용합니다.
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return UNMATCHED_ROUTE
+    path = _route_paths.get(endpoint)
+    if path is None:
+        app = scope.get("app")
+        for candidate in getattr(app, "routes", ()):
+            if getattr(candidate, "endpoint", None) is not None:
+                _route_paths.setdefault(candidate.endpoint, candidate.path)
+        path = _route_paths.get(endpoint, UNMATCHED_ROUTE)
+    return path
+
+
+class MetricsMiddleware:
+    """
+    요청 수, 처리 시간, 처리 중인 요청 수와 요청별 SQL 통계를 기록하는 ASGI 미들웨어.
+
+    라우팅 후 `scope` 에 남는 endpoint 로 경로 템플릿을 찾으므로 가장 바깥쪽에 추가합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        REQUESTS_IN_PROGRESS.inc()
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            REQUESTS_IN_PROGRESS.dec()
+            _request_stats.reset(token)
+            route = _route_of(scope)
+            count, duration = _children_for(scope["method"], route, status_code)
+            count.inc()
+            duration.observe(elapsed)
+            if stats.statements:
+                statements, seconds = _route_children_for(route)
+                statements.inc(stats.statements)
+                seconds.inc(stats.seconds)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["metrics_started"].pop()
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.seconds += elapsed
+    else:
+        statements, seconds = _route_children_for(BACKGROUND_ROUTE)
+        statements.inc()
+        seconds.inc(elapsed)
+
+
+def _handle_error(exception_context):
+    # 실패한 SQL 은 after_cursor_execute 가 호출되지 않으므로 시작 시각만 버립니다.
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("metrics_started"):
+        conn.info["metrics_started"].pop()
+
+
+def instrument_engine(engine: Engine, name: str, capacity: int):
+    """
+    엔진에 SQL 실행 및 커넥션 풀 지표용 이벤트 리스너를 등록합니다.
+
+    Args:
+        engine (Engine): 리스너를 등록할 SQLAlchemy 엔진.
+        name (str): 지표의 `engine` 라벨 (sync, async).
+        capacity (int): 커넥션 풀의 최대 커넥션 수.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+    checked_out = DB_POOL_CHECKED_OUT.labels(name)
+    DB_POOL_CAPACITY.labels(name).set(capacity)
+    event.listen(engine, "checkout", lambda *args: checked_out.inc())
+    event.listen(engine, "checkin", lambda *args: checked_out.dec())
+
+
+def observe_upload(size: int):
+    """
+    저장한 업로드 파일 크기를 기록합니다.
+
+    Args:
+        size (int): 파일 크기(바이트).
+    """
+    UPLOAD_BYTES.inc(size)
+    UPLOAD_SIZE.observe(size)
+
+
+def render():
+    """
+    현재 지표를 Prometheus 텍스트 형식으로 직렬화합니다.
+
+    Returns:
+        tuple: (본문 바이트, Content-Type).
+    """
+    if PROMETHEUS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead():
+    """멀티프로세스 모드에서 종료하는 워커의 livesum 게이지 값을 제거합니다."""
+    if PROMETHEUS_MULTIPROC_DIR:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def _is_alive(pid: int):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def mark_dead_workers():
+    """
+    멀티프로세스 모드에서 이미 종료된 워커가 남긴 livesum 게이지 값을 제거합니다.
+
+    비정상 종료한 워커는 `mark_process_dead` 를 호출하지 못하므로, 워커가 시작할 때 호출하여 처리 중인 요청 수와
+    커넥션 풀 사용량이 계속 더해지지 않게 합니다.
+    """
+    if not PROMETHEUS_MULTIPROC_DIR or not os.path.isdir(PROMETHEUS_MULTIPROC_DIR):
+        return
+    for name in os.listdir(PROMETHEUS_MULTIPROC_DIR):
+        match = _LIVE_GAUGE_FILE.match(name)
+        if match and not _is_alive(int(match.group(1))):
+            multiprocess.mark_process_dead(int(match.group(1)))
+
+
+def clear_multiprocess_dir():
+    """멀티프로세스 모드에서 이전 실행이 남긴 지표 파일을 지웁니다. 워커를 시작하기 전에 호출합니다."""
+    if not PROMETHEUS_MULTIPROC_DIR:
+        return
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+    for name in os.listdir(PROMETHEUS_MULTIPROC_DIR):
+        if name.endswith(".db"):
+            os.unlink(os.path.join(PROMETHEUS_MULTIPROC_DIR, name))
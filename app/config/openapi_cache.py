@@ -0,0 +1,114 @@
+"""
+OpenAPI 문서 캐시 모듈.
+
+OpenAPI 문서를 처음 요청될 때 한 번만 생성해 직렬화된 바이트로 보관하고, gzip/brotli 압축본과
+ETag 를 함께 만들어 둡니다. 이후 요청은 생성이나 직렬화 없이 캐시된 바이트를 반환하며,
+`If-None-Match` 가 일치하면 304 로 응답합니다. brotli 는 `brotli` 패키지가 설치된 경우에만 사용합니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+try:
+    import brotli
+except ImportError:  # brotli 는 선택 의존성입니다.
+    brotli = None
+
+CACHE_CONTROL = "no-cache"
+
+
+class OpenAPICache:
+    """
+    직렬화된 OpenAPI 문서와 압축본을 보관하는 캐시.
+
+    Attributes:
+        build (Callable[[], dict]): OpenAPI 문서를 생성하는 함수.
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self._variants = None
+        self._lock = threading.Lock()
+
+    def _encode(self):
+        body = json.dumps(
+            self.build(), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        # 인코딩 -> (본문, ETag). 표현마다 ETag 를 달리해 중간 캐시가 섞지 않도록 합니다.
+        variants = {
+            "identity": (body, f'"{digest}"'),
+            "gzip": (gzip.compress(body, compresslevel=9), f'"{digest}-gz"'),
+        }
+        if brotli is not None:
+            variants["br"] = (brotli.compress(body, quality=11), f'"{digest}-br"')
+        return variants
+
+    def variants(self):
+        """
+        캐시된 표현을 반환합니다. 아직 없으면 문서를 생성합니다.
+
+        Returns:
+            dict: 인코딩 이름 -> (본문 바이트, ETag).
+        """
+        if self._variants is None:
+            with self._lock:
+                if self._variants is None:
+                    self._variants = self._encode()
+        return self._variants
+
+    def invalidate(self):
+        """캐시된 문서를 버립니다. 다음 요청에서 다시 생성됩니다."""
+        with self._lock:
+            self._variants = None
+
+    def response(self, request: Request):
+        """
+        요청의 `Accept-Encoding` 과 `If-None-Match` 에 맞는 응답을 만듭니다.
+
+        Args:
+            request (Request): 요청 객체.
+
+        Returns:
+            Response: 캐시된 문서 또는 304 응답.
+        """
+        variants = self.variants()
+        encoding = _negotiate(request.headers.get("accept-encoding", ""), variants)
+        body, etag = variants[encoding]
+        headers = {
+            "etag": etag,
+            "cache-control": CACHE_CONTROL,
+            "vary": "Accept-Encoding",
+        }
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {tag.strip() for tag in if_none_match.split(",")}
+            # 문서가 바뀌지 않았다면 어떤 인코딩의 ETag 로 재검증해도 304 입니다.
+            if "*" in tags or tags & {tag for _, tag in variants.values()}:
+                return Response(status_code=304, headers=headers)
+
+        if encoding != "identity":
+            headers["content-encoding"] = encoding
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _negotiate(accept_encoding: str, variants: dict):
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding.strip().lower())
+    for encoding in ("br", "gzip"):
+        if encoding in variants and (encoding in accepted or "*" in accepted):
+            return encoding
+    return "identity"
@@ -0,0 +1,71 @@
+"""
+커서 기반(keyset) 페이지네이션 모듈.
+
+이 모듈은 정렬 키 값을 클라이언트가 해석할 필요 없는 불투명한 커서 문자열로 변환하고,
+다시 정렬 키 값으로 복원하는 기능을 제공합니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException
+from starlette import status
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(values: list):
+    """
+    정렬 키 값 목록을 커서 문자열로 변환합니다.
+
+    Args:
+        values (list): 마지막 항목의 정렬 키 값 (예: [created_at, contents_id]).
+
+    Returns:
+        str: URL 에 그대로 사용할 수 있는 커서 문자열.
+    """
+    raw = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int):
+    """
+    커서 문자열을 정렬 키 값 목록으로 복원합니다.
+
+    Args:
+        cursor (str): `encode_cursor` 로 만든 커서 문자열.
+        size (int): 기대하는 정렬 키 개수.
+
+    Returns:
+        list: 정렬 키 값 목록.
+
+    Raises:
+        HTTPException: 커서 형식이 올바르지 않은 경우 400 상태 코드 반환.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("unexpected cursor shape")
+        return [_decode_value(value) for value in values]
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 커서입니다."
+        )
@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 
 from pydantic import BaseSettings
 
@@ -11,6 +12,49 @@ class Settings(BaseSettings):
     DB_HOST: str
     DB_PORT: str
     DB_NAME: str
+    DB_ASYNC: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    DB_LEAK_THRESHOLD_SECONDS: float = 30
+    CACHE_REDIS_URL: Optional[str] = None
+    AVATAR_CACHE_MAXSIZE: int = 10000
+    AVATAR_CACHE_TTL_SECONDS: float = 300
+    AVATAR_CACHE_SHARED: bool = False
+    UPLOAD_DIR: str = "/uploads/"
+    UPLOAD_MAX_BYTES: int = 20 * 1024 * 1024
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+    IMAGE_VARIANT_WORKERS: int = 2
+    IMAGE_ACCEL_REDIRECT_PREFIX: Optional[str] = None
+    PASSWORD_POOL_WORKERS: int = 2
+    PASSWORD_POOL_QUEUE_DEPTH: int = 32
+    PRINCIPAL_CACHE_MAXSIZE: int = 10000
+    FAST_JSON: bool = False
+    GZIP_MINIMUM_SIZE: int = 1024
+    GZIP_COMPRESS_LEVEL: int = 6
+    LIKE_FLUSH_INTERVAL_SECONDS: float = 1
+    FEED_CACHE_PAGES: int = 3
+    FEED_CACHE_TTL_SECONDS: float = 5
+    SEARCH_TOKENIZER: str = "bigram"
+    SEARCH_TS_CONFIG: str = "simple"
+    SEARCH_SNIPPET_CHARS: int = 120
+    SEARCH_MAX_CANDIDATES: int = 1000
+    GEO_BACKEND: str = "postgis"
+    GEO_MAX_RADIUS_M: float = 50000
+    GEO_MAX_BBOX_SPAN_DEGREES: float = 5
+    GEO_GRID_PRECISION: int = 5
+    GEO_GRID_RELOAD_INTERVAL_SECONDS: float = 300
+    CONTENT_PURGE_AFTER_DAYS: float = 30
+    CONTENT_PURGE_BATCH_SIZE: int = 200
+    CONTENT_PURGE_INTERVAL_SECONDS: float = 3600
+    IMAGE_GC_GRACE_HOURS: float = 24
+    IMAGE_GC_BATCH_SIZE: int = 200
+    IMAGE_GC_BATCH_PAUSE_SECONDS: float = 0.5
+    IMAGE_GC_INTERVAL_SECONDS: float = 3600
+    PROMETHEUS_MULTIPROC_DIR: Optional[str] = None
     SWAGGER_NAME: str
     SWAGGER_PASSWORD: str
 
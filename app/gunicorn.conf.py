@@ -0,0 +1,30 @@
+"""
+gunicorn 실행 설정.
+
+`gunicorn main:app -c gunicorn.conf.py` 로 uvicorn 워커를 여러 개 실행합니다. `PROMETHEUS_MULTIPROC_DIR` 가
+지정되면 시작할 때 이전 실행의 지표 파일을 지우고, 워커가 종료되면 그 워커의 livesum 게이지 값을 제거합니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+import os
+import sys
+
+# gunicorn 은 설정 파일을 읽은 뒤에 작업 디렉토리를 sys.path 에 추가하므로 app 디렉토리를 먼저 추가합니다.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import metrics  # noqa: E402
+
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", "4"))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+
+def on_starting(server):
+    metrics.clear_multiprocess_dir()
+
+
+def child_exit(server, worker):
+    if metrics.PROMETHEUS_MULTIPROC_DIR:
+        metrics.multiprocess.mark_process_dead(worker.pid)
@@ -1,26 +1,33 @@
 import argparse
+import asyncio
 import os
 
 import uvicorn
 from dotenv import load_dotenv
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from starlette.requests import Request
 
-from api.content import content_router
-from api.image import image_router
+from api.content import content_router, geo, like_counter, purge
+from api.image import image_crud, image_gc, image_router, image_variants
 from api.user import user_router
-from config import docs_security
+from api.user.password_pool import password_pool
+from config import database_init, db_pool, docs_security, fast_json, metrics
+from config.compression import GZipJSONMiddleware
+from config.openapi_cache import OpenAPICache
 from config.settings import Settings
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI()
+app = FastAPI(default_response_class=fast_json.RESPONSE_CLASS)
 
 app.add_middleware(docs_security.ApidocBasicAuthMiddleware)
+app.add_middleware(GZipJSONMiddleware)
 
 # Set CORS origins from environment variable
 origins = os.getenv("CORS_ORIGINS", "").split(",")
@@ -33,6 +40,63 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 가장 바깥쪽 미들웨어로 추가하여 다른 미들웨어를 포함한 전체 처리 시간을 기록합니다.
+app.add_middleware(metrics.MetricsMiddleware)
+
+
+# 문서는 첫 요청 때 한 번 생성되어 직렬화/압축된 상태로 재사용됩니다.
+openapi_cache = OpenAPICache(
+    lambda: get_openapi(title="FastAPI", version="0.1.0", routes=app.routes)
+)
+
+# 백그라운드 작업이 가비지 컬렉션되지 않도록 참조를 유지합니다.
+background_tasks = []
+
+
+@app.on_event("startup")
+async def start_background_tasks():
+    metrics.mark_dead_workers()
+    background_tasks.append(
+        asyncio.create_task(
+            db_pool.monitor_leaks(database_init.DB_LEAK_THRESHOLD_SECONDS)
+        )
+    )
+    background_tasks.append(
+        asyncio.create_task(like_counter.flush_like_counts_periodically())
+    )
+    background_tasks.append(
+        asyncio.create_task(purge.purge_deleted_contents_periodically())
+    )
+    if image_gc.IMAGE_GC_INTERVAL_SECONDS > 0:
+        background_tasks.append(
+            asyncio.create_task(image_gc.collect_garbage_periodically())
+        )
+    if geo.GEO_BACKEND == "grid":
+        await run_in_threadpool(geo.load_geo_index_now)
+        if geo.GEO_GRID_RELOAD_INTERVAL_SECONDS > 0:
+            background_tasks.append(
+                asyncio.create_task(geo.reload_geo_index_periodically())
+            )
+
+
+@app.on_event("startup")
+async def warm_openapi_cache():
+    openapi_cache.variants()
+
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    for task in background_tasks:
+        task.cancel()
+    # 스레드 풀에서 실행 중인 플러시가 끝난 뒤 마지막 플러시를 실행하도록 작업 종료를 기다립니다.
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    background_tasks.clear()
+    # 종료 전에 남은 좋아요 증감량을 반영합니다.
+    await run_in_threadpool(like_counter.flush_like_counts_now)
+    password_pool.shutdown()
+    image_variants.shutdown()
+    metrics.mark_process_dead()
+
 
 @app.get(
     "/ping",
@@ -46,6 +110,36 @@ async def root():
     return {"app_env": settings}
 
 
+@app.get("/db/pool")
+async def db_pool_status() -> JSONResponse:
+    pools = {"sync": db_pool.pool_status(database_init.engine)}
+    if database_init.async_engine is not None:
+        pools["async"] = db_pool.pool_status(database_init.async_engine.sync_engine)
+    leaks = db_pool.find_leaks(database_init.DB_LEAK_THRESHOLD_SECONDS)
+    return JSONResponse(
+        content={
+            "pools": pools,
+            "leaks": [{"held_seconds": held, "route": route} for held, route in leaks],
+        }
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint() -> Response:
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
+
+
+@app.get("/cache/stats")
+async def cache_stats() -> JSONResponse:
+    return JSONResponse(
+        content={
+            "avatar": image_crud.avatar_cache.stats(),
+            "principal": user_router.principal_cache.stats(),
+        }
+    )
+
+
 @app.get(
     "/docs",
     tags=["documentation"],
@@ -60,9 +154,8 @@ async def get_swagger_documentation() -> HTMLResponse:
     tags=["documentation"],
     include_in_schema=False,
 )
-async def openapi() -> JSONResponse:
-    openapi_schema = get_openapi(title="FastAPI", version="0.1.0", routes=app.routes)
-    return JSONResponse(content=openapi_schema)
+async def openapi(request: Request) -> Response:
+    return openapi_cache.response(request)
 
 
 @app.get(
@@ -87,4 +180,5 @@ if __name__ == "__main__":
     os.environ["APP_ENV"] = args.APP_ENV
     settings = Settings()
 
+    metrics.clear_multiprocess_dir()
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,199 @@
+"""
+관리 명령 실행 모듈.
+
+데이터베이스 마이그레이션, 검색 색인, 삭제된 콘텐츠와 이미지 정리 등 운영 작업을 명령줄에서 실행합니다.
+
+사용 예:
+    python manage.py migrate upgrade          # 최신 리비전까지 적용
+    python manage.py migrate downgrade 0002   # 0002 리비전으로 되돌리기
+    python manage.py migrate current          # 현재 리비전 확인
+    python manage.py migrate history          # 리비전 목록
+    python manage.py migrate upgrade --sql    # 적용할 SQL 만 출력
+    python manage.py search-reindex           # 콘텐츠 전문 검색 색인 다시 계산
+    python manage.py purge-contents           # 보관 기간이 지난 삭제된 콘텐츠 영구 삭제
+    python manage.py image-gc --dry-run       # 참조되지 않는 이미지와 파일 정리 대상 확인
+    python manage.py metrics-reset            # 서버 시작 전 멀티프로세스 지표 디렉토리 비우기
+
+작성자:
+    kimdonghyeok
+"""
+
+import argparse
+import os
+
+from alembic import command
+from alembic.config import Config
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _alembic_config():
+    config = Config(os.path.join(BASE_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BASE_DIR, "migrations"))
+    return config
+
+
+def migrate(args):
+    """
+    Alembic 마이그레이션 명령을 실행합니다.
+
+    Args:
+        args (argparse.Namespace): `action`, `revision`, `sql`, `message` 를 포함한 인자.
+    """
+    config = _alembic_config()
+    if args.action == "upgrade":
+        command.upgrade(config, args.revision or "head", sql=args.sql)
+    elif args.action == "downgrade":
+        command.downgrade(config, args.revision or "-1", sql=args.sql)
+    elif args.action == "current":
+        command.current(config, verbose=True)
+    elif args.action == "history":
+        command.history(config, verbose=True)
+    elif args.action == "revision":
+        command.revision(config, message=args.message)
+
+
+def search_reindex(args):
+    """
+    모든 콘텐츠의 전문 검색 색인(`search_vector`)을 현재 토크나이저로 다시 계산합니다.
+
+    Args:
+        args (argparse.Namespace): `batch_size` 를 포함한 인자.
+    """
+    from api.content.search import reindex_search
+    from config.database_init import SessionLocal
+
+    db = SessionLocal(info={"route": "manage.py search-reindex"})
+    try:
+        total = reindex_search(db, batch_size=args.batch_size)
+    finally:
+        db.close()
+    print(f"{total}개의 콘텐츠를 다시 색인했습니다.")
+
+
+def purge_contents(args):
+    """
+    보관 기간이 지난 삭제된 콘텐츠를 좋아요, 첨부 이미지 관계와 함께 영구 삭제합니다.
+
+    Args:
+        args (argparse.Namespace): `older_than_days`, `batch_size` 를 포함한 인자.
+    """
+    from api.content.purge import purge_deleted_contents
+    from config.database_init import SessionLocal
+
+    # 지정하지 않은 인자는 CONTENT_PURGE_* 설정값을 사용합니다.
+    options = {
+        key: value
+        for key, value in (
+            ("older_than_days", args.older_than_days),
+            ("batch_size", args.batch_size),
+        )
+        if value is not None
+    }
+    db = SessionLocal(info={"route": "manage.py purge-contents"})
+    try:
+        total = purge_deleted_contents(db, **options)
+    finally:
+        db.close()
+    print(f"{total}개의 콘텐츠를 영구 삭제했습니다.")
+
+
+def image_gc(args):
+    """
+    참조되지 않는 이미지 행과 파생본, 파일을 삭제하고 업로드 디렉토리에서 행이 없는 파일을 정리합니다.
+
+    Args:
+        args (argparse.Namespace): `grace_hours`, `batch_size`, `pause_seconds`, `dry_run`,
+            `skip_file_scan` 을 포함한 인자.
+    """
+    from api.image.image_gc import collect_garbage
+    from config.database_init import SessionLocal
+
+    # 지정하지 않은 인자는 IMAGE_GC_* 설정값을 사용합니다.
+    options = {
+        key: value
+        for key, value in (
+            ("grace_hours", args.grace_hours),
+            ("batch_size", args.batch_size),
+            ("pause_seconds", args.pause_seconds),
+        )
+        if value is not None
+    }
+    db = SessionLocal(info={"route": "manage.py image-gc"})
+    try:
+        report = collect_garbage(
+            db, scan_files=not args.skip_file_scan, dry_run=args.dry_run, **options
+        )
+    finally:
+        db.close()
+    prefix = "[dry-run] " if args.dry_run else ""
+    print(
+        f"{prefix}이미지 {report.images}개, 파일 {report.files}개, "
+        f"{report.bytes} 바이트를 정리했습니다."
+    )
+
+
+def metrics_reset(args):
+    """
+    `PROMETHEUS_MULTIPROC_DIR` 에 이전 실행이 남긴 지표 파일을 지웁니다. 여러 워커로 서버를 시작하기 전에
+    실행합니다.
+
+    Args:
+        args (argparse.Namespace): 사용하지 않습니다.
+    """
+    from config.metrics import PROMETHEUS_MULTIPROC_DIR, clear_multiprocess_dir
+
+    if not PROMETHEUS_MULTIPROC_DIR:
+        print("PROMETHEUS_MULTIPROC_DIR 가 지정되지 않았습니다.")
+        return
+    clear_multiprocess_dir()
+    print(f"{PROMETHEUS_MULTIPROC_DIR} 의 지표 파일을 지웠습니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="A-Nostalgic-Space-API 관리 명령")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help="데이터베이스 마이그레이션")
+    migrate_parser.add_argument(
+        "action", choices=["upgrade", "downgrade", "current", "history", "revision"]
+    )
+    migrate_parser.add_argument("revision", nargs="?", default=None)
+    migrate_parser.add_argument("--sql", action="store_true", help="SQL 만 출력")
+    migrate_parser.add_argument("-m", "--message", default=None, help="새 리비전 설명")
+    migrate_parser.set_defaults(func=migrate)
+
+    reindex_parser = subparsers.add_parser(
+        "search-reindex", help="콘텐츠 전문 검색 색인 다시 계산"
+    )
+    reindex_parser.add_argument("--batch-size", type=int, default=500)
+    reindex_parser.set_defaults(func=search_reindex)
+
+    purge_parser = subparsers.add_parser(
+        "purge-contents", help="보관 기간이 지난 삭제된 콘텐츠 영구 삭제"
+    )
+    purge_parser.add_argument("--older-than-days", type=float, default=None)
+    purge_parser.add_argument("--batch-size", type=int, default=None)
+    purge_parser.set_defaults(func=purge_contents)
+
+    gc_parser = subparsers.add_parser("image-gc", help="참조되지 않는 이미지와 파일 정리")
+    gc_parser.add_argument("--grace-hours", type=float, default=None)
+    gc_parser.add_argument("--batch-size", type=int, default=None)
+    gc_parser.add_argument("--pause-seconds", type=float, default=None)
+    gc_parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 집계")
+    gc_parser.add_argument(
+        "--skip-file-scan", action="store_true", help="업로드 디렉토리 순회 생략"
+    )
+    gc_parser.set_defaults(func=image_gc)
+
+    metrics_parser = subparsers.add_parser(
+        "metrics-reset", help="멀티프로세스 지표 디렉토리 비우기"
+    )
+    metrics_parser.set_defaults(func=metrics_reset)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
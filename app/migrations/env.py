@@ -0,0 +1,56 @@
+"""
+Alembic 마이그레이션 실행 환경.
+
+접속 정보는 애플리케이션과 같은 `config.database_init` 설정을 사용하며, 자동 생성(autogenerate)의
+비교 대상은 `models` 의 메타데이터입니다. `CREATE INDEX CONCURRENTLY` 처럼 트랜잭션 밖에서
+실행해야 하는 작업을 위해 리비전마다 별도의 트랜잭션으로 실행합니다.
+
+작성자:
+    kimdonghyeok
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool
+
+import models  # noqa: F401  (메타데이터에 모델 등록)
+from config.database_init import SQLALCHEMY_DATABASE_URL, Base
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    """SQL 스크립트만 출력합니다 (--sql)."""
+    context.configure(
+        url=SQLALCHEMY_DATABASE_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        transaction_per_migration=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """데이터베이스에 직접 마이그레이션을 적용합니다."""
+    connectable = create_engine(SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            transaction_per_migration=True,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
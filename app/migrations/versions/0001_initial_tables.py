@@ -0,0 +1,71 @@
+"""initial tables
+
+마이그레이션 도입 이전에 만들어진 테이블 구조입니다. 이미 테이블이 있는 데이터베이스에서는
+없는 테이블만 생성합니다. 되돌리기(downgrade)는 기존 테이블을 보존하기 위해 아무것도 삭제하지 않습니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:00:00
+"""
+
+import sqlalchemy as sa
+from alembic import context, op
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if context.is_offline_mode():
+        existing = set()
+    else:
+        existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "Users" not in existing:
+        op.create_table(
+            "Users",
+            sa.Column("uid", sa.Integer, primary_key=True),
+            sa.Column("password", sa.String, nullable=False),
+            sa.Column("created_at", sa.DateTime, nullable=False),
+            sa.Column("username", sa.String, nullable=False),
+        )
+    if "Contents" not in existing:
+        op.create_table(
+            "Contents",
+            sa.Column("contents_id", sa.Integer, primary_key=True),
+            sa.Column("title", sa.String, nullable=True),
+            sa.Column("content", sa.String, nullable=True),
+            sa.Column("writer_name", sa.String),
+            sa.Column("created_at", sa.DateTime, nullable=False),
+            sa.Column("like_cnt", sa.Integer, nullable=False),
+            sa.Column("is_deleted", sa.Boolean, nullable=False),
+        )
+    if "Images" not in existing:
+        op.create_table(
+            "Images",
+            sa.Column("image_id", sa.Integer, primary_key=True),
+            sa.Column("image_address", sa.String, nullable=False),
+            sa.Column("created_at", sa.DateTime, nullable=False),
+        )
+    if "Users_Images" not in existing:
+        op.create_table(
+            "Users_Images",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("user_id", sa.Integer),
+            sa.Column("image_id", sa.Integer),
+        )
+    if "Contents_Images" not in existing:
+        op.create_table(
+            "Contents_Images",
+            sa.Column("id", sa.Integer, primary_key=True),
+            sa.Column("content_id", sa.Integer),
+            sa.Column("image_id", sa.Integer),
+        )
+
+
+def downgrade():
+    # upgrade 는 없는 테이블만 만들기 때문에, 마이그레이션 도입 전부터 있던 테이블과 구분할 수 없습니다.
+    # 기존 데이터를 지우지 않도록 테이블은 삭제하지 않습니다.
+    pass
@@ -0,0 +1,59 @@
+"""image dedup columns and variants table
+
+내용 해시 기반 중복 제거(content_hash, size, ref_count)와 파생본 테이블(Images_Variants)을 추가합니다.
+기존 이미지의 ref_count 는 현재 사용자-이미지/콘텐츠-이미지 관계 수로 채웁니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("Images", sa.Column("content_hash", sa.String(64), nullable=True))
+    op.add_column("Images", sa.Column("size", sa.Integer, nullable=True))
+    op.add_column(
+        "Images",
+        sa.Column("ref_count", sa.Integer, nullable=False, server_default="0"),
+    )
+    op.create_unique_constraint("uq_images_content_hash", "Images", ["content_hash"])
+    op.execute(
+        """
+        UPDATE "Images" AS i
+        SET ref_count = (
+            SELECT count(*) FROM "Users_Images" ui WHERE ui.image_id = i.image_id
+        ) + (
+            SELECT count(*) FROM "Contents_Images" ci WHERE ci.image_id = i.image_id
+        )
+        """
+    )
+
+    op.create_table(
+        "Images_Variants",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("image_id", sa.Integer, nullable=False),
+        sa.Column("variant", sa.String, nullable=False),
+        sa.Column("format", sa.String, nullable=False),
+        sa.Column("image_address", sa.String, nullable=False),
+        sa.Column("width", sa.Integer, nullable=False),
+        sa.Column("height", sa.Integer, nullable=False),
+        sa.UniqueConstraint(
+            "image_id", "variant", "format", name="uq_images_variants_image_variant"
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("Images_Variants")
+    op.drop_constraint("uq_images_content_hash", "Images", type_="unique")
+    op.drop_column("Images", "ref_count")
+    op.drop_column("Images", "size")
+    op.drop_column("Images", "content_hash")
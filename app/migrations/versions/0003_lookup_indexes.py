@@ -0,0 +1,55 @@
+"""indexes for hot lookups
+
+요청마다 실행되는 조회(사용자명, 작성자별 콘텐츠, 관계 테이블 조인)에 인덱스를 추가합니다.
+운영 중인 테이블의 쓰기를 막지 않도록 `CREATE INDEX CONCURRENTLY` 를 트랜잭션 밖에서 실행합니다.
+
+사용자명 고유 인덱스는 중복된 사용자명이 있으면 실패하므로, 적용 전에 중복을 정리해야 합니다.
+CONCURRENTLY 생성이 중간에 실패하면 INVALID 인덱스가 남을 수 있으니 삭제 후 다시 실행합니다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:00
+"""
+
+from alembic import op
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# (인덱스 이름, 테이블, 컬럼, unique)
+INDEXES = [
+    ("ix_users_username", "Users", ["username"], True),
+    (
+        "ix_contents_writer_created",
+        "Contents",
+        ["writer_name", "created_at", "contents_id"],
+        False,
+    ),
+    ("ix_users_images_user_id", "Users_Images", ["user_id"], False),
+    ("ix_users_images_image_id", "Users_Images", ["image_id"], False),
+    ("ix_contents_images_content_id", "Contents_Images", ["content_id"], False),
+    ("ix_contents_images_image_id", "Contents_Images", ["image_id"], False),
+]
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=unique,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
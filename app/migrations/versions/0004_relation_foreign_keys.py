@@ -0,0 +1,60 @@
+"""foreign keys on relation tables
+
+사용자-이미지, 콘텐츠-이미지, 이미지 파생본 테이블에 외래 키를 추가합니다.
+먼저 `NOT VALID` 로 추가해 기존 행 검사 없이 짧은 잠금만 잡고, 별도 트랜잭션에서
+`VALIDATE CONSTRAINT` 로 기존 행을 검사합니다 (이 단계는 쓰기를 막지 않습니다).
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:00
+"""
+
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+# (제약 이름, 테이블, 컬럼, 참조 테이블, 참조 컬럼)
+FOREIGN_KEYS = [
+    ("fk_users_images_user_id", "Users_Images", "user_id", "Users", "uid"),
+    ("fk_users_images_image_id", "Users_Images", "image_id", "Images", "image_id"),
+    (
+        "fk_contents_images_content_id",
+        "Contents_Images",
+        "content_id",
+        "Contents",
+        "contents_id",
+    ),
+    (
+        "fk_contents_images_image_id",
+        "Contents_Images",
+        "image_id",
+        "Images",
+        "image_id",
+    ),
+    (
+        "fk_images_variants_image_id",
+        "Images_Variants",
+        "image_id",
+        "Images",
+        "image_id",
+    ),
+]
+
+
+def upgrade():
+    for name, table, column, referent, referent_column in FOREIGN_KEYS:
+        op.execute(
+            f'ALTER TABLE "{table}" ADD CONSTRAINT {name} FOREIGN KEY ("{column}") '
+            f'REFERENCES "{referent}" ("{referent_column}") NOT VALID'
+        )
+    with op.get_context().autocommit_block():
+        for name, table, _, _, _ in FOREIGN_KEYS:
+            op.execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT {name}')
+
+
+def downgrade():
+    for name, table, _, _, _ in reversed(FOREIGN_KEYS):
+        op.drop_constraint(name, table, type_="foreignkey")
@@ -0,0 +1,46 @@
+"""content likes table
+
+사용자별 콘텐츠 좋아요 테이블(Contents_Likes)을 추가합니다. (content_id, user_id) 고유 제약으로
+좋아요 요청을 멱등하게 처리합니다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "Contents_Likes",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column(
+            "content_id",
+            sa.Integer,
+            sa.ForeignKey("Contents.contents_id", name="fk_contents_likes_content_id"),
+            nullable=False,
+        ),
+        sa.Column(
+            "user_id",
+            sa.Integer,
+            sa.ForeignKey("Users.uid", name="fk_contents_likes_user_id"),
+            nullable=False,
+        ),
+        sa.Column("created_at", sa.DateTime, nullable=False),
+        sa.UniqueConstraint(
+            "content_id", "user_id", name="uq_contents_likes_content_user"
+        ),
+    )
+    op.create_index("ix_contents_likes_user_id", "Contents_Likes", ["user_id"])
+
+
+def downgrade():
+    op.drop_index("ix_contents_likes_user_id", table_name="Contents_Likes")
+    op.drop_table("Contents_Likes")
@@ -0,0 +1,37 @@
+"""index for the global feed
+
+전체 최신순 피드(get_feed)의 keyset 페이지네이션에 사용하는 (created_at, contents_id) 인덱스를
+추가합니다. 0003 과 같이 `CREATE INDEX CONCURRENTLY` 를 트랜잭션 밖에서 실행합니다.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 00:00:00
+"""
+
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contents_created",
+            "Contents",
+            ["created_at", "contents_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_contents_created",
+            table_name="Contents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
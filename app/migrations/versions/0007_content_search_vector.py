@@ -0,0 +1,44 @@
+"""full-text search vector on contents
+
+콘텐츠 전문 검색용 `search_vector` (tsvector) 컬럼과 GIN 인덱스를 추가합니다. 토크나이저가
+애플리케이션에 있으므로 기존 콘텐츠의 값은 적용 후 `python manage.py search-reindex` 로 채웁니다.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 00:00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "Contents", sa.Column("search_vector", postgresql.TSVECTOR, nullable=True)
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contents_search_vector",
+            "Contents",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_contents_search_vector",
+            table_name="Contents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("Contents", "search_vector")
@@ -0,0 +1,47 @@
+"""content location columns
+
+콘텐츠 위치(latitude, longitude)와 반경/영역 검색용 PostGIS `location` (geography) 컬럼, GiST 인덱스를
+추가합니다. 모두 nullable 컬럼이라 테이블을 다시 쓰지 않으며, 인덱스는 `CREATE INDEX CONCURRENTLY` 로
+만듭니다. PostGIS 확장이 없으면 먼저 생성합니다.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 00:00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS postgis")
+    op.add_column("Contents", sa.Column("latitude", sa.Float, nullable=True))
+    op.add_column("Contents", sa.Column("longitude", sa.Float, nullable=True))
+    op.execute('ALTER TABLE "Contents" ADD COLUMN location geography(Point, 4326)')
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contents_location",
+            "Contents",
+            ["location"],
+            postgresql_using="gist",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_contents_location",
+            table_name="Contents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("Contents", "location")
+    op.drop_column("Contents", "longitude")
+    op.drop_column("Contents", "latitude")
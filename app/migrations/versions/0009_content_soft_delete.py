@@ -0,0 +1,96 @@
+"""soft delete for contents
+
+콘텐츠 삭제일(`deleted_at`) 컬럼을 추가하고, 조회용 인덱스를 삭제되지 않은 행만 담는 부분 인덱스
+(`WHERE is_deleted IS false`)로 교체합니다. 영구 삭제 대상을 찾는 `(deleted_at, contents_id)` 부분
+인덱스(`WHERE is_deleted IS true`)도 추가합니다.
+
+새 인덱스를 모두 `CREATE INDEX CONCURRENTLY` 로 만든 뒤 기존 인덱스를 `DROP INDEX CONCURRENTLY` 로
+지우므로, 교체하는 동안에도 조회가 인덱스를 사용하고 쓰기가 막히지 않습니다.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 00:00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+LIVE = sa.text("is_deleted IS false")
+
+# (기존 인덱스, 부분 인덱스, 컬럼, 인덱스 방식)
+REPLACED_INDEXES = [
+    (
+        "ix_contents_writer_created",
+        "ix_contents_live_writer_created",
+        ["writer_name", "created_at", "contents_id"],
+        None,
+    ),
+    ("ix_contents_created", "ix_contents_live_created", ["created_at", "contents_id"], None),
+    ("ix_contents_search_vector", "ix_contents_live_search_vector", ["search_vector"], "gin"),
+    ("ix_contents_location", "ix_contents_live_location", ["location"], "gist"),
+]
+
+
+def upgrade():
+    op.add_column("Contents", sa.Column("deleted_at", sa.DateTime, nullable=True))
+    # 이전에 삭제 표시된 행은 지금부터 보관 기간을 계산합니다. 애플리케이션이 저장하는 시각(시간대가 있는
+    # pendulum 값)과 같이 세션 시간대로 변환되도록 now() 를 그대로 사용합니다.
+    op.execute('UPDATE "Contents" SET deleted_at = now() WHERE is_deleted IS true')
+    with op.get_context().autocommit_block():
+        for _, name, columns, using in REPLACED_INDEXES:
+            op.create_index(
+                name,
+                "Contents",
+                columns,
+                postgresql_using=using,
+                postgresql_where=LIVE,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.create_index(
+            "ix_contents_deleted_at",
+            "Contents",
+            ["deleted_at", "contents_id"],
+            postgresql_where=sa.text("is_deleted IS true"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for old_name, _, _, _ in REPLACED_INDEXES:
+            op.drop_index(
+                old_name,
+                table_name="Contents",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for old_name, _, columns, using in REPLACED_INDEXES:
+            op.create_index(
+                old_name,
+                "Contents",
+                columns,
+                postgresql_using=using,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for _, name, _, _ in REPLACED_INDEXES:
+            op.drop_index(
+                name,
+                table_name="Contents",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+        op.drop_index(
+            "ix_contents_deleted_at",
+            table_name="Contents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("Contents", "deleted_at")
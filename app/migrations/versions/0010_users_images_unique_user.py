@@ -0,0 +1,72 @@
+"""unique user per Users_Images row
+
+`User.user_image` 는 사용자당 하나의 이미지 관계를 가정하므로 `Users_Images.user_id` 에 유니크 인덱스를
+추가하고 기존 `ix_users_images_user_id` 인덱스를 대체합니다.
+
+유니크 인덱스를 만들기 전에 사용자마다 가장 최근(`id` 가 가장 큰) 관계만 남기고 나머지는 삭제하며, 삭제한
+관계가 가리키던 이미지의 참조 수를 감소시킵니다. 더 이상 참조되지 않는 이미지는 이미지 GC 가 정리합니다.
+인덱스는 `CREATE INDEX CONCURRENTLY` 로 만들어 쓰기를 막지 않습니다.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17 00:00:00
+"""
+
+from alembic import op
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        """
+        WITH removed AS (
+            DELETE FROM "Users_Images" AS stale
+            USING "Users_Images" AS newer
+            WHERE stale.user_id = newer.user_id AND stale.id < newer.id
+            RETURNING stale.image_id
+        )
+        UPDATE "Images"
+        SET ref_count = GREATEST("Images".ref_count - released.count, 0)
+        FROM (
+            SELECT image_id, count(*) AS count FROM removed GROUP BY image_id
+        ) AS released
+        WHERE "Images".image_id = released.image_id
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "uq_users_images_user_id",
+            "Users_Images",
+            ["user_id"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_users_images_user_id",
+            table_name="Users_Images",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade():
+    # 삭제한 중복 관계는 복구하지 않고 인덱스만 되돌립니다.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_images_user_id",
+            "Users_Images",
+            ["user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "uq_users_images_user_id",
+            table_name="Users_Images",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,25 @@
+"""last used time for images
+
+중복 제거로 재사용된 이미지 행이 생성 시각 기준으로 이미지 GC 에 삭제되지 않도록 마지막 사용 시각
+(`last_used_at`) 컬럼을 추가합니다. 기존 행은 비워 두며, 이미지 GC 는 값이 없으면 `created_at` 을 사용합니다.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17 00:00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("Images", sa.Column("last_used_at", sa.DateTime, nullable=True))
+
+
+def downgrade():
+    op.drop_column("Images", "last_used_at")
@@ -0,0 +1,42 @@
+"""geometry index for bbox search
+
+영역 검색은 geography 사각형(변이 대원 호) 대신 경도/위도 평면의 geometry 사각형으로 후보를 찾으므로,
+삭제되지 않은 콘텐츠의 `location::geometry` 에 GiST 식 인덱스를 추가합니다. 반경 검색은 기존
+`ix_contents_live_location` (geography) 인덱스를 계속 사용합니다. 인덱스는 `CREATE INDEX CONCURRENTLY`
+로 만들어 쓰기를 막지 않습니다.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17 00:00:00
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "0012"
+down_revision = "0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_contents_live_location_geometry",
+            "Contents",
+            [sa.text("(location::geometry)")],
+            postgresql_using="gist",
+            postgresql_where=sa.text("is_deleted IS false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_contents_live_location_geometry",
+            table_name="Contents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -1,15 +1,49 @@
 """
 데이터베이스 모델 정의 모듈.
 
-이 모듈은 데이터베이스에 저장될 사용자, 이미지, 사용자-이미지 관계, 콘텐츠-이미지 관계와 관련된 모델을 정의합니다.
+이 모듈은 데이터베이스에 저장될 사용자, 이미지, 사용자-이미지 관계, 콘텐츠-이미지 관계, 콘텐츠 좋아요와 관련된 모델을 정의합니다.
 
 작성자:
     kimdonghyeok
 """
 
-from sqlalchemy import Boolean, Column, DateTime, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.types import UserDefinedType
+
 from config.database_init import Base
 
+
+class Geography(UserDefinedType):
+    """PostGIS `geography(Point, 4326)` 컬럼 타입."""
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw):
+        return "geography(Point, 4326)"
+
+
+class Geometry(UserDefinedType):
+    """PostGIS `geometry` 타입. 경도/위도 평면에서 비교할 때 geography 를 변환하는 데 사용합니다."""
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw):
+        return "geometry"
+
+
 class User(Base):
     """
     사용자 모델.
@@ -21,14 +55,18 @@ class User(Base):
         password (str): 사용자 비밀번호.
         created_at (datetime): 사용자 계정 생성일.
         username (str): 사용자 이름.
+        user_image (UserImage): 사용자 이미지 관계 (읽기 전용).
     """
     __tablename__ = "Users"
+    __table_args__ = (Index("ix_users_username", "username", unique=True),)
 
     uid = Column(Integer, primary_key=True)
     password = Column(String, nullable=False)
     created_at = Column(DateTime, nullable=False)
     username = Column(String, nullable=False)
 
+    user_image = relationship("UserImage", uselist=False, viewonly=True)
+
 
 class Content(Base):
     """
@@ -44,8 +82,62 @@ class Content(Base):
         created_at (datetime): 콘텐츠 생성일.
         like_cnt (int): 콘텐츠 좋아요 수.
         is_deleted (bool): 콘텐츠 삭제 여부.
+        deleted_at (datetime): 콘텐츠 삭제일. 삭제되지 않은 콘텐츠는 None.
+        search_vector (str): 제목/본문 전문 검색용 tsvector. 일반 조회에서는 불러오지 않습니다.
+        latitude (float): 위도. 위치가 없는 콘텐츠는 None.
+        longitude (float): 경도. 위치가 없는 콘텐츠는 None.
+        location (Geography): 위도/경도로 만든 PostGIS 지점. 일반 조회에서는 불러오지 않습니다.
+        writer (User): 작성자 (읽기 전용, writer_name 으로 연결).
+        images (List[Image]): 첨부 이미지 (읽기 전용, 첨부 순서).
     """
     __tablename__ = "Contents"
+    # 조회 인덱스는 삭제되지 않은 행만 담는 부분 인덱스입니다. 조회 조건(`is_deleted.is_(False)`)과
+    # 같은 식이어야 플래너가 부분 인덱스를 사용하므로 `IS false` 로 선언합니다.
+    __table_args__ = (
+        # 작성자별 최신순 keyset 페이지네이션 (get_user_content)
+        Index(
+            "ix_contents_live_writer_created",
+            "writer_name",
+            "created_at",
+            "contents_id",
+            postgresql_where=text("is_deleted IS false"),
+        ),
+        # 전체 최신순 피드 keyset 페이지네이션 (get_feed)
+        Index(
+            "ix_contents_live_created",
+            "created_at",
+            "contents_id",
+            postgresql_where=text("is_deleted IS false"),
+        ),
+        # 전문 검색 (search_contents)
+        Index(
+            "ix_contents_live_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=text("is_deleted IS false"),
+        ),
+        # 반경 검색 (get_nearby_contents)
+        Index(
+            "ix_contents_live_location",
+            "location",
+            postgresql_using="gist",
+            postgresql_where=text("is_deleted IS false"),
+        ),
+        # 영역 검색 (get_contents_in_bbox). 위도/경도 사각형은 평면(geometry)에서 비교합니다.
+        Index(
+            "ix_contents_live_location_geometry",
+            text("(location::geometry)"),
+            postgresql_using="gist",
+            postgresql_where=text("is_deleted IS false"),
+        ),
+        # 삭제된 콘텐츠 영구 삭제 대상 조회 (purge_deleted_contents)
+        Index(
+            "ix_contents_deleted_at",
+            "deleted_at",
+            "contents_id",
+            postgresql_where=text("is_deleted IS true"),
+        ),
+    )
 
     contents_id = Column(Integer, primary_key=True)
     title = Column(String, nullable=True)
@@ -54,6 +146,24 @@ class Content(Base):
     created_at = Column(DateTime, nullable=False)
     like_cnt = Column(Integer, nullable=False)
     is_deleted = Column(Boolean, nullable=False)
+    deleted_at = Column(DateTime, nullable=True)
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    location = deferred(Column(Geography, nullable=True))
+
+    # 관계 행은 일괄 INSERT 와 참조 수 갱신으로 관리하므로 조회 전용입니다.
+    writer = relationship(
+        "User",
+        primaryjoin="foreign(Content.writer_name) == User.username",
+        viewonly=True,
+    )
+    images = relationship(
+        "Image",
+        secondary="Contents_Images",
+        order_by="ContentImage.id",
+        viewonly=True,
+    )
 
 
 class Image(Base):
@@ -66,12 +176,56 @@ class Image(Base):
         image_id (int): 이미지 고유 식별자.
         image_address (str): 이미지 파일 경로 또는 URL.
         created_at (datetime): 이미지 생성일.
+        last_used_at (datetime): 마지막으로 생성되거나 중복 제거로 재사용된 시각. 이미지 GC 의 유예 기간 기준입니다.
+        content_hash (str): 이미지 내용의 SHA-256 해시. 같은 내용의 업로드는 같은 행을 재사용합니다.
+        size (int): 이미지 파일 크기(바이트).
+        ref_count (int): 이 이미지를 참조하는 사용자-이미지/콘텐츠-이미지 관계 수.
     """
     __tablename__ = "Images"
+    __table_args__ = (UniqueConstraint("content_hash", name="uq_images_content_hash"),)
 
     image_id = Column(Integer, primary_key=True)
     image_address = Column(String, nullable=False)
     created_at = Column(DateTime, nullable=False)
+    last_used_at = Column(DateTime, nullable=True)
+    content_hash = Column(String(64), nullable=True)
+    size = Column(Integer, nullable=True)
+    ref_count = Column(Integer, nullable=False, default=0)
+
+
+class ImageVariant(Base):
+    """
+    이미지 파생본 모델.
+
+    원본 이미지로부터 생성된 크기/포맷별 파생본(썸네일 등)을 나타냅니다.
+
+    Attributes:
+        id (int): 고유 식별자.
+        image_id (int): 원본 이미지 ID.
+        variant (str): 파생본 이름 (예: avatar, thumb, medium).
+        format (str): 이미지 포맷 (예: webp, jpeg).
+        image_address (str): 파생본 파일 경로.
+        width (int): 파생본 너비(px).
+        height (int): 파생본 높이(px).
+    """
+    __tablename__ = "Images_Variants"
+    __table_args__ = (
+        UniqueConstraint(
+            "image_id", "variant", "format", name="uq_images_variants_image_variant"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True)
+    image_id = Column(
+        Integer,
+        ForeignKey("Images.image_id", name="fk_images_variants_image_id"),
+        nullable=False,
+    )
+    variant = Column(String, nullable=False)
+    format = Column(String, nullable=False)
+    image_address = Column(String, nullable=False)
+    width = Column(Integer, nullable=False)
+    height = Column(Integer, nullable=False)
 
 
 class UserImage(Base):
@@ -84,11 +238,27 @@ class UserImage(Base):
         id (int): 고유 식별자.
         user_id (int): 사용자 ID.
         image_id (int): 이미지 ID.
+        image (Image): 연결된 이미지 (읽기 전용).
     """
     __tablename__ = "Users_Images"
+    __table_args__ = (
+        # 사용자당 이미지 관계는 하나입니다 (User.user_image 는 uselist=False).
+        Index("uq_users_images_user_id", "user_id", unique=True),
+        Index("ix_users_images_image_id", "image_id"),
+    )
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer, primary_key=False)
-    image_id = Column(Integer, primary_key=False)
+    user_id = Column(
+        Integer,
+        ForeignKey("Users.uid", name="fk_users_images_user_id"),
+        primary_key=False,
+    )
+    image_id = Column(
+        Integer,
+        ForeignKey("Images.image_id", name="fk_users_images_image_id"),
+        primary_key=False,
+    )
+
+    image = relationship("Image", viewonly=True)
 
 
 class ContentImage(Base):
@@ -101,8 +271,57 @@ class ContentImage(Base):
         id (int): 고유 식별자.
         content_id (int): 콘텐츠 ID.
         image_id (int): 이미지 ID.
+        image (Image): 연결된 이미지 (읽기 전용).
     """
     __tablename__ = "Contents_Images"
+    __table_args__ = (
+        Index("ix_contents_images_content_id", "content_id"),
+        Index("ix_contents_images_image_id", "image_id"),
+    )
+    id = Column(Integer, primary_key=True)
+    content_id = Column(
+        Integer,
+        ForeignKey("Contents.contents_id", name="fk_contents_images_content_id"),
+        primary_key=False,
+    )
+    image_id = Column(
+        Integer,
+        ForeignKey("Images.image_id", name="fk_contents_images_image_id"),
+        primary_key=False,
+    )
+
+    image = relationship("Image", viewonly=True)
+
+
+class ContentLike(Base):
+    """
+    콘텐츠 좋아요 모델.
+
+    사용자가 콘텐츠에 누른 좋아요를 나타냅니다. (content_id, user_id) 고유 제약으로
+    같은 사용자의 중복 좋아요를 막습니다.
+
+    Attributes:
+        id (int): 고유 식별자.
+        content_id (int): 콘텐츠 ID.
+        user_id (int): 사용자 ID.
+        created_at (datetime): 좋아요를 누른 시각.
+    """
+    __tablename__ = "Contents_Likes"
+    __table_args__ = (
+        UniqueConstraint(
+            "content_id", "user_id", name="uq_contents_likes_content_user"
+        ),
+        Index("ix_contents_likes_user_id", "user_id"),
+    )
     id = Column(Integer, primary_key=True)
-    content_id = Column(Integer, primary_key=False)
-    image_id = Column(Integer, primary_key=False)
+    content_id = Column(
+        Integer,
+        ForeignKey("Contents.contents_id", name="fk_contents_likes_content_id"),
+        nullable=False,
+    )
+    user_id = Column(
+        Integer,
+        ForeignKey("Users.uid", name="fk_contents_likes_user_id"),
+        nullable=False,
+    )
+    created_at = Column(DateTime, nullable=False)
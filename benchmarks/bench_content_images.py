@@ -0,0 +1,83 @@
+"""
+GET /api/contentimage 조회 벤치마크.
+
+콘텐츠 ID 개수를 늘려가며 기존 방식(콘텐츠별 조회, N+1)과 일괄 조회(`get_content_images`)의
+SQL 실행 횟수와 소요 시간을 비교합니다. 인메모리 SQLite 를 사용합니다.
+
+실행:
+    python benchmarks/bench_content_images.py
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from api.image import image_crud  # noqa: E402
+from models import ContentImage, Image  # noqa: E402
+
+IMAGES_PER_CONTENT = 3
+
+
+def legacy_get_content_image(db, content_id):
+    image_address = []
+    for result in db.query(ContentImage).filter(ContentImage.content_id == content_id):
+        image_address.append(
+            db.query(Image).filter(Image.image_id == result.image_id).first().image_address
+        )
+    return image_address
+
+
+def setup(n_contents):
+    engine = create_engine("sqlite://")
+    tables = [Image.__table__, ContentImage.__table__]
+    Image.metadata.create_all(engine, tables=tables)
+    db = sessionmaker(bind=engine)()
+    for content_id in range(1, n_contents + 1):
+        for i in range(IMAGES_PER_CONTENT):
+            image = Image(
+                image_address=f"/uploads/{content_id}_{i}.jpg",
+                created_at=datetime.now(),
+            )
+            db.add(image)
+            db.flush()
+            db.add(ContentImage(content_id=content_id, image_id=image.image_id))
+    db.commit()
+
+    counter = {"queries": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count(*args):
+        counter["queries"] += 1
+
+    return db, counter
+
+
+def measure(db, counter, func):
+    counter["queries"] = 0
+    started = time.perf_counter()
+    func()
+    return counter["queries"], (time.perf_counter() - started) * 1000
+
+
+def main():
+    print(f"{'ids':>5} | {'legacy queries':>14} {'ms':>8} | {'batched queries':>15} {'ms':>8}")
+    for n in (1, 5, 20, 50, 100):
+        db, counter = setup(n)
+        ids = list(range(1, n + 1))
+        legacy_q, legacy_ms = measure(
+            db, counter, lambda: [legacy_get_content_image(db, i) for i in ids]
+        )
+        batched_q, batched_ms = measure(
+            db, counter, lambda: image_crud.get_content_images(db, ids)
+        )
+        print(f"{n:>5} | {legacy_q:>14} {legacy_ms:>8.2f} | {batched_q:>15} {batched_ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+미들웨어 스택에 따른 GET /ping 처리량 벤치마크.
+
+미들웨어가 없는 앱, 기존 `BaseHTTPMiddleware` 기반 문서 인증 미들웨어, ASGI 미들웨어로 바꾼
+`ApidocBasicAuthMiddleware` 를 각각 CORS 미들웨어와 함께 올린 앱에 /ping 요청을 직접 ASGI 로
+보내 초당 요청 수를 비교합니다. 마지막 경우는 여기에 Prometheus `MetricsMiddleware` 를 더해 요청당
+지표 수집 비용을 확인합니다. 네트워크와 서버 오버헤드는 포함하지 않습니다.
+
+실행:
+    python benchmarks/bench_middleware.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.responses import Response  # noqa: E402
+
+from config.docs_security import ApidocBasicAuthMiddleware  # noqa: E402
+from config.metrics import MetricsMiddleware  # noqa: E402
+
+REQUESTS = 20000
+
+
+class LegacyApidocBasicAuthMiddleware(BaseHTTPMiddleware):
+    # 변경 전 구현과 같은 구조 (문서 경로가 아닌 요청도 call_next 를 거칩니다).
+    async def dispatch(self, request, call_next):
+        if request.url.path in ["/docs", "/openapi.json", "/redoc"]:
+            return Response(content="Unauthorized", status_code=401)
+        return await call_next(request)
+
+
+def build_app(auth_middleware=None, with_metrics=False):
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return JSONResponse(content={"message": "pong"})
+
+    if auth_middleware is not None:
+        app.add_middleware(auth_middleware)
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["http://localhost:3000"],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def run(app):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(100):
+        await app(dict(scope), receive, send)
+
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        await app(dict(scope), receive, send)
+    return REQUESTS / (time.perf_counter() - started)
+
+
+async def main():
+    cases = [
+        ("no middleware", build_app()),
+        ("BaseHTTPMiddleware + CORS", build_app(LegacyApidocBasicAuthMiddleware)),
+        ("ASGI middleware + CORS", build_app(ApidocBasicAuthMiddleware)),
+        (
+            "ASGI + CORS + metrics",
+            build_app(ApidocBasicAuthMiddleware, with_metrics=True),
+        ),
+    ]
+    print(f"{'stack':>28} {'req/s':>10} {'us/req':>8}")
+    for name, app in cases:
+        rate = await run(app)
+        print(f"{name:>28} {rate:>10.0f} {1e6 / rate:>8.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+"""
+로그인 비밀번호 검증 처리량 벤치마크.
+
+동시에 들어온 로그인 요청 N 개의 bcrypt 검증을 기존 방식(공용 스레드 풀)과 워커 수를 바꿔 가며
+`PasswordPool` 로 처리했을 때의 초당 검증 수를 비교합니다. 대기열이 가득 차 거절된 요청 수도
+함께 출력합니다.
+
+실행:
+    python benchmarks/bench_password_pool.py
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+from api.user.password_pool import (  # noqa: E402
+    PasswordPool,
+    PasswordPoolFull,
+    pwd_context,
+)
+
+CONCURRENT_LOGINS = 64
+WORKER_COUNTS = [1, 2, 4, os.cpu_count() or 1]
+PASSWORD = "correct horse battery staple"
+
+
+async def run_threadpool(hashed):
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+    await asyncio.gather(
+        *[
+            loop.run_in_executor(None, pwd_context.verify, PASSWORD, hashed)
+            for _ in range(CONCURRENT_LOGINS)
+        ]
+    )
+    return time.perf_counter() - start, 0
+
+
+async def run_pool(pool, hashed):
+    # 워커 기동 비용은 측정에서 제외합니다.
+    await asyncio.gather(*[pool.verify(PASSWORD, hashed) for _ in range(pool.workers)])
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *[pool.verify(PASSWORD, hashed) for _ in range(CONCURRENT_LOGINS)],
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+    rejected = sum(isinstance(r, PasswordPoolFull) for r in results)
+    return elapsed, rejected
+
+
+async def main():
+    hashed = pwd_context.hash(PASSWORD)
+    print(f"{'backend':>16} {'verify/s':>10} {'rejected':>9}")
+
+    elapsed, rejected = await run_threadpool(hashed)
+    print(f"{'threadpool':>16} {CONCURRENT_LOGINS / elapsed:>10.1f} {rejected:>9}")
+
+    for workers in sorted(set(WORKER_COUNTS)):
+        pool = PasswordPool(workers, queue_depth=CONCURRENT_LOGINS)
+        try:
+            elapsed, rejected = await run_pool(pool, hashed)
+        finally:
+            pool.shutdown()
+        served = CONCURRENT_LOGINS - rejected
+        print(f"{f'pool x{workers}':>16} {served / elapsed:>10.1f} {rejected:>9}")
+
+    # 대기열 한도를 넘는 요청은 기다리지 않고 거절됩니다.
+    pool = PasswordPool(2, queue_depth=8)
+    try:
+        elapsed, rejected = await run_pool(pool, hashed)
+    finally:
+        pool.shutdown()
+    print(f"{'pool x2 depth 8':>16} {(CONCURRENT_LOGINS - rejected) / elapsed:>10.1f} {rejected:>9}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""
+큰 JSON 응답의 직렬화 비용 벤치마크.
+
+GET /api/contentimage 형태의 응답(콘텐츠 ID -> 이미지 주소 목록)과 콘텐츠 ID 목록을 크기별로 만들어,
+기존 경로(`jsonable_encoder` + `JSONResponse`)와 `FastJSONResponse`(orjson)의 직렬화 시간을 비교하고
+gzip 압축 후 크기를 함께 출력합니다.
+
+실행:
+    python benchmarks/bench_serialization.py
+"""
+
+import gzip
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from config.compression import GZIP_COMPRESS_LEVEL  # noqa: E402
+from config.fast_json import FastJSONResponse  # noqa: E402
+
+REPEAT = 20
+
+
+def content_images_payload(n):
+    return {
+        "status_code": 200,
+        "detail": "이미지 정보를 조회했습니다.",
+        "data": {
+            content_id: [
+                f"/uploads/{content_id % 256:02x}/{content_id:064x}_{i}.webp"
+                for i in range(3)
+            ]
+            for content_id in range(1, n + 1)
+        },
+    }
+
+
+def content_ids_payload(n):
+    return {
+        "status_code": 200,
+        "detail": "정상적으로 조회되었습니다.",
+        "data": {"content_ids": list(range(n)), "next_cursor": "eyJ2IjpbXX0"},
+    }
+
+
+def measure(func):
+    started = time.perf_counter()
+    for _ in range(REPEAT):
+        body = func()
+    return (time.perf_counter() - started) * 1000 / REPEAT, body
+
+
+def main():
+    print(
+        f"{'payload':>22} | {'default ms':>10} | {'orjson ms':>9} | "
+        f"{'bytes':>9} {'gzip bytes':>10}"
+    )
+    for name, build in (
+        ("content images", content_images_payload),
+        ("content ids", content_ids_payload),
+    ):
+        for n in (100, 1000, 10000):
+            payload = build(n)
+            default_ms, body = measure(
+                lambda: JSONResponse(content=jsonable_encoder(payload)).body
+            )
+            fast_ms, _ = measure(lambda: FastJSONResponse(content=payload).body)
+            compressed = gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL)
+            print(
+                f"{f'{name} x{n}':>22} | {default_ms:>10.2f} | {fast_ms:>9.2f} | "
+                f"{len(body):>9} {len(compressed):>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()